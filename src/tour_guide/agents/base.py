@@ -1,11 +1,90 @@
 """Base agent class for all agents in the system."""
 
 from abc import ABC, abstractmethod
-from typing import Any
-import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Pattern
+import json
+import re
+from time import perf_counter
 from pathlib import Path
 from tour_guide.logging import get_logger
-from tour_guide.config import get_settings
+from tour_guide.config import Settings, get_settings
+
+try:
+    import orjson
+except ImportError:  # optional "fast" extra; falls back to the stdlib parser
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _agent_log_pattern(agent_name: str) -> Pattern[str]:
+    """Compiled matcher for one agent's logger name (agents.<name>, not agents.<name>_x)."""
+    return re.compile(rf"agents\.{re.escape(agent_name)}\b")
+
+
+def _filter_lines(lines: Iterable[str], agent_name: str) -> str:
+    """
+    Keep only log lines written by the given agent's logger.
+
+    Args:
+        lines: Raw log lines (with or without trailing newlines)
+        agent_name: Agent name as used in its logger, e.g. "youtube"
+
+    Returns:
+        Matching lines joined unchanged, or "" if none match
+    """
+    # The plain substring test rejects most lines before the word-boundary regex runs
+    needle = f"agents.{agent_name}"
+    search = _agent_log_pattern(agent_name).search
+    return "".join(line for line in lines if needle in line and search(line))
+
+
+def extract_json_block(response: str) -> str:
+    """
+    Pull the JSON payload out of a Claude reply that may wrap it in a code fence.
+
+    A ```json fence is preferred over a bare ``` fence; an unfenced reply is
+    returned stripped. Each marker is located with a single str.find scan.
+
+    Args:
+        response: Raw response from Claude
+
+    Returns:
+        JSON text to hand to load_json
+
+    Raises:
+        ValueError: If an opening fence has no closing fence
+    """
+    text = response.strip()
+    start = text.find("```json")
+    if start != -1:
+        start += 7
+    else:
+        start = text.find("```")
+        if start == -1:
+            return text
+        start += 3
+    end = text.index("```", start)
+    return text[start:end].strip()
+
+
+def load_json(text: str) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed.
+
+    Args:
+        text: JSON document, e.g. from extract_json_block
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 class AgentError(Exception):
@@ -23,16 +102,17 @@ class AgentTimeoutError(AgentError):
 class BaseAgent(ABC):
     """Abstract base class for all agents."""
 
-    def __init__(self, agent_name: str):
+    def __init__(self, agent_name: str, *, settings: Optional[Settings] = None):
         """
         Initialize base agent.
 
         Args:
             agent_name: Name of the agent (used for logging)
+            settings: Settings to use instead of the global get_settings()
         """
         self.agent_name = agent_name
         self.logger = get_logger(f"agents.{agent_name}")
-        self.settings = get_settings()
+        self.settings = settings if settings is not None else get_settings()
 
     @abstractmethod
     def run(self, input_data: Any) -> Any:
@@ -69,11 +149,11 @@ class BaseAgent(ABC):
             timeout_seconds = 60  # Default timeout
 
         self.logger.info(f"Starting {self.agent_name} with timeout={timeout_seconds}s")
-        start_time = time.time()
+        start_time = perf_counter()
 
         try:
             result = self.run(input_data)
-            execution_time = time.time() - start_time
+            execution_time = perf_counter() - start_time
 
             self.logger.info(
                 f"{self.agent_name} completed successfully in {execution_time:.2f}s"
@@ -81,7 +161,7 @@ class BaseAgent(ABC):
             return result
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = perf_counter() - start_time
             self.logger.error(
                 f"{self.agent_name} failed after {execution_time:.2f}s: {e}"
             )
@@ -128,15 +208,14 @@ class BaseAgent(ABC):
             parser = LogParser()
             all_entries = parser.parse_recent(log_dir, hours=24)
 
-            # Filter to this agent's logs
+            # Filter to this agent's logs; nothing to analyze for an idle agent
             agent_entries = parser.filter_by_agent(all_entries, self.agent_name)
+            if not agent_entries:
+                return f"No recent log entries found for {self.agent_name} agent."
 
             # Limit to last N entries
             agent_entries = agent_entries[-last_lines:] if len(agent_entries) > last_lines else agent_entries
 
-            if not agent_entries:
-                return f"No recent log entries found for {self.agent_name} agent."
-
             # Analyze logs
             analyzer = DiagnosticAnalyzer()
             report = analyzer.analyze(agent_entries)
@@ -205,48 +284,43 @@ class BaseAgent(ABC):
 
         return "\n".join(lines)
 
-    def _read_recent_logs(self, lines: int = 50) -> str:
+    def _read_recent_logs(self, lines: int = 50, log_path: Optional[Path] = None) -> str:
         """
         Read recent log entries for this agent.
 
         Args:
             lines: Number of recent lines to read
+            log_path: Log file to read (defaults to the tour_guide file handler's file)
 
         Returns:
             Recent log content as string
         """
         try:
-            # Get log file from root logger's file handler
-            import logging
-            from logging.handlers import RotatingFileHandler
-
-            root_logger = logging.getLogger("tour_guide")
-            log_file = None
-
-            for handler in root_logger.handlers:
-                if isinstance(handler, RotatingFileHandler):
-                    log_file = Path(handler.baseFilename)
-                    break
+            log_file = log_path
+            if log_file is None:
+                # Get log file from root logger's file handler
+                import logging
+                from logging.handlers import RotatingFileHandler
+
+                root_logger = logging.getLogger("tour_guide")
+                for handler in root_logger.handlers:
+                    if isinstance(handler, RotatingFileHandler):
+                        log_file = Path(handler.baseFilename)
+                        break
 
             if log_file is None or not log_file.exists():
                 return "No log file found"
 
-            # Read last N lines from log file
+            # Read last N lines from log file without holding the whole file
             with open(log_file, "r") as f:
-                all_lines = f.readlines()
-                recent_lines = all_lines[-lines:]
-
-                # Filter for this agent's logs
-                agent_logs = [
-                    line
-                    for line in recent_lines
-                    if f"agents.{self.agent_name}" in line
-                ]
+                recent_lines = deque(f, maxlen=lines)
 
-                if not agent_logs:
-                    return f"No recent logs found for {self.agent_name}"
+            # Filter for this agent's logs
+            agent_logs = _filter_lines(recent_lines, self.agent_name)
+            if not agent_logs:
+                return f"No recent logs found for {self.agent_name}"
 
-                return "".join(agent_logs)
+            return agent_logs
 
         except Exception as e:
             self.logger.warning(f"Failed to read logs: {e}")
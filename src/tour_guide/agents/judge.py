@@ -1,10 +1,9 @@
 """Judge agent for evaluating and selecting best content."""
 
-import json
 import logging
 from typing import List
 
-from tour_guide.agents.base import BaseAgent, AgentError
+from tour_guide.agents.base import BaseAgent, AgentError, extract_json_block, load_json
 from tour_guide.models.content import ContentResult
 from tour_guide.models.judgment import JudgmentResult
 from tour_guide.skills.judge_skill import format_judge_prompt
@@ -130,19 +129,10 @@ class JudgeAgent(BaseAgent):
             json.JSONDecodeError: If response is not valid JSON
         """
         # Extract JSON from response (handle code block wrapping)
-        json_str = response.strip()
-
-        if "```json" in json_str:
-            start = json_str.index("```json") + 7
-            end = json_str.index("```", start)
-            json_str = json_str[start:end].strip()
-        elif "```" in json_str:
-            start = json_str.index("```") + 3
-            end = json_str.index("```", start)
-            json_str = json_str[start:end].strip()
+        json_str = extract_json_block(response)
 
         # Parse JSON
-        data = json.loads(json_str)
+        data = load_json(json_str)
         return data
 
     def _fallback_selection(self, poi_name: str, content_list: List[ContentResult]) -> JudgmentResult:
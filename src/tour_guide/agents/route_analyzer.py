@@ -1,13 +1,19 @@
 """Route analyzer agent for identifying points of interest along a route."""
 
 import json
+from bisect import bisect_right
 from typing import List
-from tour_guide.agents.base import BaseAgent, AgentError
+from tour_guide.agents.base import BaseAgent, AgentError, extract_json_block, load_json
 from tour_guide.routing.models import Route
 from tour_guide.models import POI
 from tour_guide.utils.claude_cli import call_claude, ClaudeError
 from tour_guide.skills.route_analyzer_skill import format_route_analyzer_prompt
 
+# Routes shorter than each bound (km) get at most the matching POI cap;
+# longer routes use the configured poi.count
+_POI_COUNT_BOUNDS_KM = (20.0, 50.0)
+_POI_COUNT_CAPS = (3, 5, float("inf"))
+
 
 class RouteAnalyzerAgent(BaseAgent):
     """Agent that analyzes routes and identifies interesting points of interest."""
@@ -41,8 +47,8 @@ class RouteAnalyzerAgent(BaseAgent):
             f"{route.total_distance_km:.1f} km"
         )
 
-        # Sample waypoints for long routes to reduce payload size
-        sampled_waypoints = route.get_sampled_waypoints(max_points=30)
+        # Simplify long routes to reduce payload size, keeping turns over straight stretches
+        sampled_waypoints = route.simplify(max_points=30)
         if len(sampled_waypoints) < len(route.waypoints):
             self.logger.info(
                 f"Using {len(sampled_waypoints)} sampled waypoints "
@@ -104,12 +110,8 @@ class RouteAnalyzerAgent(BaseAgent):
         Returns:
             Number of POIs to request
         """
-        if distance_km < 20:
-            return min(3, self.poi_count)
-        elif distance_km < 50:
-            return min(5, self.poi_count)
-        else:
-            return self.poi_count
+        cap = _POI_COUNT_CAPS[bisect_right(_POI_COUNT_BOUNDS_KM, distance_km)]
+        return min(cap, self.poi_count)
 
     def _format_waypoints(self, waypoints) -> str:
         """
@@ -164,19 +166,10 @@ class RouteAnalyzerAgent(BaseAgent):
         """
         try:
             # Extract JSON from response (Claude might wrap in ```json ... ```)
-            json_str = response.strip()
-
-            if "```json" in json_str:
-                start = json_str.index("```json") + 7
-                end = json_str.index("```", start)
-                json_str = json_str[start:end].strip()
-            elif "```" in json_str:
-                start = json_str.index("```") + 3
-                end = json_str.index("```", start)
-                json_str = json_str[start:end].strip()
+            json_str = extract_json_block(response)
 
             # Parse JSON
-            data = json.loads(json_str)
+            data = load_json(json_str)
 
             if "pois" not in data:
                 raise AgentError("Response missing 'pois' field")
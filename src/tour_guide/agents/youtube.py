@@ -1,7 +1,7 @@
 """YouTube agent for finding relevant videos for POIs."""
 
 import json
-from tour_guide.agents.base import BaseAgent, AgentError
+from tour_guide.agents.base import BaseAgent, AgentError, extract_json_block, load_json
 from tour_guide.models import POI, ContentResult
 from tour_guide.utils.claude_cli import call_claude, ClaudeError
 from tour_guide.skills.youtube_skill import format_youtube_prompt
@@ -78,19 +78,10 @@ class YouTubeAgent(BaseAgent):
         """
         try:
             # Extract JSON from response
-            json_str = response.strip()
-
-            if "```json" in json_str:
-                start = json_str.index("```json") + 7
-                end = json_str.index("```", start)
-                json_str = json_str[start:end].strip()
-            elif "```" in json_str:
-                start = json_str.index("```") + 3
-                end = json_str.index("```", start)
-                json_str = json_str[start:end].strip()
+            json_str = extract_json_block(response)
 
             # Parse JSON
-            data = json.loads(json_str)
+            data = load_json(json_str)
 
             if "video" not in data:
                 raise AgentError("Response missing 'video' field")
@@ -20,6 +20,8 @@ class RoutingConfig:
     osrm_url: str = "http://router.project-osrm.org"
     fallback_to_claude: bool = True
     timeout_seconds: int = 10
+    max_retries: int = 2  # retries on connection errors and 502/503/504
+    cache_dir: str = "~/.cache/tour_guide/osrm"  # "" disables the on-disk route cache
 
 
 @dataclass
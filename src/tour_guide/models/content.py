@@ -5,7 +5,7 @@ from typing import Dict, Any, Optional
 from urllib.parse import quote_plus
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentResult:
     """
     Result from a content agent.
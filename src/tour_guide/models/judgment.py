@@ -5,7 +5,7 @@ from typing import Dict, List
 from tour_guide.models.content import ContentResult
 
 
-@dataclass
+@dataclass(slots=True)
 class JudgmentResult:
     """
     Result from Judge agent evaluation.
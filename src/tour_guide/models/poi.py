@@ -14,7 +14,11 @@ class POICategory(Enum):
     ENTERTAINMENT = "entertainment"
 
 
-@dataclass
+# Plain dict lookup; skips EnumType.__call__ when POIs are built from strings
+_CATEGORY_BY_VALUE = {category.value: category for category in POICategory}
+
+
+@dataclass(slots=True)
 class POI:
     """
     Point of Interest along a route.
@@ -55,13 +59,46 @@ class POI:
         # Convert category string to enum if needed
         if isinstance(self.category, str):
             try:
-                self.category = POICategory(self.category.lower())
-            except ValueError:
-                valid_categories = [c.value for c in POICategory]
+                self.category = _CATEGORY_BY_VALUE[self.category.lower()]
+            except KeyError:
+                valid_categories = list(_CATEGORY_BY_VALUE)
                 raise ValueError(
                     f"Invalid category: {self.category}. Must be one of {valid_categories}"
                 )
 
+    def to_worker_dict(self) -> dict:
+        """
+        Get the minimal payload content agents need, as plain primitives.
+
+        Sent to process-backend workers instead of the full POI so less data
+        is pickled per task.
+
+        Returns:
+            Dict with name, lat, lon, description and category value
+        """
+        return {
+            "name": self.name,
+            "lat": self.lat,
+            "lon": self.lon,
+            "description": self.description,
+            "category": self.category.value,
+        }
+
+    @classmethod
+    def from_worker_dict(cls, data: dict) -> "POI":
+        """
+        Rebuild a POI from a to_worker_dict() payload.
+
+        Route distance is not part of the payload and is set to 0.
+
+        Args:
+            data: Dict produced by to_worker_dict()
+
+        Returns:
+            POI object usable by the content agents
+        """
+        return cls(distance_from_start_km=0.0, **data)
+
     @property
     def coordinates(self) -> tuple[float, float]:
         """Get coordinates as (lat, lon) tuple."""
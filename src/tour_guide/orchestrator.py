@@ -1,7 +1,7 @@
 """Main orchestrator for Tour Guide system."""
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Dict, Optional
 
 from tour_guide.routing.osrm import OSRMClient
@@ -16,7 +16,7 @@ from tour_guide.utils.geocoding import geocode_location
 logger = get_logger("orchestrator")
 
 
-@dataclass
+@dataclass(repr=False)
 class JourneyResult:
     """Complete journey result with all data."""
 
@@ -26,6 +26,24 @@ class JourneyResult:
     execution_time: float
     stats: Dict[str, any]
 
+    def compact(self) -> None:
+        """
+        Drop the route waypoints, keeping the route totals.
+
+        Intended for callers that hold many journeys in memory (batch runs):
+        call it after every output that needs the polyline has been written.
+        Anything that reads route.waypoints afterwards sees an empty list.
+        """
+        self.route = replace(self.route, waypoints=[])
+
+    def __repr__(self) -> str:
+        """Summarize the journey without formatting every waypoint."""
+        return (
+            f"JourneyResult(route={self.route.total_distance_km:.1f} km "
+            f"[{len(self.route.waypoints)} waypoints], pois={len(self.pois)}, "
+            f"judgments={len(self.judgments)}, execution_time={self.execution_time:.2f}s)"
+        )
+
 
 class TourGuideOrchestrator:
     """
@@ -223,6 +241,9 @@ class TourGuideOrchestrator:
         Returns:
             List of JudgmentResult objects
         """
+        if not pois:
+            return []
+
         try:
             judgments = self.content_pipeline.run(pois)
             return judgments
@@ -3,7 +3,7 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from tour_guide.routing.models import Route
 from tour_guide.models.poi import POI
 from tour_guide.models.judgment import JudgmentResult
@@ -32,6 +32,7 @@ class JSONExporter:
         pois: List[POI],
         judgments: List[JudgmentResult],
         execution_time: float = None,
+        stats: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Convert journey data to dictionary structure.
@@ -41,6 +42,8 @@ class JSONExporter:
             pois: List of POI objects
             judgments: List of JudgmentResult objects
             execution_time: Optional execution time in seconds
+            stats: Optional journey stats (from JourneyResult.stats); its
+                content_distribution is reused instead of being recounted
 
         Returns:
             Dictionary with structured journey data
@@ -97,11 +100,13 @@ class JSONExporter:
             }
             pois_data.append(poi_data)
 
-        # Create summary
-        content_distribution = {}
-        for judgment in judgments:
-            content_type = judgment.selected_type
-            content_distribution[content_type] = content_distribution.get(content_type, 0) + 1
+        # Create summary (reuse the orchestrator's distribution when available)
+        content_distribution = (stats or {}).get("content_distribution")
+        if content_distribution is None:
+            content_distribution = {}
+            for judgment in judgments:
+                content_type = judgment.selected_type
+                content_distribution[content_type] = content_distribution.get(content_type, 0) + 1
 
         summary = {
             "total_pois": len(pois),
@@ -146,6 +151,7 @@ class JSONExporter:
         judgments: List[JudgmentResult],
         output_path: Path,
         execution_time: float = None,
+        stats: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Convenience method to convert and export journey data in one step.
@@ -156,8 +162,9 @@ class JSONExporter:
             judgments: List of JudgmentResult objects
             output_path: Path where JSON file will be written
             execution_time: Optional execution time in seconds
+            stats: Optional journey stats to reuse (see to_dict)
         """
-        journey_data = self.to_dict(route, pois, judgments, execution_time)
+        journey_data = self.to_dict(route, pois, judgments, execution_time, stats)
         self.export(journey_data, output_path)
 
     def validate_structure(self, journey_data: Dict[str, Any]) -> bool:
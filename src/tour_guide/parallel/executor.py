@@ -1,41 +1,313 @@
-"""Parallel executor for content agents using multiprocessing."""
+"""Parallel executor for content agents using a thread or process pool."""
 
 import logging
+import multiprocessing as mp
+import os
+import pickle
+import sys
+import threading
 import time
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import List, Dict, Iterator, Optional, Tuple
 from tour_guide.models.poi import POI
 from tour_guide.models.content import ContentResult
-from tour_guide.parallel.worker import content_worker
+from tour_guide.parallel.worker import (
+    batch_content_worker,
+    content_worker,
+    shared_content_worker,
+    _init_agents,
+)
 from tour_guide.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Content agents run for every POI, in result order
+AGENT_TYPES = ("youtube", "spotify", "history")
 
-class ParallelExecutor:
+# Supported pool backends
+BACKENDS = ("thread", "process")
+
+
+def _mp_context():
+    """
+    Pick the multiprocessing start method for the process backend.
+
+    Fork is far cheaper on Linux thanks to copy-on-write; other platforms
+    (notably macOS, where fork is unsafe with system frameworks) use spawn.
+    Fork copies only the calling thread, so a lock held by any other thread
+    (judge threads in ContentPipeline.run, RoutePlanner.plan_routes workers,
+    abandoned run_with_timeout threads, queue feeder threads) would be copied
+    into the workers already locked. Fork is therefore only used while the
+    caller is the sole thread; otherwise workers come from a forkserver.
+
+    Returns:
+        multiprocessing context for ProcessPoolExecutor
+    """
+    if not sys.platform.startswith("linux"):
+        return mp.get_context("spawn")
+    return mp.get_context("fork" if threading.active_count() == 1 else "forkserver")
+
+
+@lru_cache(maxsize=None)
+def _timeout_template(agent_type: str, timeout: int) -> ContentResult:
+    """Build (once per agent and timeout) the timeout result shared by every POI."""
+    return ContentResult(
+        content_type=agent_type,
+        title=f"Error: {agent_type} agent timeout",
+        description=f"Agent exceeded timeout of {timeout}s",
+        relevance_score=0,
+        agent_name=agent_type,
+        metadata={"error": "timeout"},
+    )
+
+
+def _timeout_result(agent_type: str, poi_name: str, timeout: int) -> ContentResult:
     """
-    Executes content agents in parallel using multiprocessing.Pool.
+    Build the error result reported for an agent that exceeded its timeout.
+
+    Stamped from a cached template, so a cascade of timeouts skips re-formatting
+    titles and search URLs. Metadata gets a fresh dict so results never share it.
+    """
+    return replace(
+        _timeout_template(agent_type, timeout), poi_name=poi_name, metadata={"error": "timeout"}
+    )
+
+
+def _failure_result(
+    agent_type: str, poi_name: str, error: Exception, message: Optional[str] = None
+) -> ContentResult:
+    """Build the error result reported when parallel execution itself fails."""
+    message = str(error) if message is None else message
+    return ContentResult(
+        content_type=agent_type,
+        title=f"Error: {agent_type} agent failed",
+        description=f"Parallel execution failed: {message}",
+        relevance_score=0,
+        agent_name=agent_type,
+        poi_name=poi_name,
+        metadata={"error": message, "error_type": type(error).__name__},
+    )
+
+
+def _failure_results(poi_name: str, error: Exception) -> List[ContentResult]:
+    """Build failure results for every agent of a POI, formatting the error once."""
+    message = str(error)
+    return [_failure_result(agent_type, poi_name, error, message) for agent_type in AGENT_TYPES]
+
+
+def _future_result(future, agent_type: str, poi_name: str) -> ContentResult:
+    """Get a finished future's result, turning a worker-side exception into a failure result."""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # Not a task failure: the whole pool is gone and the caller must replace it
+        raise
+    except Exception as e:
+        return _failure_result(agent_type, poi_name, e)
+
 
-    Spawns 3 workers (YouTube, Spotify, History) to process POIs concurrently,
-    with timeout handling and graceful failure recovery.
+class ParallelExecutor:
+    """
+    Executes content agents in parallel on a shared worker pool.
+
+    The content agents spend their time waiting on the Claude CLI, so the
+    default backend is a thread pool; backend="process" runs them in worker
+    processes instead (forked on Linux, spawned elsewhere). One pool is kept
+    alive across POIs, with timeout handling and graceful failure recovery.
+    The pool is created on first use and released by close() (or by using the
+    executor as a context manager). A process pool broken by a crashed worker
+    is discarded and rebuilt on the next call, so one crash only fails the
+    POIs that were in flight.
     """
 
-    def __init__(self, timeout: int = None):
+    def __init__(self, timeout: int = None, max_workers: int = None, backend: str = "thread"):
         """
         Initialize parallel executor.
 
         Args:
             timeout: Timeout in seconds for each agent (uses config if not provided)
+            max_workers: Worker pool size (default: CPU count, at least 3)
+            backend: "thread" (default) or "process"
+
+        Raises:
+            ValueError: If backend is not supported
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}. Must be one of {list(BACKENDS)}")
+
         self.settings = get_settings()
         self.timeout = timeout or self.settings.agents.content_timeout
-        logger.info(f"ParallelExecutor initialized with timeout={self.timeout}s")
+        self.max_workers = max_workers or max(len(AGENT_TYPES), os.cpu_count() or 1)
+        self.backend = backend
+        self._pool = None
+        logger.info(
+            "ParallelExecutor initialized with timeout=%ss, backend=%s", self.timeout, self.backend
+        )
+
+    def _get_pool(self):
+        """
+        Get the shared worker pool, creating it on first use.
+
+        Returns:
+            concurrent.futures executor for the configured backend
+        """
+        if self._pool is None:
+            if self.backend == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="content-agent"
+                )
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=_mp_context(),
+                    initializer=_init_agents,
+                )
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool without waiting for it.
+
+        Queued tasks are cancelled. Tasks already running (such as agents
+        abandoned after a timeout) finish in the background instead of blocking
+        the caller.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> "ParallelExecutor":
+        """Use the executor as a context manager that owns the pool."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the pool when leaving the context."""
+        self.close()
+
+    def _publish_pois(self, pois: List[POI]) -> List[shared_memory.SharedMemory]:
+        """
+        Write each POI's worker payload into its own shared memory block.
+
+        Process workers then receive only the block name, so a POI is pickled
+        once instead of once per agent task.
+
+        Args:
+            pois: POIs to publish
+
+        Returns:
+            Shared memory blocks, one per POI; release with _release_pois()
+        """
+        blocks = []
+        try:
+            for poi in pois:
+                data = pickle.dumps(poi.to_worker_dict())
+                block = shared_memory.SharedMemory(create=True, size=len(data))
+                block.buf[: len(data)] = data
+                blocks.append(block)
+        except Exception:
+            self._release_pois(blocks)
+            raise
+        return blocks
+
+    @staticmethod
+    def _release_pois(blocks: List[shared_memory.SharedMemory]) -> None:
+        """Close and unlink shared memory blocks created by _publish_pois()."""
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    def _submit(self, pool, agent_type: str, poi: POI, shared: Optional[Dict[int, str]]):
+        """Submit one agent task with the cheapest POI payload for the backend."""
+        if shared is not None:
+            return pool.submit(shared_content_worker, agent_type, shared[id(poi)])
+        if self.backend == "process":
+            # Process workers only get the fields agents read, to keep pickling cheap
+            return pool.submit(content_worker, agent_type, poi.to_worker_dict())
+        return pool.submit(content_worker, agent_type, poi)
+
+    def _run_tasks(self, tasks: list, timeout: float) -> List[ContentResult]:
+        """
+        Run (agent_type, poi) tasks on the pool and collect results in task order.
+
+        Each result is awaited with whatever remains of the shared time budget.
+        Tasks that miss the deadline are abandoned and reported as timeout
+        results; the pool itself is never torn down, so workers (and the agents
+        they initialized) survive for the next POI. The exception is a broken
+        process pool, which is closed so the next call starts a fresh one.
+
+        On the process backend, when there are more tasks than workers, tasks
+        are split into one contiguous chunk per worker and each chunk is sent as
+        a single batch_content_worker call, amortizing the IPC round trip.
+
+        Args:
+            tasks: List of (agent_type, poi) tuples
+            timeout: Overall timeout in seconds for the whole task list
+
+        Returns:
+            List of ContentResult objects, one per task
+
+        Raises:
+            BrokenProcessPool: If a process worker died; the pool is discarded first
+        """
+        try:
+            return self._collect_tasks(tasks, timeout)
+        except BrokenProcessPool:
+            self.close()
+            raise
+
+    def _collect_tasks(self, tasks: list, timeout: float) -> List[ContentResult]:
+        """Submit tasks and await their results; see _run_tasks()."""
+        pool = self._get_pool()
+        chunk_size = -(-len(tasks) // self.max_workers)
+        chunked = self.backend == "process" and chunk_size > 1
+
+        if chunked:
+            groups = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+            futures = [
+                pool.submit(
+                    batch_content_worker,
+                    [(agent_type, poi.to_worker_dict()) for agent_type, poi in group],
+                )
+                for group in groups
+            ]
+        else:
+            groups = [[task] for task in tasks]
+            futures = [self._submit(pool, agent_type, poi, None) for agent_type, poi in tasks]
+        start = time.monotonic()
+
+        results = []
+        timed_out = 0
+        for future, group in zip(futures, groups):
+            remaining = max(0, timeout - (time.monotonic() - start))
+            try:
+                outcome = future.result(timeout=remaining)
+                results.extend(outcome if chunked else [outcome])
+            except FuturesTimeoutError:
+                # Drop it if still queued; a running task finishes in the background
+                future.cancel()
+                timed_out += len(group)
+                results.extend(
+                    _timeout_result(agent_type, poi.name, self.timeout) for agent_type, poi in group
+                )
+
+        if timed_out:
+            logger.warning(
+                "Timeout after %ss: %d/%d agent tasks unfinished", timeout, timed_out, len(tasks)
+            )
+
+        return results
 
     def process_poi(self, poi: POI) -> List[ContentResult]:
         """
         Process a single POI with all three content agents in parallel.
 
-        Spawns 3 worker processes (YouTube, Spotify, History) and collects results
-        with timeout handling.
+        Dispatches the 3 agent tasks (YouTube, Spotify, History) to the shared
+        worker pool and collects results with timeout handling.
 
         Args:
             poi: POI to process
@@ -43,126 +315,174 @@ class ParallelExecutor:
         Returns:
             List of ContentResult objects (may be less than 3 if some agents fail)
         """
-        logger.info(f"Processing POI in parallel: {poi.name}")
-        start_time = time.time()
+        logger.info("Processing POI in parallel: %s", poi.name)
+        start_time = time.monotonic()
 
         # Define tasks for the three content agents
-        tasks = [
-            ("youtube", poi),
-            ("spotify", poi),
-            ("history", poi),
-        ]
-
-        results = []
+        tasks = [(agent_type, poi) for agent_type in AGENT_TYPES]
 
         try:
-            # Use spawn context for clean process isolation
-            # This is important for macOS and ensures each process starts fresh
-            import multiprocessing as mp
-
-            ctx = mp.get_context("spawn")
-
-            with ctx.Pool(processes=3) as pool:
-                # Use starmap_async for non-blocking execution with timeout
-                async_result = pool.starmap_async(content_worker, tasks)
-
-                try:
-                    # Wait for results with timeout
-                    results = async_result.get(timeout=self.timeout)
-                    logger.info(
-                        f"All 3 agents completed for {poi.name} in {time.time() - start_time:.2f}s"
-                    )
-
-                except mp.TimeoutError:
-                    # Timeout occurred, terminate workers and collect partial results
-                    logger.warning(
-                        f"Timeout after {self.timeout}s for {poi.name}, terminating workers"
-                    )
-                    pool.terminate()
-                    pool.join()
-
-                    # Return error results for all agents on timeout
-                    for agent_type, _ in tasks:
-                        results.append(
-                            ContentResult(
-                                content_type=agent_type,
-                                title=f"Error: {agent_type} agent timeout",
-                                description=f"Agent exceeded timeout of {self.timeout}s",
-                                relevance_score=0,
-                                agent_name=agent_type,
-                                poi_name=poi.name,
-                                metadata={"error": "timeout"},
-                            )
-                        )
+            results = self._run_tasks(tasks, self.timeout)
+            logger.info(
+                "All 3 agents completed for %s in %.2fs", poi.name, time.monotonic() - start_time
+            )
 
         except Exception as e:
-            logger.error(f"Failed to process POI {poi.name}: {e}")
+            logger.error("Failed to process POI %s: %s", poi.name, e)
             # Return error results for all agents on exception
-            for agent_type, _ in tasks:
-                results.append(
-                    ContentResult(
-                        content_type=agent_type,
-                        title=f"Error: {agent_type} agent failed",
-                        description=f"Parallel execution failed: {str(e)}",
-                        relevance_score=0,
-                        agent_name=agent_type,
-                        poi_name=poi.name,
-                        metadata={"error": str(e), "error_type": type(e).__name__},
-                    )
-                )
+            results = _failure_results(poi.name, e)
 
-        execution_time = time.time() - start_time
-        logger.info(f"POI {poi.name} processed in {execution_time:.2f}s with {len(results)} results")
+        logger.info(
+            "POI %s processed in %.2fs with %d results",
+            poi.name,
+            time.monotonic() - start_time,
+            len(results),
+        )
 
         return results
 
-    def process_all_pois(self, pois: List[POI]) -> Dict[str, List[ContentResult]]:
+    def iter_poi_results(self, pois: List[POI]) -> Iterator[Tuple[POI, List[ContentResult]]]:
         """
-        Process all POIs sequentially, but process each POI's agents in parallel.
+        Run every (POI, agent) pair on the pool and yield each POI once it is complete.
+
+        All 3N agent tasks go out together so the workers stay busy. POIs are
+        yielded in completion order, so callers can start judging a POI while
+        agents for later POIs are still running. Tasks still unfinished when
+        the batch budget expires become timeout results.
 
         Args:
             pois: List of POIs to process
 
-        Returns:
-            Dictionary mapping poi_name -> list of ContentResult objects
+        Yields:
+            (poi, results) tuples with one ContentResult per agent, in AGENT_TYPES order
         """
-        logger.info(f"Processing {len(pois)} POIs with parallel agents")
-        start_time = time.time()
+        group_size = len(AGENT_TYPES)
+        tasks = [(agent_type, poi) for poi in pois for agent_type in AGENT_TYPES]
+        # Budget matches the worst case of processing the POIs one at a time
+        batch_timeout = self.timeout * max(len(pois), 1)
 
-        results_by_poi = {}
+        # Per-POI result slots and the number of agents each is still waiting on
+        slots = [[None] * group_size for _ in pois]
+        pending = [group_size] * len(pois)
 
-        for i, poi in enumerate(pois, 1):
-            logger.info(f"Processing POI {i}/{len(pois)}: {poi.name}")
-            results = self.process_poi(poi)
-            results_by_poi[poi.name] = results
+        blocks = []
+        try:
+            # Process workers read each POI from shared memory instead of a per-task pickle
+            shared = None
+            if self.backend == "process":
+                blocks = self._publish_pois(pois)
+                shared = {id(poi): block.name for poi, block in zip(pois, blocks)}
+
+            pool = self._get_pool()
+            futures = {
+                self._submit(pool, agent_type, poi, shared): index
+                for index, (agent_type, poi) in enumerate(tasks)
+            }
+
+            try:
+                for future in as_completed(futures, timeout=batch_timeout):
+                    # Forget finished futures right away so their results are not
+                    # pinned until the whole batch is done
+                    index = futures.pop(future)
+                    poi_index, agent_index = divmod(index, group_size)
+                    agent_type, poi = tasks[index]
+                    slots[poi_index][agent_index] = _future_result(future, agent_type, poi.name)
+
+                    pending[poi_index] -= 1
+                    if pending[poi_index] == 0:
+                        completed, slots[poi_index] = slots[poi_index], None
+                        yield poi, completed
+
+            except FuturesTimeoutError:
+                unfinished = sum(1 for future in futures if not future.done())
+                logger.warning(
+                    "Timeout after %ss: %d/%d agent tasks unfinished",
+                    batch_timeout,
+                    unfinished,
+                    len(tasks),
+                )
+                for future, index in futures.items():
+                    poi_index, agent_index = divmod(index, group_size)
+                    agent_type, poi = tasks[index]
+                    if future.done():
+                        # Finished after as_completed() gave up waiting; keep the real result
+                        slots[poi_index][agent_index] = _future_result(
+                            future, agent_type, poi.name
+                        )
+                    else:
+                        # Drop it if still queued; a running task finishes in the background
+                        future.cancel()
+                        slots[poi_index][agent_index] = _timeout_result(
+                            agent_type, poi.name, self.timeout
+                        )
+                futures.clear()
 
-            # Log progress
-            successful_results = sum(1 for r in results if r.relevance_score > 0)
-            logger.info(
-                f"POI {i}/{len(pois)} complete: {successful_results}/3 agents succeeded"
-            )
+                for poi_index, poi in enumerate(pois):
+                    if pending[poi_index] > 0:
+                        pending[poi_index] = 0
+                        completed, slots[poi_index] = slots[poi_index], None
+                        yield poi, completed
 
-        execution_time = time.time() - start_time
-        total_pois = len(pois)
-        total_results = sum(len(results) for results in results_by_poi.values())
-        successful_results = sum(
-            sum(1 for r in results if r.relevance_score > 0)
-            for results in results_by_poi.values()
-        )
+        except Exception as e:
+            logger.error("Failed to process %d POIs: %s", len(pois), e)
+            if isinstance(e, BrokenProcessPool):
+                # Every pending future of a broken pool fails; rebuild it on the next call
+                self.close()
+            for poi_index, poi in enumerate(pois):
+                if pending[poi_index] > 0:
+                    pending[poi_index] = 0
+                    yield poi, _failure_results(poi.name, e)
+
+        finally:
+            self._release_pois(blocks)
 
-        logger.info(
-            f"Processed {total_pois} POIs in {execution_time:.2f}s: "
-            f"{total_results} total results, {successful_results} successful"
-        )
+    def process_all_pois(self, pois: List[POI]) -> Dict[str, List[ContentResult]]:
+        """
+        Process all POIs with every (POI, agent) pair submitted to the pool at once.
+
+        All 3N agent tasks go out together so the workers stay busy and a slow
+        agent on one POI never holds back the next POI.
+
+        Args:
+            pois: List of POIs to process
+
+        Returns:
+            Dictionary mapping poi_name -> list of ContentResult objects, in POI order
+        """
+        logger.info("Processing %d POIs with parallel agents", len(pois))
+        start_time = time.monotonic()
+
+        completed = {poi.name: results for poi, results in self.iter_poi_results(pois)}
+        results_by_poi = {poi.name: completed[poi.name] for poi in pois}
+
+        # Summary counts walk every result, so only compute them when INFO is on
+        if logger.isEnabledFor(logging.INFO):
+            execution_time = time.monotonic() - start_time
+            total_results = successful_results = 0
+            for results in results_by_poi.values():
+                total_results += len(results)
+                for result in results:
+                    # bool adds as 0/1
+                    successful_results += result.relevance_score > 0
+            logger.info(
+                "Processed %d POIs in %.2fs: %d total results, %d successful",
+                len(pois),
+                execution_time,
+                total_results,
+                successful_results,
+            )
 
         return results_by_poi
 
-    def process_all_pois_batched(self, pois: List[POI], batch_size: int = 3) -> Dict[str, List[ContentResult]]:
+    def process_all_pois_batched(
+        self, pois: List[POI], batch_size: int = 3
+    ) -> Dict[str, List[ContentResult]]:
         """
         Process POIs in batches with full parallelization.
 
-        This is an advanced method that processes multiple POIs simultaneously,
-        with each POI's agents also running in parallel.
+        Each batch submits all of its POIs' agent tasks to the shared pool
+        together, so the POIs in a batch (and their agents) run simultaneously.
+        Batches run one after another on the same pool.
 
         Args:
             pois: List of POIs to process
@@ -171,8 +491,8 @@ class ParallelExecutor:
         Returns:
             Dictionary mapping poi_name -> list of ContentResult objects
         """
-        logger.info(f"Processing {len(pois)} POIs in batches of {batch_size}")
-        start_time = time.time()
+        logger.info("Processing %d POIs in batches of %d", len(pois), batch_size)
+        start_time = time.monotonic()
 
         results_by_poi = {}
 
@@ -181,14 +501,20 @@ class ParallelExecutor:
             batch_end = min(batch_start + batch_size, len(pois))
             batch = pois[batch_start:batch_end]
 
-            logger.info(f"Processing batch {batch_start + 1}-{batch_end} of {len(pois)} POIs")
+            logger.info("Processing batch %d-%d of %d POIs", batch_start + 1, batch_end, len(pois))
+
+            # Submit every (POI, agent) pair in the batch to the shared pool at once
+            tasks = [(agent_type, poi) for poi in batch for agent_type in AGENT_TYPES]
+            try:
+                flat_results = self._run_tasks(tasks, self.timeout * len(batch))
+            except Exception as e:
+                logger.error("Failed to process batch %d-%d: %s", batch_start + 1, batch_end, e)
+                flat_results = [r for poi in batch for r in _failure_results(poi.name, e)]
 
-            # Process this batch
-            for poi in batch:
-                results = self.process_poi(poi)
-                results_by_poi[poi.name] = results
+            group_size = len(AGENT_TYPES)
+            for i, poi in enumerate(batch):
+                results_by_poi[poi.name] = flat_results[i * group_size : (i + 1) * group_size]
 
-        execution_time = time.time() - start_time
-        logger.info(f"Batched processing completed in {execution_time:.2f}s")
+        logger.info("Batched processing completed in %.2fs", time.monotonic() - start_time)
 
         return results_by_poi
@@ -1,8 +1,11 @@
 """Content pipeline orchestrating queue-based parallel processing."""
 
 import logging
-from typing import List, Dict
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from tour_guide.models.poi import POI
+from tour_guide.models.content import ContentResult
 from tour_guide.models.judgment import JudgmentResult
 from tour_guide.queue.manager import QueueManager
 from tour_guide.parallel.executor import ParallelExecutor
@@ -10,6 +13,10 @@ from tour_guide.agents.judge import JudgeAgent
 
 logger = logging.getLogger(__name__)
 
+# Judge calls that may run concurrently while content agents are still working.
+# Each one mostly waits on the Claude CLI, so threads overlap them freely.
+JUDGE_WORKERS = 8
+
 
 class ContentPipeline:
     """
@@ -17,12 +24,16 @@ class ContentPipeline:
 
     Pipeline steps:
     1. Receive POIs from RouteAnalyzer
-    2. Put POIs in poi_queue
+    2. Hand POIs to ParallelExecutor (run_with_queue_only() reads them from poi_queue)
     3. ParallelExecutor processes POIs (3 content agents in parallel per POI)
     4. Results go to results_queue
-    5. JudgeAgent evaluates each POI's results
+    5. JudgeAgent evaluates each POI's results as soon as its agents finish
     6. Judgments go to judgment_queue
     7. Return final list of JudgmentResults
+
+    Nothing in the pipeline reads results_queue or judgment_queue back; they
+    are published for external consumers. Batches that do not fit because no
+    consumer is draining the queues are dropped rather than blocking the run.
     """
 
     def __init__(
@@ -35,11 +46,14 @@ class ContentPipeline:
         Initialize content pipeline.
 
         Args:
-            queue_manager: Queue manager for inter-agent communication (creates new if None)
+            queue_manager: Queue manager for inter-agent communication (creates an
+                in-process one if None; pass a backend="mp" manager when another
+                process feeds the queues)
             parallel_executor: Parallel executor for content agents (creates new if None)
             judge_agent: Judge agent for evaluating content (creates new if None)
         """
-        self.queue_manager = queue_manager or QueueManager()
+        # Producer and consumer share this process, so skip multiprocessing queues
+        self.queue_manager = queue_manager or QueueManager(backend="thread")
         self.parallel_executor = parallel_executor or ParallelExecutor()
         self.judge_agent = judge_agent or JudgeAgent()
 
@@ -50,10 +64,10 @@ class ContentPipeline:
         Run the full content pipeline for a list of POIs.
 
         This is the main orchestration method that:
-        1. Enqueues POIs
+        1. Takes POIs directly (poi_queue is not used on this path)
         2. Processes them with parallel content agents
-        3. Evaluates results with Judge agent
-        4. Returns final judgments
+        3. Evaluates each POI's results with Judge agent as soon as they are ready
+        4. Returns final judgments in POI order
 
         Args:
             pois: List of POI objects to process
@@ -61,63 +75,93 @@ class ContentPipeline:
         Returns:
             List of JudgmentResult objects, one per POI
         """
-        logger.info(f"Starting pipeline for {len(pois)} POIs")
+        logger.info("Starting pipeline for %d POIs", len(pois))
 
         if not pois:
             logger.warning("No POIs provided to pipeline")
             return []
 
-        # Step 1: Put POIs in queue
-        logger.info("Step 1: Enqueuing POIs")
-        for poi in pois:
-            self.queue_manager.put_poi(poi)
-        logger.info(f"Enqueued {len(pois)} POIs")
-
-        # Step 2 & 3: Process POIs with parallel executor
-        logger.info("Step 2-3: Processing POIs with parallel content agents")
-        results_by_poi = self.parallel_executor.process_all_pois(pois)
+        # Step 1: POIs go straight to the executor; poi_queue only feeds run_with_queue_only()
+        logger.info("Step 1: Received %d POIs", len(pois))
 
-        # Step 4: Put results in results queue
-        logger.info("Step 4: Enqueuing content results")
+        # Steps 2-5: Stream POIs out of the parallel executor as their agents finish,
+        # judging each one while agents for later POIs are still running
+        logger.info("Step 2-5: Processing POIs with parallel content agents and judging")
         total_results = 0
-        for poi_name, results in results_by_poi.items():
-            for result in results:
-                self.queue_manager.put_result(result)
-                total_results += 1
-        logger.info(f"Enqueued {total_results} content results")
-
-        # Step 5: Judge agent evaluates each POI's results
-        logger.info("Step 5: Judging content for each POI")
-        judgments = []
-        for poi_name, results in results_by_poi.items():
-            try:
-                judgment = self.judge_agent.run(results)
-                judgments.append(judgment)
-                logger.info(f"Judged {poi_name}: selected {judgment.selected_type}")
-            except Exception as e:
-                logger.error(f"Failed to judge {poi_name}: {e}")
-                # Create fallback judgment with first result
-                if results:
-                    fallback_judgment = JudgmentResult(
-                        poi_name=poi_name,
-                        selected_content=results[0],
-                        selected_type=results[0].content_type,
-                        reasoning=f"Judge agent failed, using fallback: {str(e)}",
-                        scores={r.content_type: r.relevance_score for r in results},
-                        all_content=results,
-                    )
-                    judgments.append(fallback_judgment)
+        judge_futures = {}
+        with ThreadPoolExecutor(
+            max_workers=min(len(pois), JUDGE_WORKERS), thread_name_prefix="judge"
+        ) as judge_pool:
+            for poi, results in self.parallel_executor.iter_poi_results(pois):
+                # Step 4: Put results in results queue, one batch per POI
+                self._enqueue_nowait(self.queue_manager.put_results_batch, results, "results")
+                total_results += len(results)
+
+                # Step 5: Judge agent evaluates this POI's results
+                judge_futures[poi.name] = judge_pool.submit(self._judge_poi, poi.name, results)
+
+            logger.info("Enqueued %d content results", total_results)
+
+            # Keep judgments in POI order regardless of completion order
+            judgments = []
+            for poi_name in dict.fromkeys(poi.name for poi in pois):
+                judgment = judge_futures[poi_name].result()
+                if judgment is not None:
+                    judgments.append(judgment)
 
         # Step 6: Put judgments in judgment queue
         logger.info("Step 6: Enqueuing judgments")
-        for judgment in judgments:
-            self.queue_manager.put_judgment(judgment)
-        logger.info(f"Enqueued {len(judgments)} judgments")
+        self._enqueue_nowait(self.queue_manager.put_judgments_batch, judgments, "judgment")
+        logger.info("Enqueued %d judgments", len(judgments))
 
         # Step 7: Return judgments
-        logger.info(f"Pipeline complete: {len(judgments)} judgments generated")
+        logger.info("Pipeline complete: %d judgments generated", len(judgments))
         return judgments
 
+    @staticmethod
+    def _enqueue_nowait(put, item, queue_name: str) -> None:
+        """
+        Offer an item to an output queue without waiting for a consumer.
+
+        Args:
+            put: QueueManager put method, e.g. put_results_batch or put_judgment
+            item: Batch or single judgment to enqueue
+            queue_name: Queue name for the log message when the item is dropped
+        """
+        try:
+            put(item, block=False)
+        except queue.Full:
+            logger.warning("%s queue full, dropping unconsumed output", queue_name)
+
+    def _judge_poi(self, poi_name: str, results: List[ContentResult]) -> Optional[JudgmentResult]:
+        """
+        Judge one POI's content, falling back to its first result if the judge fails.
+
+        Args:
+            poi_name: Name of the POI being judged
+            results: ContentResults from the content agents for this POI
+
+        Returns:
+            JudgmentResult, or None if the judge failed and there is no content
+        """
+        try:
+            judgment = self.judge_agent.run(results)
+            logger.info("Judged %s: selected %s", poi_name, judgment.selected_type)
+            return judgment
+        except Exception as e:
+            logger.error("Failed to judge %s: %s", poi_name, e)
+            # Create fallback judgment with first result
+            if not results:
+                return None
+            return JudgmentResult(
+                poi_name=poi_name,
+                selected_content=results[0],
+                selected_type=results[0].content_type,
+                reasoning=f"Judge agent failed, using fallback: {str(e)}",
+                scores={r.content_type: r.relevance_score for r in results},
+                all_content=results,
+            )
+
     def run_with_queue_only(self, poi_count: int) -> List[JudgmentResult]:
         """
         Run pipeline using only queues for communication (no direct method calls).
@@ -133,7 +177,7 @@ class ContentPipeline:
         Returns:
             List of JudgmentResult objects
         """
-        logger.info(f"Starting queue-only pipeline for {poi_count} POIs")
+        logger.info("Starting queue-only pipeline for %d POIs", poi_count)
 
         judgments = []
 
@@ -142,31 +186,30 @@ class ContentPipeline:
             try:
                 # Get POI from queue
                 poi = self.queue_manager.get_poi(timeout=5)
-                logger.info(f"Processing POI {i + 1}/{poi_count}: {poi.name}")
+                logger.info("Processing POI %d/%d: %s", i + 1, poi_count, poi.name)
 
                 # Process with parallel executor
                 results = self.parallel_executor.process_poi(poi)
 
                 # Put results in queue
-                for result in results:
-                    self.queue_manager.put_result(result)
+                self._enqueue_nowait(self.queue_manager.put_results_batch, results, "results")
 
                 # Judge the results
                 judgment = self.judge_agent.run(results)
 
                 # Put judgment in queue
-                self.queue_manager.put_judgment(judgment)
+                self._enqueue_nowait(self.queue_manager.put_judgment, judgment, "judgment")
 
                 # Also collect for return value
                 judgments.append(judgment)
 
-                logger.info(f"POI {i + 1}/{poi_count} complete: {judgment.selected_type}")
+                logger.info("POI %d/%d complete: %s", i + 1, poi_count, judgment.selected_type)
 
             except Exception as e:
-                logger.error(f"Failed to process POI {i + 1}: {e}")
+                logger.error("Failed to process POI %d: %s", i + 1, e)
                 break
 
-        logger.info(f"Queue-only pipeline complete: {len(judgments)} judgments")
+        logger.info("Queue-only pipeline complete: %d judgments", len(judgments))
         return judgments
 
     def get_stats(self) -> Dict[str, any]:
@@ -174,7 +217,9 @@ class ContentPipeline:
         Get pipeline statistics.
 
         Returns:
-            Dictionary with queue stats and other metrics
+            Dictionary with queue stats and other metrics. Queue sizes count
+            queued batches, not items: results_queue holds one batch per POI
+            and judgment_queue one batch per run().
         """
         stats = {
             "queue_stats": self.queue_manager.get_stats(),
@@ -182,6 +227,10 @@ class ContentPipeline:
         }
         return stats
 
+    def close(self) -> None:
+        """Release the parallel executor's worker pool."""
+        self.parallel_executor.close()
+
     def clear(self) -> None:
         """Clear all queues in the pipeline."""
         logger.info("Clearing pipeline queues")
@@ -4,6 +4,10 @@ IMPORTANT: Worker functions must be at module level (not nested) for multiproces
 """
 
 import logging
+import pickle
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Union
 from tour_guide.models.poi import POI
 from tour_guide.models.content import ContentResult
 from tour_guide.agents.youtube import YouTubeAgent
@@ -13,17 +17,39 @@ from tour_guide.agents.history import HistoryAgent
 # Suppress agent logging in worker processes to avoid log contention
 logging.getLogger("tour_guide.agents").setLevel(logging.WARNING)
 
+# Dispatch table from agent type to agent class
+_AGENT_CLASSES = {
+    "youtube": YouTubeAgent,
+    "spotify": SpotifyAgent,
+    "history": HistoryAgent,
+}
+_AGENT_TYPES = tuple(_AGENT_CLASSES)
 
-def content_worker(agent_type: str, poi: POI) -> ContentResult:
+# Agent instances created once per worker process by _init_agents()
+_AGENTS: dict = {}
+
+
+def _init_agents() -> None:
+    """
+    Pool initializer that builds one instance of each content agent per worker.
+
+    Agents are reused by every task the worker runs instead of being
+    constructed per call.
+    """
+    for agent_type, agent_class in _AGENT_CLASSES.items():
+        _AGENTS[agent_type] = agent_class()
+
+
+def content_worker(agent_type: str, poi: Union[POI, dict]) -> ContentResult:
     """
     Worker function that runs a content agent for a POI.
 
-    This function is called by multiprocessing.Pool to run agents in parallel.
-    Must be at module level for pickling to work.
+    This function is submitted to the ParallelExecutor pool (threads or processes).
+    Must be at module level for pickling to work with the process backend.
 
     Args:
         agent_type: Type of agent to run ("youtube", "spotify", or "history")
-        poi: POI object to process
+        poi: POI object, or its to_worker_dict() payload from the process backend
 
     Returns:
         ContentResult from the agent, or error ContentResult if agent fails
@@ -31,22 +57,15 @@ def content_worker(agent_type: str, poi: POI) -> ContentResult:
     Raises:
         ValueError: If agent_type is invalid
     """
-    # Map agent types to agent classes
-    agent_classes = {
-        "youtube": YouTubeAgent,
-        "spotify": SpotifyAgent,
-        "history": HistoryAgent,
-    }
-
-    if agent_type not in agent_classes:
-        raise ValueError(
-            f"Invalid agent_type: {agent_type}. Must be one of {list(agent_classes.keys())}"
-        )
+    if agent_type not in _AGENT_CLASSES:
+        raise ValueError(f"Invalid agent_type: {agent_type}. Must be one of {list(_AGENT_TYPES)}")
+
+    if isinstance(poi, dict):
+        poi = POI.from_worker_dict(poi)
 
     try:
-        # Instantiate the appropriate agent
-        agent_class = agent_classes[agent_type]
-        agent = agent_class()
+        # Reuse the worker's agent if the pool initializer built one
+        agent = _AGENTS.get(agent_type) or _AGENT_CLASSES[agent_type]()
 
         # Run the agent and return result
         result = agent.run(poi)
@@ -66,15 +85,51 @@ def content_worker(agent_type: str, poi: POI) -> ContentResult:
         return error_result
 
 
+@lru_cache(maxsize=128)
+def _load_shared_poi(shm_name: str) -> POI:
+    """
+    Read a POI published by ParallelExecutor into shared memory.
+
+    Cached per worker process, so the agents of one POI that land on the
+    same worker unpickle it only once.
+
+    Args:
+        shm_name: Name of the shared memory block holding the POI payload
+
+    Returns:
+        POI rebuilt from the block's to_worker_dict() payload
+    """
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = pickle.loads(bytes(block.buf))
+    finally:
+        block.close()
+    return POI.from_worker_dict(data)
+
+
+def shared_content_worker(agent_type: str, shm_name: str) -> ContentResult:
+    """
+    Worker function that runs a content agent for a POI held in shared memory.
+
+    Args:
+        agent_type: Type of agent to run ("youtube", "spotify", or "history")
+        shm_name: Name of the shared memory block holding the POI payload
+
+    Returns:
+        ContentResult from the agent, or error ContentResult if agent fails
+    """
+    return content_worker(agent_type, _load_shared_poi(shm_name))
+
+
 def batch_content_worker(tasks: list) -> list:
     """
     Worker function that processes multiple POI-agent pairs.
 
-    This is useful for processing a batch of tasks in a single worker process,
-    reducing the overhead of process spawning.
+    ParallelExecutor sends one chunk of tasks per worker through this function
+    on the process backend, so the whole chunk costs a single IPC round trip.
 
     Args:
-        tasks: List of (agent_type, poi) tuples
+        tasks: List of (agent_type, poi) tuples; poi may be a to_worker_dict() payload
 
     Returns:
         List of ContentResult objects
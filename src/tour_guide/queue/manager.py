@@ -1,21 +1,27 @@
-"""Queue manager for inter-agent communication using multiprocessing."""
+"""Queue manager for inter-agent communication, in-process or across processes."""
 
 import logging
+import queue
 from multiprocessing import Queue
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from tour_guide.models.poi import POI
 from tour_guide.models.content import ContentResult
 from tour_guide.models.judgment import JudgmentResult
 
 logger = logging.getLogger(__name__)
 
+# Supported queue backends
+BACKENDS = ("thread", "mp")
+
 
 class QueueManager:
     """
     Manages multiple queues for inter-agent communication.
 
-    Uses multiprocessing.Queue for cross-process communication with bounded sizes
-    to prevent memory issues.
+    Uses bounded queues to prevent memory issues. The "mp" backend (default)
+    uses multiprocessing.Queue for cross-process communication; the "thread"
+    backend uses queue.Queue, which skips pickling and pipe writes when producer
+    and consumer share a process.
 
     Queue types:
     - poi_queue: POIs waiting to be processed by content agents
@@ -28,6 +34,7 @@ class QueueManager:
         poi_queue_size: int = 10,
         results_queue_size: int = 30,
         judgment_queue_size: int = 10,
+        backend: str = "mp",
     ):
         """
         Initialize queue manager with bounded queues.
@@ -36,10 +43,19 @@ class QueueManager:
             poi_queue_size: Max POIs in queue (default 10)
             results_queue_size: Max content results in queue (default 30, 3 per POI)
             judgment_queue_size: Max judgments in queue (default 10)
+            backend: "mp" (default) for cross-process queues, "thread" for in-process
+
+        Raises:
+            ValueError: If backend is not supported
         """
-        self.poi_queue: Queue = Queue(maxsize=poi_queue_size)
-        self.results_queue: Queue = Queue(maxsize=results_queue_size)
-        self.judgment_queue: Queue = Queue(maxsize=judgment_queue_size)
+        if backend not in BACKENDS:
+            raise ValueError(f"Invalid backend: {backend}. Must be one of {list(BACKENDS)}")
+
+        self._queue_class = queue.Queue if backend == "thread" else Queue
+        self.backend = backend
+        self.poi_queue = self._queue_class(maxsize=poi_queue_size)
+        self.results_queue = self._queue_class(maxsize=results_queue_size)
+        self.judgment_queue = self._queue_class(maxsize=judgment_queue_size)
 
         self.poi_queue_size = poi_queue_size
         self.results_queue_size = results_queue_size
@@ -47,7 +63,7 @@ class QueueManager:
 
         logger.info(
             f"QueueManager initialized with sizes: poi={poi_queue_size}, "
-            f"results={results_queue_size}, judgment={judgment_queue_size}"
+            f"results={results_queue_size}, judgment={judgment_queue_size}, backend={backend}"
         )
 
     def put_poi(self, poi: POI, block: bool = True, timeout: Optional[float] = None) -> None:
@@ -155,39 +171,132 @@ class QueueManager:
         logger.debug(f"Judgment dequeued: {judgment.selected_type} for {judgment.poi_name}")
         return judgment
 
+    def put_results_batch(
+        self, results: List[ContentResult], block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Put a list of ContentResults into the results_queue as one item.
+
+        One enqueue (and one lock/pickle round) covers the whole list. The batch
+        occupies a single queue slot and must be read back with get_results_batch().
+
+        Args:
+            results: ContentResult objects to enqueue together (typically one POI's)
+            block: Whether to block if queue is full (default True)
+            timeout: Timeout in seconds for blocking put (None = wait forever)
+
+        Raises:
+            queue.Full: If queue is full and block=False or timeout expires
+        """
+        self.results_queue.put(list(results), block=block, timeout=timeout)
+        logger.debug(f"Result batch enqueued: {len(results)} results")
+
+    def get_results_batch(
+        self, block: bool = True, timeout: Optional[float] = None
+    ) -> List[ContentResult]:
+        """
+        Get a list of ContentResults enqueued by put_results_batch().
+
+        Args:
+            block: Whether to block if queue is empty (default True)
+            timeout: Timeout in seconds for blocking get (None = wait forever)
+
+        Returns:
+            List of ContentResult objects
+
+        Raises:
+            queue.Empty: If queue is empty and block=False or timeout expires
+        """
+        results = self.results_queue.get(block=block, timeout=timeout)
+        logger.debug(f"Result batch dequeued: {len(results)} results")
+        return results
+
+    def put_judgments_batch(
+        self, judgments: List[JudgmentResult], block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Put a list of JudgmentResults into the judgment_queue as one item.
+
+        The batch occupies a single queue slot and must be read back with
+        get_judgments_batch().
+
+        Args:
+            judgments: JudgmentResult objects to enqueue together
+            block: Whether to block if queue is full (default True)
+            timeout: Timeout in seconds for blocking put (None = wait forever)
+
+        Raises:
+            queue.Full: If queue is full and block=False or timeout expires
+        """
+        self.judgment_queue.put(list(judgments), block=block, timeout=timeout)
+        logger.debug(f"Judgment batch enqueued: {len(judgments)} judgments")
+
+    def get_judgments_batch(
+        self, block: bool = True, timeout: Optional[float] = None
+    ) -> List[JudgmentResult]:
+        """
+        Get a list of JudgmentResults enqueued by put_judgments_batch().
+
+        Args:
+            block: Whether to block if queue is empty (default True)
+            timeout: Timeout in seconds for blocking get (None = wait forever)
+
+        Returns:
+            List of JudgmentResult objects
+
+        Raises:
+            queue.Empty: If queue is empty and block=False or timeout expires
+        """
+        judgments = self.judgment_queue.get(block=block, timeout=timeout)
+        logger.debug(f"Judgment batch dequeued: {len(judgments)} judgments")
+        return judgments
+
+    def _reset_queue(self, name: str, maxsize: int) -> int:
+        """
+        Empty one queue in a single operation.
+
+        In-process queues are cleared under their own lock. A multiprocessing
+        queue cannot be drained atomically, so it is closed and replaced with
+        a fresh one.
+
+        Args:
+            name: Attribute name of the queue to reset
+            maxsize: Bound for the replacement queue
+
+        Returns:
+            Approximate number of items discarded (0 if the platform cannot tell)
+        """
+        old_queue = getattr(self, name)
+
+        if self.backend == "thread":
+            with old_queue.mutex:
+                cleared = len(old_queue.queue)
+                old_queue.queue.clear()
+                old_queue.not_full.notify_all()
+            return cleared
+
+        try:
+            cleared = old_queue.qsize()
+        except NotImplementedError:
+            # qsize() not implemented on macOS for multiprocessing.Queue
+            cleared = 0
+        old_queue.close()
+        # Discarded items must not keep the feeder thread (and process exit) waiting
+        old_queue.cancel_join_thread()
+        setattr(self, name, self._queue_class(maxsize=maxsize))
+        return cleared
+
     def clear_all(self) -> None:
         """
-        Drain all queues by removing all items.
+        Empty all queues, discarding their items.
 
         Note: This should only be called when no processes are actively using the queues
-        to avoid race conditions.
-        """
-        # Clear POI queue
-        cleared_pois = 0
-        while not self.poi_queue.empty():
-            try:
-                self.poi_queue.get_nowait()
-                cleared_pois += 1
-            except:
-                break
-
-        # Clear results queue
-        cleared_results = 0
-        while not self.results_queue.empty():
-            try:
-                self.results_queue.get_nowait()
-                cleared_results += 1
-            except:
-                break
-
-        # Clear judgment queue
-        cleared_judgments = 0
-        while not self.judgment_queue.empty():
-            try:
-                self.judgment_queue.get_nowait()
-                cleared_judgments += 1
-            except:
-                break
+        to avoid race conditions. On the mp backend the queues are replaced, so other
+        processes holding the old queues no longer share them with this manager.
+        """
+        cleared_pois = self._reset_queue("poi_queue", self.poi_queue_size)
+        cleared_results = self._reset_queue("results_queue", self.results_queue_size)
+        cleared_judgments = self._reset_queue("judgment_queue", self.judgment_queue_size)
 
         logger.info(
             f"Queues cleared: {cleared_pois} POIs, {cleared_results} results, "
@@ -0,0 +1,115 @@
+"""Persistent cache of OSRM routes."""
+
+import shelve
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+from tour_guide.routing.models import Route
+from tour_guide.logging import get_logger
+
+logger = get_logger("routing.cache")
+
+# Coordinates are rounded to this many decimals (~1 m) when building keys
+KEY_PRECISION = 5
+
+
+class RouteCache:
+    """
+    Two-level route cache: an in-process LRU in front of a shelve file on disk.
+
+    Disk errors never propagate; a broken or locked cache file just behaves
+    like a miss, so routing falls back to the network as before.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]], maxsize: int = 256):
+        """
+        Initialize route cache.
+
+        Args:
+            directory: Directory for the shelve file (None or "" keeps the cache in memory only)
+            maxsize: Maximum number of routes kept in memory
+        """
+        self.path = Path(directory).expanduser() / "routes" if directory else None
+        self.maxsize = maxsize
+        self._memory: "OrderedDict[str, Route]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        base_url: str, origin: Tuple[float, float], destination: Tuple[float, float]
+    ) -> str:
+        """
+        Build a cache key from the OSRM server and rounded coordinates.
+
+        Args:
+            base_url: OSRM server URL, so switching servers never reuses routes
+            origin: (lat, lon) tuple
+            destination: (lat, lon) tuple
+
+        Returns:
+            String key usable by both cache levels
+        """
+        p = KEY_PRECISION
+        return (
+            f"{base_url}|{origin[0]:.{p}f},{origin[1]:.{p}f}"
+            f";{destination[0]:.{p}f},{destination[1]:.{p}f}"
+        )
+
+    def get(self, key: str) -> Optional[Route]:
+        """
+        Look up a route, checking memory before disk.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached Route, or None on a miss
+        """
+        with self._lock:
+            route = self._memory.get(key)
+            if route is not None:
+                self._memory.move_to_end(key)
+                return route
+
+            if self.path is None:
+                return None
+
+            try:
+                with shelve.open(str(self.path), flag="r") as db:
+                    route = db.get(key)
+            except Exception as e:
+                logger.debug(f"Route cache read skipped: {e}")
+                return None
+
+            if route is not None:
+                self._remember(key, route)
+            return route
+
+    def set(self, key: str, route: Route) -> None:
+        """
+        Store a route in memory and on disk.
+
+        Args:
+            key: Key from make_key()
+            route: Route to cache
+        """
+        with self._lock:
+            self._remember(key, route)
+
+            if self.path is None:
+                return
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with shelve.open(str(self.path)) as db:
+                    db[key] = route
+            except Exception as e:
+                logger.warning(f"Route cache write failed: {e}")
+
+    def _remember(self, key: str, route: Route) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full."""
+        self._memory[key] = route
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
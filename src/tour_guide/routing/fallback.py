@@ -2,6 +2,7 @@
 
 import json
 from typing import Tuple
+from tour_guide.agents.base import extract_json_block, load_json
 from tour_guide.routing.models import Route, Waypoint, RouteStep
 from tour_guide.utils.claude_cli import call_claude, ClaudeError
 from tour_guide.logging import get_logger
@@ -70,17 +71,7 @@ Return ONLY a JSON object in this exact format (no markdown, no explanation):
 
         # Parse JSON response
         # Claude might wrap in ```json ... ```, so extract
-        json_str = response
-        if "```json" in response:
-            start = response.index("```json") + 7
-            end = response.index("```", start)
-            json_str = response[start:end].strip()
-        elif "```" in response:
-            start = response.index("```") + 3
-            end = response.index("```", start)
-            json_str = response[start:end].strip()
-
-        data = json.loads(json_str)
+        data = load_json(extract_json_block(response))
 
         # Convert to Route object
         waypoints = [
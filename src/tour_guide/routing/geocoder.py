@@ -1,12 +1,14 @@
 """Simple geocoder for known locations."""
 
-from typing import Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping, Tuple
 from tour_guide.logging import get_logger
 
 logger = get_logger("routing.geocoder")
 
-# Simple hardcoded geocoding for Israeli cities
-KNOWN_LOCATIONS = {
+# Simple hardcoded geocoding for Israeli cities (read-only; geocode() caches lookups)
+KNOWN_LOCATIONS: Final[Mapping[str, Tuple[float, float]]] = MappingProxyType({
     "tel aviv": (32.0853, 34.7818),
     "jerusalem": (31.7683, 35.2137),
     "haifa": (32.7940, 34.9896),
@@ -21,13 +23,22 @@ KNOWN_LOCATIONS = {
     "rosh hanikra": (33.0891, 35.1064),
     "bethlehem": (31.7054, 35.2024),
     "jaffa": (32.0543, 34.7516),
-}
+})
 
+# Lookup table keyed by casefolded names, built once at import
+_NORMALIZED: Final[Mapping[str, Tuple[float, float]]] = MappingProxyType(
+    {name.casefold(): coords for name, coords in KNOWN_LOCATIONS.items()}
+)
 
+
+@lru_cache(maxsize=1024)
 def geocode(place_name: str) -> Tuple[float, float]:
     """
     Simple geocoder for known locations.
 
+    Results are cached per input string, so repeated endpoints in batch route
+    planning skip normalization entirely. Unknown places are not cached.
+
     Args:
         place_name: Name of place
 
@@ -37,10 +48,10 @@ def geocode(place_name: str) -> Tuple[float, float]:
     Raises:
         ValueError: If place not found
     """
-    normalized = place_name.lower().strip()
+    normalized = place_name.casefold().strip()
 
-    if normalized in KNOWN_LOCATIONS:
-        coords = KNOWN_LOCATIONS[normalized]
+    coords = _NORMALIZED.get(normalized)
+    if coords is not None:
         logger.debug(f"Geocoded '{place_name}' to {coords}")
         return coords
 
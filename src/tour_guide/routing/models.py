@@ -1,10 +1,24 @@
 """Data models for routing."""
 
+import heapq
+import math
 from dataclasses import dataclass
 from typing import List, Tuple
 
 
-@dataclass
+def _segment_distance(
+    point: Tuple[float, float], start: Tuple[float, float], end: Tuple[float, float]
+) -> float:
+    """Planar distance from point to the segment start-end."""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+    t = max(0.0, min(1.0, ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length_sq))
+    return math.hypot(point[0] - start[0] - t * dx, point[1] - start[1] - t * dy)
+
+
+@dataclass(slots=True, frozen=True)
 class Waypoint:
     """A point along the route."""
 
@@ -13,7 +27,7 @@ class Waypoint:
     distance_from_start_km: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RouteStep:
     """A step in the route directions."""
 
@@ -62,3 +76,47 @@ class Route:
 
         sampled.append(self.waypoints[-1])
         return sampled
+
+    def simplify(self, max_points: int = 30) -> List[Waypoint]:
+        """
+        Reduce waypoints to max_points while keeping the route's shape.
+
+        Ramer-Douglas-Peucker, driven by a priority queue instead of a
+        tolerance: the point that deviates most from the current simplified
+        line is added next, so turns are kept and straight stretches are
+        thinned until exactly max_points remain.
+
+        Args:
+            max_points: Maximum number of waypoints to return (default: 30)
+
+        Returns:
+            List of original waypoints, always including start and end points
+        """
+        if len(self.waypoints) <= max(max_points, 2):
+            return self.waypoints
+
+        # Project to a local plane so a degree of longitude is not overweighted
+        scale = math.cos(math.radians(self.waypoints[0].lat))
+        points = [(wp.lon * scale, wp.lat) for wp in self.waypoints]
+
+        heap: List[Tuple[float, int, int, int]] = []
+
+        def push(first: int, last: int) -> None:
+            if last - first < 2:
+                return
+            start, end = points[first], points[last]
+            index = max(
+                range(first + 1, last), key=lambda i: _segment_distance(points[i], start, end)
+            )
+            distance = _segment_distance(points[index], start, end)
+            heapq.heappush(heap, (-distance, index, first, last))
+
+        keep = {0, len(points) - 1}
+        push(0, len(points) - 1)
+        while heap and len(keep) < max_points:
+            _, index, first, last = heapq.heappop(heap)
+            keep.add(index)
+            push(first, index)
+            push(index, last)
+
+        return [self.waypoints[i] for i in sorted(keep)]
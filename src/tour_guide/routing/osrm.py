@@ -1,13 +1,146 @@
 """OSRM routing client."""
 
+from math import asin, atan2, cos, hypot, radians, sin, sqrt
+from functools import lru_cache
+from itertools import accumulate, starmap
 import requests
-from typing import Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
 from tour_guide.routing.models import Route, Waypoint, RouteStep
+from tour_guide.routing.cache import RouteCache
 from tour_guide.config import get_settings
 from tour_guide.logging import get_logger
 
 logger = get_logger("routing.osrm")
 
+try:
+    import numpy as np
+except ImportError:  # optional "fast" extra; pure-Python fallback below
+    np = None
+
+try:
+    import orjson
+except ImportError:  # optional "fast" extra; falls back to response.json()
+    orjson = None
+
+EARTH_RADIUS_KM = 6371.0
+
+# Segments shorter than this (radians, ~10 km) use the equirectangular approximation
+SHORT_SEGMENT_RAD = 0.0015
+
+# Keep-alive connections held per OSRM host; sized for RoutePlanner.plan_routes
+CONNECTION_POOL_SIZE = 16
+
+# Gateway errors from the public OSRM server are usually transient
+RETRY_STATUSES = (502, 503, 504)
+
+
+def _polyline_kernel(lon, lat):
+    """Fused Haversine + running-sum loop over radian arrays (compiled by Numba)."""
+    out = np.empty(lat.shape[0])
+    out[0] = 0.0
+    total = 0.0
+    for i in range(1, lat.shape[0]):
+        a = (
+            sin((lat[i] - lat[i - 1]) / 2) ** 2
+            + cos(lat[i - 1]) * cos(lat[i]) * sin((lon[i] - lon[i - 1]) / 2) ** 2
+        )
+        total += 2 * EARTH_RADIUS_KM * asin(sqrt(min(a, 1.0)))
+        out[i] = total
+    return out
+
+
+@lru_cache(maxsize=None)
+def _jit_polyline_kernel():
+    """
+    Compile _polyline_kernel with Numba on first use.
+
+    Numba is imported lazily so that importing the routing package stays cheap.
+
+    Returns:
+        Compiled kernel, or None when Numba (optional "jit" extra) is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True, fastmath=True)(_polyline_kernel)
+
+
+def _cumulative_distances(coordinates: Sequence[Sequence[float]]) -> List[float]:
+    """
+    Cumulative great-circle distance (km) along a polyline of [lon, lat] pairs.
+
+    Uses a single compiled loop when Numba is installed, else a vectorized
+    NumPy pass when NumPy is installed. Otherwise short segments, which is
+    nearly all of an OSRM polyline, use the equirectangular approximation
+    and only longer gaps pay for the full Haversine formula.
+
+    Args:
+        coordinates: GeoJSON-style [lon, lat] coordinates
+
+    Returns:
+        Distance from the first point to each point, starting at 0.0
+    """
+    if not coordinates:
+        return []
+
+    if np is not None:
+        coords = np.radians(np.asarray(coordinates, dtype=np.float64))
+        lon, lat = np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1])
+        kernel = _jit_polyline_kernel()
+        if kernel is not None:
+            return kernel(lon, lat).tolist()
+        a = (
+            np.sin(np.diff(lat) / 2) ** 2
+            + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2
+        )
+        segments = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        return np.concatenate(([0.0], np.cumsum(segments))).tolist()
+
+    distances = [0.0]
+    prev_lon, prev_lat = radians(coordinates[0][0]), radians(coordinates[0][1])
+    total = 0.0
+    for lon_deg, lat_deg in coordinates[1:]:
+        lon, lat = radians(lon_deg), radians(lat_deg)
+        dlat, dlon = lat - prev_lat, lon - prev_lon
+        if abs(dlat) < SHORT_SEGMENT_RAD and abs(dlon) < SHORT_SEGMENT_RAD:
+            # Equirectangular: one cos + hypot, same result as Haversine at this scale
+            total += EARTH_RADIUS_KM * hypot(dlat, cos((lat + prev_lat) / 2) * dlon)
+        else:
+            a = sin(dlat / 2) ** 2 + cos(prev_lat) * cos(lat) * sin(dlon / 2) ** 2
+            total += 2 * EARTH_RADIUS_KM * asin(sqrt(min(a, 1.0)))
+        distances.append(total)
+        prev_lon, prev_lat = lon, lat
+    return distances
+
+
+def _annotation_distances(route: dict, num_points: int) -> Optional[List[float]]:
+    """
+    Cumulative road distance (km) from OSRM's per-segment distance annotations.
+
+    Args:
+        route: One entry of the OSRM "routes" array
+        num_points: Number of coordinates in the route geometry
+
+    Returns:
+        Distance from the first point to each point, or None when the response
+        carries no usable annotations (caller falls back to Haversine)
+    """
+    segments = []
+    for leg in route.get("legs", []):
+        annotation = leg.get("annotation")
+        if not annotation or "distance" not in annotation:
+            return None
+        segments.extend(annotation["distance"])
+
+    if len(segments) != num_points - 1:
+        return None
+
+    return [meters / 1000 for meters in accumulate(segments, initial=0.0)]
+
 
 class OSRMError(Exception):
     """OSRM API error."""
@@ -16,12 +149,50 @@ class OSRMError(Exception):
 
 
 class OSRMClient:
-    """Client for OSRM routing API."""
+    """
+    Client for OSRM routing API.
+
+    Requests go through one shared requests.Session so repeated calls reuse
+    keep-alive connections, and transient gateway errors are retried with a
+    short backoff. The client holds no per-request state, so a single
+    instance can be called from several threads at once.
+    """
+
+    def __init__(self, base_url: str = None, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize OSRM client.
+
+        Args:
+            base_url: OSRM server URL (defaults to routing.osrm_url)
+            cache_dir: Directory for the persistent route cache (defaults to
+                routing.cache_dir; "" keeps routes in memory only)
+        """
+        # get_settings() is a process-wide singleton; look up the routing section once
+        routing = get_settings().routing
+        self.base_url = base_url or routing.osrm_url
+        self.timeout = routing.timeout_seconds
+        self.cache = RouteCache(routing.cache_dir if cache_dir is None else cache_dir)
+        self._session = requests.Session()
+        retries = Retry(
+            total=routing.max_retries,
+            backoff_factor=0.1,
+            status_forcelist=RETRY_STATUSES,
+        )
+        adapter = HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE, max_retries=retries)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
-    def __init__(self, base_url: str = None):
-        settings = get_settings()
-        self.base_url = base_url or settings.routing.osrm_url
-        self.timeout = settings.routing.timeout_seconds
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> "OSRMClient":
+        """Use the client as a context manager that owns the session."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the session when leaving the context."""
+        self.close()
 
     def get_route(
         self, origin: Tuple[float, float], destination: Tuple[float, float]
@@ -29,6 +200,9 @@ class OSRMClient:
         """
         Get route from OSRM API.
 
+        Routes are cached by server and rounded coordinates, so a repeated
+        origin/destination pair skips the HTTP request and JSON parse.
+
         Args:
             origin: (lat, lon) tuple
             destination: (lat, lon) tuple
@@ -39,26 +213,38 @@ class OSRMClient:
         Raises:
             OSRMError: If OSRM request fails
         """
+        cache_key = self.cache.make_key(self.base_url, origin, destination)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"OSRM route cache hit: {origin} -> {destination}")
+            return cached
+
         # OSRM uses lon,lat format (opposite of lat,lon)
         origin_str = f"{origin[1]},{origin[0]}"
         dest_str = f"{destination[1]},{destination[0]}"
 
         url = f"{self.base_url}/route/v1/driving/{origin_str};{dest_str}"
-        params = {"overview": "full", "steps": "true", "geometries": "geojson"}
+        params = {
+            "overview": "full",
+            "steps": "true",
+            "geometries": "geojson",
+            "annotations": "distance",
+        }
 
         logger.info(f"Requesting OSRM route: {origin} -> {destination}")
 
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            # orjson.JSONDecodeError subclasses ValueError, like the stdlib error
+            data = orjson.loads(response.content) if orjson is not None else response.json()
 
             if data.get("code") != "Ok":
                 raise OSRMError(
                     f"OSRM returned error: {data.get('message', 'Unknown error')}"
                 )
 
-            return self._parse_response(data, origin, destination)
+            route = self._parse_response(data, origin, destination)
 
         except requests.Timeout:
             raise OSRMError(f"OSRM request timed out after {self.timeout}s")
@@ -67,49 +253,36 @@ class OSRMClient:
         except (KeyError, ValueError, IndexError) as e:
             raise OSRMError(f"Invalid OSRM response format: {e}")
 
+        self.cache.set(cache_key, route)
+        return route
+
     def _parse_response(
         self, data: dict, origin: Tuple[float, float], destination: Tuple[float, float]
     ) -> Route:
         """Parse OSRM JSON response into Route object."""
         route = data["routes"][0]
 
-        # Extract waypoints from geometry
+        # Extract waypoints from geometry. OSRM's road-distance annotations give the
+        # cumulative distance directly; Haversine over the polyline is the fallback.
         coordinates = route["geometry"]["coordinates"]
-        waypoints = []
-
-        cumulative_distance = 0.0
-        for i, coord in enumerate(coordinates):
-            if i > 0:
-                # Calculate distance increment (rough estimate)
-                prev = coordinates[i - 1]
-                distance_increment = self._haversine(
-                    prev[1], prev[0], coord[1], coord[0]
-                )
-                cumulative_distance += distance_increment
+        distances = _annotation_distances(route, len(coordinates))
+        if distances is None:
+            distances = _cumulative_distances(coordinates)
+        # Build all waypoints in one C-level pass: transpose to lon/lat columns and
+        # construct positionally (lat, lon, distance_from_start_km)
+        lons, lats = zip(*coordinates) if coordinates else ((), ())
+        waypoints = list(starmap(Waypoint, zip(lats, lons, distances)))
 
-            waypoints.append(
-                Waypoint(lat=coord[1], lon=coord[0], distance_from_start_km=cumulative_distance)
+        # Extract steps from every leg in a single comprehension
+        steps = [
+            RouteStep(
+                instruction=self._step_instruction(step),
+                distance_km=step["distance"] / 1000,
+                duration_min=step["duration"] / 60,
             )
-
-        # Extract steps
-        steps = []
-        if "legs" in route:
-            for leg in route["legs"]:
-                if "steps" in leg:
-                    for step in leg["steps"]:
-                        instruction = step.get("name", "Continue")
-                        if step.get("maneuver"):
-                            instruction = (
-                                f"{step['maneuver'].get('type', 'turn')} {instruction}"
-                            )
-
-                        steps.append(
-                            RouteStep(
-                                instruction=instruction,
-                                distance_km=step["distance"] / 1000,
-                                duration_min=step["duration"] / 60,
-                            )
-                        )
+            for leg in route.get("legs", ())
+            for step in leg.get("steps", ())
+        ]
 
         logger.info(
             f"OSRM route parsed: {route['distance']/1000:.1f} km, "
@@ -126,18 +299,22 @@ class OSRMClient:
             source="osrm",
         )
 
+    @staticmethod
+    def _step_instruction(step: dict) -> str:
+        """Instruction text for an OSRM step, prefixed with its maneuver type if any."""
+        instruction = step.get("name", "Continue")
+        if step.get("maneuver"):
+            instruction = f"{step['maneuver'].get('type', 'turn')} {instruction}"
+        return instruction
+
     @staticmethod
     def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance between two points using Haversine formula (km)."""
-        from math import radians, sin, cos, sqrt, atan2
-
-        R = 6371  # Earth radius in km
-
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+        lat1, lat2 = radians(lat1), radians(lat2)
         dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        dlon = radians(lon2 - lon1)
 
         a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
         c = 2 * atan2(sqrt(a), sqrt(1 - a))
 
-        return R * c
+        return EARTH_RADIUS_KM * c
@@ -1,8 +1,10 @@
 """Main routing interface with OSRM and Claude fallback."""
 
-from typing import Union, Tuple
-from tour_guide.routing.models import Route
-from tour_guide.routing.osrm import OSRMClient, OSRMError
+from concurrent.futures import ThreadPoolExecutor
+from functools import singledispatchmethod
+from typing import List, Union, Tuple
+from tour_guide.routing.models import Route, Waypoint
+from tour_guide.routing.osrm import OSRMClient, OSRMError, CONNECTION_POOL_SIZE
 from tour_guide.routing.fallback import get_route_from_claude, ClaudeRouterError
 from tour_guide.routing.geocoder import geocode
 from tour_guide.config import get_settings
@@ -10,6 +12,11 @@ from tour_guide.logging import get_logger
 
 logger = get_logger("routing.planner")
 
+# Concurrent route requests in plan_routes(); matches the OSRM connection pool
+MAX_ROUTE_WORKERS = CONNECTION_POOL_SIZE
+
+Location = Union[str, Tuple[float, float], Waypoint]
+
 
 class RoutingError(Exception):
     """General routing error."""
@@ -21,21 +28,20 @@ class RoutePlanner:
     """Main routing interface with OSRM and Claude fallback."""
 
     def __init__(self):
-        settings = get_settings()
-        self.config = settings.routing
+        self.config = get_settings().routing
         self.osrm_client = OSRMClient()
 
     def plan_route(
         self,
-        origin: Union[str, Tuple[float, float]],
-        destination: Union[str, Tuple[float, float]],
+        origin: Location,
+        destination: Location,
     ) -> Route:
         """
         Plan route from origin to destination.
 
         Args:
-            origin: Place name or (lat, lon) tuple
-            destination: Place name or (lat, lon) tuple
+            origin: Place name, (lat, lon) tuple or Waypoint
+            destination: Place name, (lat, lon) tuple or Waypoint
 
         Returns:
             Route object
@@ -46,7 +52,63 @@ class RoutePlanner:
         # Convert place names to coordinates if needed
         origin_coords, origin_name = self._resolve_location(origin)
         dest_coords, dest_name = self._resolve_location(destination)
+        return self._plan_resolved(origin_coords, origin_name, dest_coords, dest_name)
+
+    def plan_routes(self, pairs: List[Tuple[Location, Location]]) -> List[Route]:
+        """
+        Plan several routes, sending their OSRM requests concurrently.
+
+        All locations are resolved before any request is sent, so an unknown
+        place name fails fast. Each route still gets the Claude fallback.
+
+        Args:
+            pairs: List of (origin, destination) pairs, each a place name, (lat, lon)
+                tuple or Waypoint
+
+        Returns:
+            Route objects in the same order as pairs
+
+        Raises:
+            ValueError: If a place name cannot be geocoded
+            RoutingError: If both OSRM and Claude fail for any pair
+        """
+        if not pairs:
+            return []
+
+        resolved = [
+            (*self._resolve_location(origin), *self._resolve_location(destination))
+            for origin, destination in pairs
+        ]
+
+        logger.info(f"Planning {len(pairs)} routes concurrently")
 
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_ROUTE_WORKERS, len(pairs)), thread_name_prefix="route"
+        ) as executor:
+            return list(executor.map(lambda args: self._plan_resolved(*args), resolved))
+
+    def _plan_resolved(
+        self,
+        origin_coords: Tuple[float, float],
+        origin_name: str,
+        dest_coords: Tuple[float, float],
+        dest_name: str,
+    ) -> Route:
+        """
+        Plan a route between already-resolved locations, OSRM first then Claude.
+
+        Args:
+            origin_coords: Origin (lat, lon)
+            origin_name: Origin display name
+            dest_coords: Destination (lat, lon)
+            dest_name: Destination display name
+
+        Returns:
+            Route object
+
+        Raises:
+            RoutingError: If both OSRM and Claude fail
+        """
         logger.info(f"Planning route: {origin_name} → {dest_name}")
 
         # Try OSRM first
@@ -81,22 +143,27 @@ class RoutePlanner:
             logger.error(f"Claude fallback also failed: {e}")
             raise RoutingError(f"Both OSRM and Claude routing failed: {e}")
 
-    def _resolve_location(
-        self, location: Union[str, Tuple[float, float]]
-    ) -> Tuple[Tuple[float, float], str]:
+    @singledispatchmethod
+    def _resolve_location(self, location: str) -> Tuple[Tuple[float, float], str]:
         """
-        Convert location to (coordinates, name) tuple.
+        Convert location to (coordinates, name) tuple, dispatching on its type.
 
         Args:
-            location: Place name or (lat, lon) tuple
+            location: Place name, (lat, lon) tuple or Waypoint
 
         Returns:
             Tuple of ((lat, lon), name)
         """
-        if isinstance(location, tuple):
-            # Already coordinates
-            return location, f"{location[0]:.4f},{location[1]:.4f}"
-        else:
-            # Place name - need to geocode
-            coords = geocode(location)
-            return coords, location
+        # Place name - need to geocode
+        coords = geocode(location)
+        return coords, location
+
+    @_resolve_location.register
+    def _(self, location: tuple) -> Tuple[Tuple[float, float], str]:
+        # Already coordinates
+        return location, f"{location[0]:.4f},{location[1]:.4f}"
+
+    @_resolve_location.register
+    def _(self, location: Waypoint) -> Tuple[Tuple[float, float], str]:
+        # A point taken from another route
+        return self._resolve_location((location.lat, location.lon))
@@ -1,3 +1,51 @@
-"""Skill loader."""
+"""Prompt template compilation shared by the skills."""
 
-# Placeholder
+from string import Formatter
+from typing import Callable, List, Optional, Tuple
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a str.format template into a reusable formatter.
+
+    The template is scanned for placeholders once, with "{{" / "}}" escapes
+    already collapsed into the literal text, so each call only stitches
+    literals and formatted values together instead of re-parsing the
+    whole prompt.
+
+    Args:
+        template: Template using named fields, e.g. "Hi {name}, {score:.1f}"
+
+    Returns:
+        Function taking the field values as keyword arguments and returning
+        the same string as template.format(**kwargs)
+
+    Raises:
+        ValueError: If the template uses positional, indexed or nested fields
+    """
+    parts: List[Tuple[str, str, str, Optional[Callable]]] = []
+    literal = ""
+    for text, field_name, format_spec, conversion in Formatter().parse(template):
+        literal += text
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or "{" in format_spec:
+            raise ValueError(f"Unsupported template field: {{{field_name}}}")
+        parts.append((literal, field_name, format_spec, _CONVERSIONS.get(conversion)))
+        literal = ""
+    tail = literal
+
+    def render(**kwargs) -> str:
+        out = []
+        for text, field_name, format_spec, convert in parts:
+            value = kwargs[field_name]
+            if convert is not None:
+                value = convert(value)
+            out.append(text)
+            out.append(format(value, format_spec))
+        out.append(tail)
+        return "".join(out)
+
+    return render
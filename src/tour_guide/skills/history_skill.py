@@ -1,5 +1,8 @@
 """Skill prompt for History agent."""
 
+from functools import lru_cache
+from tour_guide.skills.base import compile_template
+
 HISTORY_PROMPT = """You are a historical storyteller. Create an engaging historical narrative about this location.
 
 **Location Information:**
@@ -35,7 +38,10 @@ Write a compelling historical narrative (300-500 words) about this location in s
 Return ONLY the JSON object, no other text.
 """
 
+_FORMAT_HISTORY = compile_template(HISTORY_PROMPT)
+
 
+@lru_cache(maxsize=512)
 def format_history_prompt(poi_name: str, poi_description: str, poi_category: str) -> str:
     """
     Format the History prompt with POI data.
@@ -48,7 +54,7 @@ def format_history_prompt(poi_name: str, poi_description: str, poi_category: str
     Returns:
         Formatted prompt string
     """
-    return HISTORY_PROMPT.format(
+    return _FORMAT_HISTORY(
         poi_name=poi_name,
         poi_description=poi_description,
         poi_category=poi_category,
@@ -1,5 +1,7 @@
 """Skill prompt for Judge agent."""
 
+from tour_guide.skills.base import compile_template
+
 JUDGE_PROMPT = """You are a content judge. Evaluate these content options for the location "{poi_name}" and select the single best one.
 
 **OPTION 1 - YouTube:**
@@ -40,6 +42,28 @@ Evaluate each option, assign scores, and select EXACTLY ONE winner.
 Return ONLY the JSON object, no other text.
 """
 
+_FORMAT_JUDGE = compile_template(JUDGE_PROMPT)
+
+# Descriptions longer than this are cut and suffixed with "..."
+DESCRIPTION_LIMIT = 200
+
+# Template field names per content type: (title, description, score)
+_FIELD_NAMES = {
+    content_type: (
+        f"{content_type}_title",
+        f"{content_type}_description",
+        f"{content_type}_score",
+    )
+    for content_type in ("youtube", "spotify", "history")
+}
+
+# Placeholders for any content type the agents did not produce
+_DEFAULT_FIELDS = {
+    name: default
+    for names in _FIELD_NAMES.values()
+    for name, default in zip(names, ("N/A", "Not available", 0))
+}
+
 
 def format_judge_prompt(poi_name: str, content_results: list) -> str:
     """
@@ -52,37 +76,19 @@ def format_judge_prompt(poi_name: str, content_results: list) -> str:
     Returns:
         Formatted prompt string
     """
-    # Initialize with defaults
-    youtube = {"title": "N/A", "description": "Not available", "score": 0}
-    spotify = {"title": "N/A", "description": "Not available", "score": 0}
-    history = {"title": "N/A", "description": "Not available", "score": 0}
+    fields = dict(_DEFAULT_FIELDS)
 
-    # Fill in actual values
+    # Fill in actual values, keyed straight into the template fields
     for result in content_results:
-        data = {
-            "title": result.title,
-            "description": result.description[:200] + "..."
-            if len(result.description) > 200
-            else result.description,
-            "score": result.relevance_score,
-        }
-
-        if result.content_type == "youtube":
-            youtube = data
-        elif result.content_type == "spotify":
-            spotify = data
-        elif result.content_type == "history":
-            history = data
-
-    return JUDGE_PROMPT.format(
-        poi_name=poi_name,
-        youtube_title=youtube["title"],
-        youtube_description=youtube["description"],
-        youtube_score=youtube["score"],
-        spotify_title=spotify["title"],
-        spotify_description=spotify["description"],
-        spotify_score=spotify["score"],
-        history_title=history["title"],
-        history_description=history["description"],
-        history_score=history["score"],
-    )
+        names = _FIELD_NAMES.get(result.content_type)
+        if names is None:
+            continue
+        description = result.description
+        if len(description) > DESCRIPTION_LIMIT:
+            description = description[:DESCRIPTION_LIMIT] + "..."
+        title_field, description_field, score_field = names
+        fields[title_field] = result.title
+        fields[description_field] = description
+        fields[score_field] = result.relevance_score
+
+    return _FORMAT_JUDGE(poi_name=poi_name, **fields)
@@ -1,5 +1,8 @@
 """Skill prompt for route analyzer agent."""
 
+from functools import lru_cache
+from tour_guide.skills.base import compile_template
+
 ROUTE_ANALYZER_PROMPT = """Analyze this driving route and identify the {poi_count} most interesting points of interest.
 
 Route: {origin} to {destination}
@@ -48,7 +51,10 @@ Return ONLY a JSON array in this exact format (no markdown, no explanation):
 }}
 """
 
+_FORMAT_ROUTE_ANALYZER = compile_template(ROUTE_ANALYZER_PROMPT)
+
 
+@lru_cache(maxsize=512)
 def format_route_analyzer_prompt(
     origin: str,
     destination: str,
@@ -73,7 +79,7 @@ def format_route_analyzer_prompt(
     Returns:
         Formatted prompt string
     """
-    return ROUTE_ANALYZER_PROMPT.format(
+    return _FORMAT_ROUTE_ANALYZER(
         origin=origin,
         destination=destination,
         distance_km=distance_km,
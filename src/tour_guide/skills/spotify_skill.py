@@ -1,5 +1,8 @@
 """Skill prompt for Spotify agent."""
 
+from functools import lru_cache
+from tour_guide.skills.base import compile_template
+
 SPOTIFY_PROMPT = """You are a music curator. Suggest the most relevant music for someone visiting this location.
 
 **Location Information:**
@@ -31,7 +34,10 @@ Suggest 1 highly relevant song or album that captures the essence of this locati
 Return ONLY the JSON object, no other text.
 """
 
+_FORMAT_SPOTIFY = compile_template(SPOTIFY_PROMPT)
+
 
+@lru_cache(maxsize=512)
 def format_spotify_prompt(poi_name: str, poi_description: str, poi_category: str) -> str:
     """
     Format the Spotify prompt with POI data.
@@ -44,7 +50,7 @@ def format_spotify_prompt(poi_name: str, poi_description: str, poi_category: str
     Returns:
         Formatted prompt string
     """
-    return SPOTIFY_PROMPT.format(
+    return _FORMAT_SPOTIFY(
         poi_name=poi_name,
         poi_description=poi_description,
         poi_category=poi_category,
@@ -1,5 +1,8 @@
 """Skill prompt for YouTube agent."""
 
+from functools import lru_cache
+from tour_guide.skills.base import compile_template
+
 YOUTUBE_PROMPT = """You are a YouTube content curator. Find the most relevant video for someone visiting this location.
 
 **Location Information:**
@@ -31,7 +34,10 @@ Suggest 1 highly relevant YouTube video that would be interesting for someone vi
 Return ONLY the JSON object, no other text.
 """
 
+_FORMAT_YOUTUBE = compile_template(YOUTUBE_PROMPT)
+
 
+@lru_cache(maxsize=512)
 def format_youtube_prompt(poi_name: str, poi_description: str, poi_category: str) -> str:
     """
     Format the YouTube prompt with POI data.
@@ -44,7 +50,7 @@ def format_youtube_prompt(poi_name: str, poi_description: str, poi_category: str
     Returns:
         Formatted prompt string
     """
-    return YOUTUBE_PROMPT.format(
+    return _FORMAT_YOUTUBE(
         poi_name=poi_name,
         poi_description=poi_description,
         poi_category=poi_category,
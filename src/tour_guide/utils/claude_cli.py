@@ -1,10 +1,16 @@
 """Claude CLI wrapper for making LLM calls."""
 
+import shutil
 import subprocess
+from functools import lru_cache
 from tour_guide.logging import get_logger
 
 logger = get_logger("utils.claude_cli")
 
+# Identical prompts within a process reuse the first successful response.
+# Tests turn this off so mocked subprocess failures are not masked.
+CLAUDE_CACHE_ENABLED = True
+
 
 class ClaudeError(Exception):
     """Claude CLI error."""
@@ -12,10 +18,19 @@ class ClaudeError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def _claude_executable() -> str:
+    """Resolve the Claude CLI on PATH once; the bare name keeps the not-found error path."""
+    return shutil.which("claude") or "claude"
+
+
 def call_claude(prompt: str, timeout: int = 30, model: str = None) -> str:
     """
     Call Claude CLI with a prompt.
 
+    Successful responses are memoized per (prompt, timeout, model) while
+    CLAUDE_CACHE_ENABLED is set, so an identical prompt skips the CLI.
+
     Args:
         prompt: The prompt to send to Claude
         timeout: Timeout in seconds (default: 30)
@@ -27,8 +42,21 @@ def call_claude(prompt: str, timeout: int = 30, model: str = None) -> str:
     Raises:
         ClaudeError: If Claude CLI fails or times out
     """
+    if CLAUDE_CACHE_ENABLED:
+        return _cached_call(prompt, timeout, model)
+    return _run_claude(prompt, timeout, model)
+
+
+@lru_cache(maxsize=256)
+def _cached_call(prompt: str, timeout: int, model: str) -> str:
+    """Memoized _run_claude; errors propagate and are not cached."""
+    return _run_claude(prompt, timeout, model)
+
+
+def _run_claude(prompt: str, timeout: int, model: str) -> str:
+    """Run the Claude CLI once (see call_claude)."""
     # Build command
-    cmd = ["claude"]
+    cmd = [_claude_executable()]
 
     if model:
         cmd.extend(["--model", model])
@@ -39,8 +67,10 @@ def call_claude(prompt: str, timeout: int = 30, model: str = None) -> str:
     logger.debug(f"Calling Claude CLI with prompt length: {len(prompt)}")
 
     try:
+        # Prompt goes in argv; a closed stdin stops the CLI from waiting on an inherited pipe
         result = subprocess.run(
             cmd,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -1,13 +1,15 @@
 """Geocoding utilities using Claude for location resolution."""
 
 import json
-import re
 from typing import Tuple, Optional
+from tour_guide.agents.base import extract_json_block, load_json
 from tour_guide.utils.claude_cli import call_claude, ClaudeError
 from tour_guide.logging import get_logger
 
 logger = get_logger("geocoding")
 
+_COORD_FIELDS = frozenset(("lat", "lon"))
+
 
 GEOCODING_PROMPT = """You are a geocoding assistant. Given a location name, return its latitude and longitude coordinates.
 
@@ -82,35 +84,19 @@ def _parse_geocoding_response(response: str) -> Optional[Tuple[float, float]]:
         Tuple of (lat, lon) or None if parsing fails
     """
     try:
-        # Extract JSON from response
-        json_str = response.strip()
-
-        if "```json" in json_str:
-            start = json_str.index("```json") + 7
-            end = json_str.index("```", start)
-            json_str = json_str[start:end].strip()
-        elif "```" in json_str:
-            start = json_str.index("```") + 3
-            end = json_str.index("```", start)
-            json_str = json_str[start:end].strip()
-
-        # Parse JSON
-        data = json.loads(json_str)
-
-        if "lat" not in data or "lon" not in data:
+        # Extract JSON from response, unwrapping a markdown code fence if present
+        data = load_json(extract_json_block(response))
+
+        if not isinstance(data, dict) or not data.keys() >= _COORD_FIELDS:
             logger.warning("Geocoding response missing lat or lon fields")
             return None
 
         lat = float(data["lat"])
         lon = float(data["lon"])
 
-        # Validate coordinates
-        if not (-90 <= lat <= 90):
-            logger.warning(f"Invalid latitude: {lat}")
-            return None
-
-        if not (-180 <= lon <= 180):
-            logger.warning(f"Invalid longitude: {lon}")
+        # Validate coordinates in one check (NaN fails both comparisons)
+        if not (abs(lat) <= 90 and abs(lon) <= 180):
+            logger.warning(f"Invalid coordinates: lat={lat}, lon={lon}")
             return None
 
         return (lat, lon)
@@ -1,7 +1,64 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+from datetime import datetime, timedelta
 from pathlib import Path
+from tour_guide.agents.base import BaseAgent
+from tour_guide.config import Settings, get_settings
+from tour_guide.diagnosis import LogEntry
+
+# Fixed clock for test log entries: deterministic and no clock read per entry
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class EchoAgent(BaseAgent):
+    """Minimal concrete agent that echoes its input."""
+
+    def run(self, input_data):
+        return "Processed: " + input_data
+
+
+@pytest.fixture(autouse=True)
+def isolated_route_cache(tmp_path, monkeypatch):
+    """Keep OSRM route caching out of the user's cache dir and fresh per test."""
+    monkeypatch.setattr(get_settings().routing, "cache_dir", str(tmp_path / "osrm-cache"))
+
+
+@pytest.fixture(autouse=True)
+def uncached_claude(monkeypatch):
+    """Call the (mocked) Claude CLI every time instead of reusing responses."""
+    monkeypatch.setattr("tour_guide.utils.claude_cli.CLAUDE_CACHE_ENABLED", False)
+
+
+@pytest.fixture(scope="session")
+def shared_test_agent():
+    """One concrete agent for read-only BaseAgent tests (logger built once, default settings)."""
+    return EchoAgent("test_agent", settings=Settings())
+
+
+@pytest.fixture
+def make_log_entry():
+    """
+    Build LogEntry objects from test_agent INFO defaults plus per-test overrides.
+
+    Timestamps count back from FIXED_TIMESTAMP by minutes_ago.
+    """
+
+    def make(minutes_ago=0, **overrides):
+        fields = dict(
+            timestamp=FIXED_TIMESTAMP - timedelta(minutes=minutes_ago),
+            level="INFO",
+            logger="tour_guide.agents.test_agent",
+            message="Test message",
+            module="test",
+            function="run",
+            line=1,
+            agent="test_agent",
+        )
+        fields.update(overrides)
+        return LogEntry(**fields)
+
+    return make
 
 
 @pytest.fixture
@@ -1,8 +1,16 @@
 """Tests for agent classes."""
 
+import itertools
+import json
+import logging
+import pickle
 import pytest
-from unittest.mock import Mock, patch, mock_open
-from tour_guide.agents.base import BaseAgent, AgentError
+from datetime import datetime
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import create_autospec
+import tour_guide.agents.base as agents_base
+from tour_guide.agents.base import BaseAgent, AgentError, _filter_lines, extract_json_block
 from tour_guide.agents.route_analyzer import RouteAnalyzerAgent
 from tour_guide.agents.youtube import YouTubeAgent
 from tour_guide.agents.spotify import SpotifyAgent
@@ -10,157 +18,379 @@ from tour_guide.agents.history import HistoryAgent
 from tour_guide.agents.judge import JudgeAgent
 from tour_guide.models import POI, POICategory, ContentResult, JudgmentResult
 from tour_guide.routing.models import Route, Waypoint, RouteStep
+from tour_guide.utils.claude_cli import ClaudeError, call_claude
+from tour_guide.config import get_settings
+from tour_guide.diagnosis import AgentStats, DiagnosticReport
+from tour_guide.skills.base import compile_template
+from tour_guide.skills.history_skill import HISTORY_PROMPT, format_history_prompt
+from tour_guide.skills.judge_skill import format_judge_prompt
+from tour_guide.skills.route_analyzer_skill import (
+    ROUTE_ANALYZER_PROMPT,
+    format_route_analyzer_prompt,
+)
+from tour_guide.skills.youtube_skill import format_youtube_prompt
+
+
+MOCK_LOG_CONTENT = """
+{"level": "INFO", "message": "agents.test_agent: Starting"}
+{"level": "INFO", "message": "agents.test_agent: Processing"}
+{"level": "INFO", "message": "agents.other_agent: Other log"}
+{"level": "INFO", "message": "agents.test_agent: Completed"}
+"""
+
+# Split once; text lines (with newlines) exactly as iterating the open log file yields them
+MOCK_LOG_LINES = tuple(MOCK_LOG_CONTENT.splitlines(keepends=True))
+
+
+MOCK_ROUTE_ANALYZER_RESPONSE = """```json
+{
+  "pois": [
+    {
+      "name": "Latrun Monastery",
+      "lat": 31.8356,
+      "lon": 34.9869,
+      "description": "Historic Trappist monastery with scenic views and wine production.",
+      "category": "religious",
+      "distance_from_start_km": 25.0
+    },
+    {
+      "name": "Mini Israel",
+      "lat": 31.8542,
+      "lon": 34.9869,
+      "description": "Miniature park featuring replicas of Israeli landmarks.",
+      "category": "entertainment",
+      "distance_from_start_km": 30.0
+    },
+    {
+      "name": "Emmaus Archaeological Site",
+      "lat": 31.8403,
+      "lon": 34.9869,
+      "description": "Ancient Roman and Byzantine ruins with historical significance.",
+      "category": "historical",
+      "distance_from_start_km": 35.0
+    }
+  ]
+}
+```"""
+
+
+MOCK_JUDGE_RESPONSE = """```json
+{
+  "selected": "history",
+  "reasoning": "The historical narrative provides the most educational value and is specifically relevant to the Eiffel Tower's significance.",
+  "scores": {
+    "youtube": 82,
+    "spotify": 68,
+    "history": 94
+  }
+}
+```"""
+
+
+MOCK_JUDGE_MISSING_FIELDS_RESPONSE = """```json
+{
+  "scores": {"youtube": 80, "spotify": 70, "history": 90}
+}
+```"""
+
+MOCK_JUDGE_INVALID_SELECTION_RESPONSE = """```json
+{
+  "selected": "podcast",
+  "reasoning": "Podcasts are great",
+  "scores": {"youtube": 80, "spotify": 70, "history": 90}
+}
+```"""
+
+MOCK_YOUTUBE_RESPONSE = """```json
+{
+  "video": {
+    "title": "Inside Latrun Monastery: A Journey Through Trappist Life",
+    "channel": "Sacred Sites",
+    "duration_estimate": "15 minutes",
+    "relevance_score": 90,
+    "description": "Explore the daily life of Trappist monks at Latrun Monastery",
+    "why_relevant": "Provides insight into the monastery's history and significance"
+  }
+}
+```"""
+
+
+MOCK_SPOTIFY_RESPONSE = """```json
+{
+  "music": {
+    "title": "Dead Sea Meditation",
+    "artist": "Desert Wind Ensemble",
+    "type": "album",
+    "genre": "Ambient/World",
+    "relevance_score": 85,
+    "description": "Contemplative instrumental music inspired by the Dead Sea landscape",
+    "why_relevant": "Captures the serene and otherworldly atmosphere of the Dead Sea region"
+  }
+}
+```"""
+
+
+MOCK_HISTORY_RESPONSE = """```json
+{
+  "story": {
+    "title": "The Last Stand at Masada",
+    "narrative": "In 73 CE, atop an isolated rock plateau overlooking the Dead Sea, 960 Jewish rebels made their last stand against the might of Rome. Led by Eleazar ben Ya'ir, these Zealots had fled Jerusalem after the destruction of the Second Temple in 70 CE. For nearly three years, they held out in King Herod's former palace-fortress, built a century earlier. The Roman Tenth Legion, under Flavius Silva, laid siege with 15,000 soldiers. When defeat became inevitable, rather than face slavery or execution, the defenders chose mass suicide. According to Josephus, they drew lots to select ten men who would kill the others, then one final man to kill the remaining nine before taking his own life. When the Romans finally breached the walls, they found only silence and bodies. Two women and five children, who had hidden in a cistern, survived to tell the tale.",
+    "key_facts": [
+      "Masada was built by Herod the Great between 37-31 BCE",
+      "The siege lasted from 73-74 CE during the First Jewish-Roman War",
+      "960 Zealots chose mass suicide over Roman enslavement",
+      "Archaeological excavations in the 1960s confirmed historical accounts"
+    ],
+    "relevance_score": 98,
+    "time_period": "73-74 CE",
+    "historical_figures": ["Eleazar ben Ya'ir", "Flavius Silva", "Josephus"]
+  }
+}
+```"""
+
+
+class ListHandler(logging.Handler):
+    """Logging handler that just collects formatted messages."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class FailingAgent(BaseAgent):
+    """Concrete agent whose run always raises."""
+
+    def run(self, input_data):
+        raise ValueError("Test error")
+
+
+@pytest.fixture
+def stub_claude(monkeypatch):
+    """Replace call_claude in an agent module with an autospec'd mock for one test."""
+
+    def stub(module, return_value=None, side_effect=None):
+        mock = create_autospec(call_claude, return_value=return_value, side_effect=side_effect)
+        monkeypatch.setattr(f"{module}.call_claude", mock)
+        return mock
+
+    return stub
+
+
+@pytest.fixture(autouse=True, scope="module")
+def quiet_logging():
+    """Drop log records before formatting/handlers; log_messages opts back in."""
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
 
 
 class TestBaseAgent:
     """Tests for BaseAgent class."""
 
     @pytest.fixture
-    def test_agent(self):
-        """Create a concrete test agent."""
-
-        class TestAgent(BaseAgent):
-            def run(self, input_data):
-                return f"Processed: {input_data}"
-
-        return TestAgent("test_agent")
+    def log_messages(self, shared_test_agent):
+        """Capture the test agent's INFO+ log messages in a plain list."""
+        # tour_guide.agents may be raised to WARNING once the parallel worker is imported
+        logger = shared_test_agent.logger
+        handler = ListHandler()
+        original_level = logger.level
+        logging.disable(logging.NOTSET)
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            yield handler.messages
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(original_level)
+            logging.disable(logging.CRITICAL)
 
-    def test_agent_initialization(self, test_agent):
+    def test_agent_initialization(self, shared_test_agent):
         """Test that agent initializes with logger."""
-        assert test_agent.agent_name == "test_agent"
-        assert test_agent.logger is not None
-        assert test_agent.settings is not None
+        assert shared_test_agent.agent_name == "test_agent"
+        assert shared_test_agent.logger is not None
+        assert shared_test_agent.settings is not None
 
-    def test_run_with_timeout_success(self, test_agent):
+    def test_agent_uses_injected_settings(self, shared_test_agent):
+        """Test that injected settings replace the global get_settings() result."""
+        assert shared_test_agent.settings is not get_settings()
+        assert shared_test_agent.settings.agents.max_retries == 2
+
+    def test_run_with_timeout_success(self, shared_test_agent):
         """Test successful execution with timeout."""
-        result = test_agent.run_with_timeout("test_input", timeout_seconds=5)
+        result = shared_test_agent.run_with_timeout("test_input", timeout_seconds=5)
         assert result == "Processed: test_input"
 
-    def test_run_with_timeout_logs_execution_time(self, test_agent):
+    def test_run_with_timeout_handles_errors(self):
+        """Test that the agent's error is re-raised."""
+        with pytest.raises(ValueError):
+            FailingAgent("failing_agent").run_with_timeout("test_input", timeout_seconds=5)
+
+    def test_run_with_timeout_logs_execution_time(
+        self, shared_test_agent, log_messages, monkeypatch
+    ):
         """Test that execution time is logged."""
-        with patch.object(test_agent.logger, "info") as mock_info:
-            test_agent.run_with_timeout("test_input", timeout_seconds=5)
+        # Deterministic clock: each reading advances by 1.5s
+        ticks = itertools.count(step=1.5)
+        monkeypatch.setattr("tour_guide.agents.base.perf_counter", lambda: next(ticks))
 
-            # Check that completion was logged with time
-            calls = [str(call) for call in mock_info.call_args_list]
-            assert any("completed successfully" in str(call) for call in calls)
+        shared_test_agent.run_with_timeout("test_input", timeout_seconds=5)
 
-    def test_run_with_timeout_handles_errors(self, test_agent):
-        """Test that errors are logged and re-raised."""
+        # Check that completion was logged with time
+        assert "test_agent completed successfully in 1.50s" in log_messages
 
-        class FailingAgent(BaseAgent):
-            def run(self, input_data):
-                raise ValueError("Test error")
+    def test_read_recent_logs_no_file(self, shared_test_agent, monkeypatch):
+        """Test reading logs when log file doesn't exist."""
+        # Drop all handlers to simulate no log file; monkeypatch restores the list
+        monkeypatch.setattr(logging.getLogger("tour_guide"), "handlers", [])
 
-        failing_agent = FailingAgent("failing_agent")
+        result = shared_test_agent._read_recent_logs(lines=10)
+        assert "No log file found" in result
 
+    def test_read_recent_logs_success(self, shared_test_agent, tmp_path):
+        """Test reading logs successfully."""
+        log_file = tmp_path / "tour_guide.log"
+        log_file.write_text(MOCK_LOG_CONTENT)
+
+        result = shared_test_agent._read_recent_logs(lines=10, log_path=log_file)
+
+        # Should contain test_agent logs
+        assert "agents.test_agent: Starting" in result
+        assert "agents.test_agent: Completed" in result
+        # Should NOT contain other agent's logs
+        assert "agents.other_agent" not in result
+
+    @pytest.mark.parametrize(
+        "response, expected",
+        [
+            ('{"a": 1}', '{"a": 1}'),
+            ('Here:\n```json\n{"a": 1}\n```\nDone', '{"a": 1}'),
+            ('```\n{"a": 1}\n```', '{"a": 1}'),
+            ('```\nnote\n```\n```json\n{"a": 1}\n```', '{"a": 1}'),
+        ],
+        ids=["bare", "json_fence", "plain_fence", "json_fence_preferred"],
+    )
+    def test_extract_json_block(self, response, expected):
+        """Test JSON extraction from fenced and unfenced Claude replies."""
+        assert extract_json_block(response) == expected
+
+    def test_extract_json_block_unclosed_fence(self):
+        """Test that an unclosed fence raises ValueError."""
         with pytest.raises(ValueError):
-            failing_agent.run_with_timeout("test_input")
+            extract_json_block('```json\n{"a": 1}')
 
-    def test_read_recent_logs_no_file(self, test_agent):
-        """Test reading logs when log file doesn't exist."""
-        # Temporarily remove all handlers to simulate no log file
-        import logging
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_load_json_parsers_agree(self, monkeypatch, use_orjson):
+        """Test load_json parses and raises json.JSONDecodeError with either parser."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(agents_base, "orjson", None)
 
-        root_logger = logging.getLogger("tour_guide")
-        original_handlers = root_logger.handlers.copy()
-        root_logger.handlers.clear()
+        assert agents_base.load_json('{"pois": [{"lat": 31.5}]}') == {"pois": [{"lat": 31.5}]}
+        with pytest.raises(json.JSONDecodeError):
+            agents_base.load_json("not valid json")
 
-        try:
-            result = test_agent._read_recent_logs(lines=10)
-            assert "No log file found" in result
-        finally:
-            # Restore handlers
-            for handler in original_handlers:
-                root_logger.addHandler(handler)
+    def test_filter_lines_keeps_only_agent_logs(self):
+        """Test the log filter on plain lines, without any file I/O."""
+        lines = [*MOCK_LOG_LINES, '{"message": "agents.test_agent_v2: Similar name"}\n']
 
-    def test_read_recent_logs_success(self, test_agent):
-        """Test reading logs successfully."""
-        mock_log_content = """
-{"level": "INFO", "message": "agents.test_agent: Starting"}
-{"level": "INFO", "message": "agents.test_agent: Processing"}
-{"level": "INFO", "message": "agents.other_agent: Other log"}
-{"level": "INFO", "message": "agents.test_agent: Completed"}
-"""
-        with patch("pathlib.Path.exists", return_value=True), patch(
-            "builtins.open", mock_open(read_data=mock_log_content)
-        ):
-            result = test_agent._read_recent_logs(lines=10)
-
-            # Should contain test_agent logs
-            assert "agents.test_agent: Starting" in result
-            assert "agents.test_agent: Completed" in result
-            # Should NOT contain other agent's logs
-            assert "agents.other_agent" not in result
-
-    def test_diagnose_no_logs(self, test_agent):
-        """Test diagnose when no logs are available."""
-        # Since test environment may not have logs, should return friendly message
-        try:
-            diagnosis = test_agent.diagnose(last_lines=10)
-            assert isinstance(diagnosis, str)
-            # Should contain either diagnosis or "no logs" message
-            assert len(diagnosis) > 0
-        except AgentError:
-            # Expected if logging not initialized - that's fine for unit test
-            pass
-
-    def test_diagnose_with_mock_logs(self, test_agent):
-        """Test diagnose with mocked log entries."""
-        from tour_guide.diagnosis import LogEntry, DiagnosticReport, AgentStats
-        from datetime import datetime
-        from pathlib import Path
-
-        # Mock the log directory
-        with patch.object(Path, 'exists', return_value=True):
-            with patch('tour_guide.diagnosis.LogParser') as mock_parser:
-                with patch('tour_guide.diagnosis.DiagnosticAnalyzer') as mock_analyzer:
-                    # Setup mock entries
-                    mock_entries = [
-                        LogEntry(
-                            timestamp=datetime.now(),
-                            level="INFO",
-                            logger="tour_guide.agents.test_agent",
-                            message="Test message",
-                            module="test",
-                            function="run",
-                            line=1,
-                            agent="test_agent"
-                        )
-                    ]
-
-                    mock_parser.return_value.parse_recent.return_value = mock_entries
-                    mock_parser.return_value.filter_by_agent.return_value = mock_entries
-
-                    # Setup mock report
-                    mock_report = DiagnosticReport(
-                        generated_at=datetime.now(),
-                        total_entries=1,
-                        error_count=0,
-                        warning_count=0,
-                        patterns=[],
-                        agent_stats={
-                            "test_agent": AgentStats(
-                                agent_name="test_agent",
-                                total_calls=1,
-                                success_count=1,
-                                failure_count=0,
-                                avg_execution_time=1.0,
-                                error_rate=0.0
-                            )
-                        },
-                        recommendations=["System operating normally"]
-                    )
-
-                    mock_analyzer.return_value.analyze.return_value = mock_report
-
-                    # Run diagnosis
-                    diagnosis = test_agent.diagnose(last_lines=10)
-
-                    # Verify result
-                    assert isinstance(diagnosis, str)
-                    assert "test_agent" in diagnosis.lower() or "TEST_AGENT" in diagnosis
-                    assert "Summary" in diagnosis
+        result = _filter_lines(lines, "test_agent")
+
+        assert result.count("agents.test_agent:") == 3
+        assert "agents.other_agent" not in result
+        assert "test_agent_v2" not in result
+        assert _filter_lines(lines, "missing_agent") == ""
+
+    def test_diagnose_no_logs(self, shared_test_agent, monkeypatch):
+        """Test diagnose when no log file handler is configured."""
+        monkeypatch.setattr(logging.getLogger("tour_guide"), "handlers", [])
+
+        diagnosis = shared_test_agent.diagnose(last_lines=10)
+
+        assert diagnosis == "No log directory found. Unable to run diagnostics."
+
+    @pytest.fixture
+    def diagnose_env(self, monkeypatch, make_log_entry):
+        """Swap LogParser/DiagnosticAnalyzer for plain stubs driven by the returned namespace."""
+        env = SimpleNamespace(
+            entries=[make_log_entry()],
+            report=None,
+            error=None,
+            analyzers_built=0,
+        )
+
+        def analyze(entries):
+            if env.error is not None:
+                raise env.error
+            return env.report
+
+        def make_analyzer():
+            env.analyzers_built += 1
+            return SimpleNamespace(analyze=analyze)
+
+        monkeypatch.setattr(
+            "tour_guide.diagnosis.LogParser",
+            lambda: SimpleNamespace(
+                parse_recent=lambda log_dir, hours: env.entries,
+                filter_by_agent=lambda entries, agent_name: entries,
+            ),
+        )
+        monkeypatch.setattr("tour_guide.diagnosis.DiagnosticAnalyzer", make_analyzer)
+        return env
+
+    @staticmethod
+    def _healthy_report():
+        return DiagnosticReport(
+            generated_at=datetime.now(),
+            total_entries=1,
+            error_count=0,
+            warning_count=0,
+            patterns=[],
+            agent_stats={
+                "test_agent": AgentStats(
+                    agent_name="test_agent",
+                    total_calls=1,
+                    success_count=1,
+                    failure_count=0,
+                    avg_execution_time=1.0,
+                    error_rate=0.0
+                )
+            },
+            recommendations=["System operating normally"]
+        )
+
+    def test_diagnose_with_mock_logs(self, shared_test_agent, diagnose_env):
+        """Test diagnose formats the analyzer's report."""
+        diagnose_env.report = self._healthy_report()
+
+        # Run diagnosis
+        diagnosis = shared_test_agent.diagnose(last_lines=10)
+
+        # Verify result
+        assert isinstance(diagnosis, str)
+        assert "test_agent" in diagnosis.lower() or "TEST_AGENT" in diagnosis
+        assert "Summary" in diagnosis
+
+    def test_diagnose_wraps_analyzer_error(self, shared_test_agent, diagnose_env):
+        """Test diagnose wraps an analyzer failure in AgentError."""
+        diagnose_env.error = RuntimeError("analyzer broke")
+
+        with pytest.raises(AgentError) as exc_info:
+            shared_test_agent.diagnose(last_lines=10)
+
+        assert "Diagnostic analysis failed: analyzer broke" in str(exc_info.value)
+
+    def test_diagnose_without_agent_entries_skips_analyzer(self, shared_test_agent, diagnose_env):
+        """Test diagnose returns early, without building an analyzer, for an idle agent."""
+        diagnose_env.entries = []
+
+        diagnosis = shared_test_agent.diagnose(last_lines=10)
+
+        assert diagnosis == "No recent log entries found for test_agent agent."
+        assert diagnose_env.analyzers_built == 0
 
 
 class TestPOI:
@@ -196,47 +426,49 @@ class TestPOI:
 
         assert poi.coordinates == (32.0, 34.0)
 
-    def test_poi_invalid_latitude(self):
-        """Test that invalid latitude raises ValueError."""
-        with pytest.raises(ValueError) as exc_info:
-            POI(
-                name="Invalid",
-                lat=100.0,  # > 90
-                lon=34.0,
-                description="Test",
-                category=POICategory.NATURAL,
-                distance_from_start_km=0.0,
-            )
-
-        assert "Invalid latitude" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field, value, message",
+        [
+            ("lat", 100.0, "Invalid latitude"),
+            ("lat", 90.01, "Invalid latitude"),
+            ("lat", -90.01, "Invalid latitude"),
+            ("lon", 200.0, "Invalid longitude"),
+            ("lon", 180.01, "Invalid longitude"),
+            ("lon", -180.01, "Invalid longitude"),
+            ("distance_from_start_km", -5.0, "Invalid distance"),
+            ("distance_from_start_km", -0.01, "Invalid distance"),
+        ],
+    )
+    def test_poi_out_of_range_values(self, field, value, message):
+        """Test that coordinates and distance just past their bounds raise ValueError."""
+        fields = dict(
+            name="Invalid",
+            lat=32.0,
+            lon=34.0,
+            description="Test",
+            category=POICategory.NATURAL,
+            distance_from_start_km=0.0,
+        )
+        fields[field] = value
 
-    def test_poi_invalid_longitude(self):
-        """Test that invalid longitude raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
-            POI(
-                name="Invalid",
-                lat=32.0,
-                lon=200.0,  # > 180
-                description="Test",
-                category=POICategory.NATURAL,
-                distance_from_start_km=0.0,
-            )
+            POI(**fields)
 
-        assert "Invalid longitude" in str(exc_info.value)
+        assert message in str(exc_info.value)
 
-    def test_poi_invalid_distance(self):
-        """Test that negative distance raises ValueError."""
-        with pytest.raises(ValueError) as exc_info:
-            POI(
-                name="Invalid",
-                lat=32.0,
-                lon=34.0,
-                description="Test",
-                category=POICategory.NATURAL,
-                distance_from_start_km=-5.0,  # Negative
-            )
+    @pytest.mark.parametrize("lat, lon", [(90.0, 180.0), (-90.0, -180.0)])
+    def test_poi_accepts_boundary_coordinates(self, lat, lon):
+        """Test that the coordinate bounds themselves are valid."""
+        poi = POI(
+            name="Edge",
+            lat=lat,
+            lon=lon,
+            description="Test",
+            category=POICategory.NATURAL,
+            distance_from_start_km=0.0,
+        )
 
-        assert "Invalid distance" in str(exc_info.value)
+        assert poi.coordinates == (lat, lon)
 
     def test_poi_category_from_string(self):
         """Test that category can be created from string."""
@@ -265,18 +497,56 @@ class TestPOI:
 
         assert "Invalid category" in str(exc_info.value)
 
+    def test_poi_uses_slots_and_pickles(self):
+        """Test that POI has no per-instance __dict__ and survives pickling."""
+        poi = POI(
+            name="Masada",
+            lat=31.3157,
+            lon=35.3540,
+            description="Ancient fortress overlooking the Dead Sea",
+            category=POICategory.HISTORICAL,
+            distance_from_start_km=45.2,
+        )
+
+        assert not hasattr(poi, "__dict__")
+        assert pickle.loads(pickle.dumps(poi)) == poi
+
+    def test_poi_worker_dict_round_trip(self):
+        """Test that the worker payload holds only primitives and rebuilds a POI."""
+        poi = POI(
+            name="Masada",
+            lat=31.3157,
+            lon=35.3540,
+            description="Ancient fortress overlooking the Dead Sea",
+            category=POICategory.HISTORICAL,
+            distance_from_start_km=45.2,
+        )
+
+        data = poi.to_worker_dict()
+        assert data == {
+            "name": "Masada",
+            "lat": 31.3157,
+            "lon": 35.3540,
+            "description": "Ancient fortress overlooking the Dead Sea",
+            "category": "historical",
+        }
+
+        rebuilt = POI.from_worker_dict(data)
+        assert rebuilt.name == poi.name
+        assert rebuilt.category == POICategory.HISTORICAL
+
 
 class TestRouteAnalyzerAgent:
     """Tests for Route Analyzer Agent."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def analyzer(self):
-        """Create route analyzer agent."""
+        """Create route analyzer agent (stateless, shared by the module)."""
         return RouteAnalyzerAgent()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_route(self):
-        """Create sample route for testing."""
+        """Create sample route for testing (never mutated)."""
         return Route(
             origin=(32.0853, 34.7818),  # Tel Aviv
             destination=(31.7683, 35.2137),  # Jerusalem
@@ -297,62 +567,25 @@ class TestRouteAnalyzerAgent:
             source="osrm",
         )
 
-    @pytest.fixture
-    def mock_claude_response(self):
-        """Mock Claude response with POIs."""
-        return """```json
-{
-  "pois": [
-    {
-      "name": "Latrun Monastery",
-      "lat": 31.8356,
-      "lon": 34.9869,
-      "description": "Historic Trappist monastery with scenic views and wine production.",
-      "category": "religious",
-      "distance_from_start_km": 25.0
-    },
-    {
-      "name": "Mini Israel",
-      "lat": 31.8542,
-      "lon": 34.9869,
-      "description": "Miniature park featuring replicas of Israeli landmarks.",
-      "category": "entertainment",
-      "distance_from_start_km": 30.0
-    },
-    {
-      "name": "Emmaus Archaeological Site",
-      "lat": 31.8403,
-      "lon": 34.9869,
-      "description": "Ancient Roman and Byzantine ruins with historical significance.",
-      "category": "historical",
-      "distance_from_start_km": 35.0
-    }
-  ]
-}
-```"""
-
     def test_analyzer_initialization(self, analyzer):
         """Test that analyzer initializes correctly."""
         assert analyzer.agent_name == "route_analyzer"
         assert analyzer.poi_count == 10
 
-    def test_run_with_valid_route(self, analyzer, sample_route, mock_claude_response):
+    def test_run_with_valid_route(self, analyzer, sample_route, stub_claude):
         """Test analyzing route returns POI list."""
-        with patch(
-            "tour_guide.agents.route_analyzer.call_claude"
-        ) as mock_claude:
-            mock_claude.return_value = mock_claude_response
+        stub_claude("tour_guide.agents.route_analyzer", return_value=MOCK_ROUTE_ANALYZER_RESPONSE)
 
-            pois = analyzer.run(sample_route)
+        pois = analyzer.run(sample_route)
 
-            assert isinstance(pois, list)
-            assert len(pois) == 3
-            assert all(isinstance(poi, POI) for poi in pois)
+        assert isinstance(pois, list)
+        assert len(pois) == 3
+        assert all(isinstance(poi, POI) for poi in pois)
 
-            # Check first POI
-            assert pois[0].name == "Latrun Monastery"
-            assert pois[0].category == POICategory.RELIGIOUS
-            assert pois[0].distance_from_start_km == 25.0
+        # Check first POI
+        assert pois[0].name == "Latrun Monastery"
+        assert pois[0].category == POICategory.RELIGIOUS
+        assert pois[0].distance_from_start_km == 25.0
 
     def test_run_with_invalid_input(self, analyzer):
         """Test that invalid input raises AgentError."""
@@ -369,13 +602,18 @@ class TestRouteAnalyzerAgent:
         """Test POI count for medium routes."""
         assert analyzer._determine_poi_count(40.0) == 5
 
+    @pytest.mark.parametrize("distance_km, expected", [(19.99, 3), (20.0, 5), (50.0, 10)])
+    def test_determine_poi_count_boundaries(self, analyzer, distance_km, expected):
+        """Test that each distance bound belongs to the longer bracket."""
+        assert analyzer._determine_poi_count(distance_km) == expected
+
     def test_determine_poi_count_long_route(self, analyzer):
         """Test POI count for long routes."""
         assert analyzer._determine_poi_count(100.0) == 10
 
-    def test_parse_response_success(self, analyzer, mock_claude_response):
+    def test_parse_response_success(self, analyzer):
         """Test parsing valid Claude response."""
-        pois = analyzer._parse_response(mock_claude_response)
+        pois = analyzer._parse_response(MOCK_ROUTE_ANALYZER_RESPONSE)
 
         assert len(pois) == 3
         assert pois[0].name == "Latrun Monastery"
@@ -398,19 +636,65 @@ class TestRouteAnalyzerAgent:
 
         assert "missing 'pois' field" in str(exc_info.value)
 
-    def test_run_handles_claude_error(self, analyzer, sample_route):
+    def test_run_handles_claude_error(self, analyzer, sample_route, stub_claude):
         """Test that Claude errors are handled properly."""
-        from tour_guide.utils.claude_cli import ClaudeError
+        stub_claude("tour_guide.agents.route_analyzer", side_effect=ClaudeError("CLI failed"))
 
-        with patch(
-            "tour_guide.agents.route_analyzer.call_claude"
-        ) as mock_claude:
-            mock_claude.side_effect = ClaudeError("CLI failed")
+        with pytest.raises(AgentError) as exc_info:
+            analyzer.run(sample_route)
+
+        assert "Claude CLI failed" in str(exc_info.value)
 
-            with pytest.raises(AgentError) as exc_info:
-                analyzer.run(sample_route)
 
-            assert "Claude CLI failed" in str(exc_info.value)
+class TestSkillTemplates:
+    """Tests for precompiled skill prompt templates."""
+
+    def test_compiled_template_matches_str_format(self):
+        """Test that compiled templates render exactly like str.format."""
+        template = 'Route {origin!r} {{"km": {distance:.1f}}} {{{{literal}}}} {origin}'
+        values = {"origin": "Tel Aviv", "distance": 64.987}
+
+        assert compile_template(template)(**values) == template.format(**values)
+
+    def test_compiled_template_rejects_positional_fields(self):
+        """Test that only named fields are accepted."""
+        with pytest.raises(ValueError):
+            compile_template("Hello {0}")
+
+    def test_skill_prompts_match_str_format(self):
+        """Test that every skill formatter still produces the original prompt."""
+        poi = {"poi_name": "Masada", "poi_description": "Fortress", "poi_category": "historical"}
+        assert format_history_prompt(**poi) == HISTORY_PROMPT.format(**poi)
+
+        route = {
+            "origin": "Tel Aviv",
+            "destination": "Jerusalem",
+            "distance_km": 65.43,
+            "duration_min": 74.6,
+            "waypoints_data": "1. 32.0853, 34.7818",
+            "named_places": "Highway 1",
+            "poi_count": 5,
+        }
+        assert format_route_analyzer_prompt(**route) == ROUTE_ANALYZER_PROMPT.format(**route)
+
+    def test_judge_prompt_truncates_and_defaults(self):
+        """Test long descriptions are cut at 200 chars and missing types get placeholders."""
+        result = ContentResult(
+            content_type="history",
+            title="Siege of Masada",
+            description="x" * 250,
+            relevance_score=90,
+        )
+        prompt = format_judge_prompt("Masada", [result])
+
+        assert "Description: " + "x" * 200 + "...\n" in prompt
+        assert "Relevance Score: 90" in prompt
+        assert prompt.count("Title: N/A") == 2
+
+    def test_skill_prompts_are_memoized(self):
+        """Test that repeated POIs reuse the formatted prompt."""
+        first = format_youtube_prompt("Masada", "Fortress", "historical")
+        assert format_youtube_prompt("Masada", "Fortress", "historical") is first
 
 
 class TestContentResult:
@@ -433,14 +717,15 @@ class TestContentResult:
         assert result.relevance_score == 85
         assert result.metadata["duration"] == "10:30"
 
-    def test_content_result_invalid_score(self):
-        """Test that invalid relevance score raises ValueError."""
+    @pytest.mark.parametrize("score", [150, 101, -1])
+    def test_content_result_invalid_score(self, score):
+        """Test that relevance scores outside 0-100 raise ValueError."""
         with pytest.raises(ValueError) as exc_info:
             ContentResult(
                 content_type="spotify",
                 title="Test",
                 description="Test",
-                relevance_score=150,  # > 100
+                relevance_score=score,
             )
 
         assert "Invalid relevance_score" in str(exc_info.value)
@@ -457,6 +742,19 @@ class TestContentResult:
 
         assert "Invalid content_type" in str(exc_info.value)
 
+    def test_content_result_uses_slots_and_pickles(self):
+        """Test that ContentResult has no per-instance __dict__ and survives pickling."""
+        result = ContentResult(
+            content_type="history",
+            title="Test",
+            description="Test",
+            relevance_score=75,
+            metadata={"time_period": "73-74 CE"},
+        )
+
+        assert not hasattr(result, "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
+
     def test_content_result_default_metadata(self):
         """Test that metadata defaults to empty dict."""
         result = ContentResult(
@@ -471,278 +769,169 @@ class TestContentResult:
         assert result.poi_name == ""
 
 
-class TestYouTubeAgent:
-    """Tests for YouTube Agent."""
+class ContentAgentCase(NamedTuple):
+    """One content agent plus the POI, mocked reply and result it should produce."""
 
-    @pytest.fixture
-    def youtube_agent(self):
-        """Create YouTube agent."""
-        return YouTubeAgent()
+    agent_cls: type
+    content_type: str
+    payload_field: str
+    poi: POI
+    response: str
+    title: str
+    relevance_score: int
+    min_description_len: int
+    metadata: dict
 
-    @pytest.fixture
-    def sample_poi(self):
-        """Create sample POI for testing."""
-        return POI(
-            name="Latrun Monastery",
-            lat=31.8356,
-            lon=34.9869,
-            description="Historic Trappist monastery with scenic views",
-            category=POICategory.RELIGIOUS,
-            distance_from_start_km=25.0,
-        )
+
+CONTENT_AGENT_CASES = [
+    pytest.param(
+        ContentAgentCase(
+            agent_cls=YouTubeAgent,
+            content_type="youtube",
+            payload_field="video",
+            poi=POI(
+                name="Latrun Monastery",
+                lat=31.8356,
+                lon=34.9869,
+                description="Historic Trappist monastery with scenic views",
+                category=POICategory.RELIGIOUS,
+                distance_from_start_km=25.0,
+            ),
+            response=MOCK_YOUTUBE_RESPONSE,
+            title="Inside Latrun Monastery: A Journey Through Trappist Life",
+            relevance_score=90,
+            min_description_len=1,
+            metadata={"channel": "Sacred Sites", "duration_estimate": "15 minutes"},
+        ),
+        id="youtube",
+    ),
+    pytest.param(
+        ContentAgentCase(
+            agent_cls=SpotifyAgent,
+            content_type="spotify",
+            payload_field="music",
+            poi=POI(
+                name="Dead Sea",
+                lat=31.5590,
+                lon=35.4732,
+                description="Lowest point on Earth with unique salt water",
+                category=POICategory.NATURAL,
+                distance_from_start_km=50.0,
+            ),
+            response=MOCK_SPOTIFY_RESPONSE,
+            title="Dead Sea Meditation",
+            relevance_score=85,
+            min_description_len=1,
+            metadata={"artist": "Desert Wind Ensemble", "genre": "Ambient/World"},
+        ),
+        id="spotify",
+    ),
+    pytest.param(
+        ContentAgentCase(
+            agent_cls=HistoryAgent,
+            content_type="history",
+            payload_field="story",
+            poi=POI(
+                name="Masada",
+                lat=31.3157,
+                lon=35.3540,
+                description="Ancient fortress on a rock plateau",
+                category=POICategory.HISTORICAL,
+                distance_from_start_km=100.0,
+            ),
+            response=MOCK_HISTORY_RESPONSE,
+            title="The Last Stand at Masada",
+            relevance_score=98,
+            min_description_len=301,  # full narrative, not a one-line summary
+            metadata={
+                "time_period": "73-74 CE",
+                "key_facts": [
+                    "Masada was built by Herod the Great between 37-31 BCE",
+                    "The siege lasted from 73-74 CE during the First Jewish-Roman War",
+                    "960 Zealots chose mass suicide over Roman enslavement",
+                    "Archaeological excavations in the 1960s confirmed historical accounts",
+                ],
+                "historical_figures": ["Eleazar ben Ya'ir", "Flavius Silva", "Josephus"],
+            },
+        ),
+        id="history",
+    ),
+]
+
+
+@pytest.mark.parametrize("case", CONTENT_AGENT_CASES, scope="module")
+class TestContentAgents:
+    """Tests shared by the YouTube, Spotify and History agents."""
+
+    @pytest.fixture(scope="module")
+    def agent(self, case):
+        """Create the agent under test once per case (agents are stateless)."""
+        return case.agent_cls()
 
     @pytest.fixture
-    def mock_youtube_response(self):
-        """Mock Claude response with video suggestion."""
-        return """```json
-{
-  "video": {
-    "title": "Inside Latrun Monastery: A Journey Through Trappist Life",
-    "channel": "Sacred Sites",
-    "duration_estimate": "15 minutes",
-    "relevance_score": 90,
-    "description": "Explore the daily life of Trappist monks at Latrun Monastery",
-    "why_relevant": "Provides insight into the monastery's history and significance"
-  }
-}
-```"""
+    def mock_claude(self, case, stub_claude):
+        """Stub call_claude in the agent's own module."""
+        return stub_claude(case.agent_cls.__module__)
+
+    def assert_matches_case(self, result, case):
+        """Check a parsed ContentResult against the case's expected values."""
+        assert isinstance(result, ContentResult)
+        assert result.content_type == case.content_type
+        assert result.title == case.title
+        assert result.relevance_score == case.relevance_score
+        assert len(result.description) >= case.min_description_len
+        assert {key: result.metadata[key] for key in case.metadata} == case.metadata
 
-    def test_youtube_agent_initialization(self, youtube_agent):
-        """Test that YouTube agent initializes correctly."""
-        assert youtube_agent.agent_name == "youtube"
+    def test_agent_initialization(self, agent, case):
+        """Test that the agent initializes with its content type as name."""
+        assert agent.agent_name == case.content_type
 
-    def test_run_with_valid_poi(self, youtube_agent, sample_poi, mock_youtube_response):
-        """Test finding video for POI."""
-        with patch("tour_guide.agents.youtube.call_claude") as mock_claude:
-            mock_claude.return_value = mock_youtube_response
+    def test_run_with_valid_poi(self, agent, case, mock_claude):
+        """Test finding content for a POI."""
+        mock_claude.return_value = case.response
 
-            result = youtube_agent.run(sample_poi)
+        result = agent.run(case.poi)
 
-            assert isinstance(result, ContentResult)
-            assert result.content_type == "youtube"
-            assert result.title == "Inside Latrun Monastery: A Journey Through Trappist Life"
-            assert result.relevance_score == 90
-            assert result.metadata["channel"] == "Sacred Sites"
-            assert result.metadata["duration_estimate"] == "15 minutes"
-            assert result.poi_name == "Latrun Monastery"
+        self.assert_matches_case(result, case)
+        assert result.poi_name == case.poi.name
 
-    def test_run_with_invalid_input(self, youtube_agent):
+    def test_run_with_invalid_input(self, agent):
         """Test that invalid input raises AgentError."""
         with pytest.raises(AgentError) as exc_info:
-            youtube_agent.run("not a poi")
+            agent.run("not a poi")
 
         assert "Expected POI object" in str(exc_info.value)
 
-    def test_parse_response_success(self, youtube_agent, mock_youtube_response):
+    def test_parse_response_success(self, agent, case):
         """Test parsing valid Claude response."""
-        result = youtube_agent._parse_response(mock_youtube_response, "Latrun Monastery")
+        result = agent._parse_response(case.response, case.poi.name)
 
-        assert result.title == "Inside Latrun Monastery: A Journey Through Trappist Life"
-        assert result.content_type == "youtube"
-        assert result.relevance_score == 90
+        self.assert_matches_case(result, case)
 
-    def test_parse_response_invalid_json(self, youtube_agent):
+    def test_parse_response_invalid_json(self, agent):
         """Test parsing invalid JSON raises error."""
         with pytest.raises(AgentError) as exc_info:
-            youtube_agent._parse_response("not valid json", "Test")
+            agent._parse_response("not valid json", "Test")
 
         assert "Failed to parse" in str(exc_info.value)
 
-    def test_parse_response_missing_video_field(self, youtube_agent):
-        """Test response missing video field raises error."""
+    def test_parse_response_missing_payload_field(self, agent, case):
+        """Test response missing the agent's payload field raises error."""
         response = '{"wrong_field": {}}'
 
         with pytest.raises(AgentError) as exc_info:
-            youtube_agent._parse_response(response, "Test")
+            agent._parse_response(response, "Test")
 
-        assert "missing 'video' field" in str(exc_info.value)
+        assert f"missing '{case.payload_field}' field" in str(exc_info.value)
 
-    def test_run_handles_claude_error(self, youtube_agent, sample_poi):
+    def test_run_handles_claude_error(self, agent, case, mock_claude):
         """Test that Claude errors are handled properly."""
-        from tour_guide.utils.claude_cli import ClaudeError
-
-        with patch("tour_guide.agents.youtube.call_claude") as mock_claude:
-            mock_claude.side_effect = ClaudeError("CLI failed")
-
-            with pytest.raises(AgentError) as exc_info:
-                youtube_agent.run(sample_poi)
-
-            assert "Claude CLI failed" in str(exc_info.value)
-
-
-class TestSpotifyAgent:
-    """Tests for Spotify Agent."""
-
-    @pytest.fixture
-    def spotify_agent(self):
-        """Create Spotify agent."""
-        return SpotifyAgent()
-
-    @pytest.fixture
-    def sample_poi(self):
-        """Create sample POI for testing."""
-        return POI(
-            name="Dead Sea",
-            lat=31.5590,
-            lon=35.4732,
-            description="Lowest point on Earth with unique salt water",
-            category=POICategory.NATURAL,
-            distance_from_start_km=50.0,
-        )
-
-    @pytest.fixture
-    def mock_spotify_response(self):
-        """Mock Claude response with music suggestion."""
-        return """```json
-{
-  "music": {
-    "title": "Dead Sea Meditation",
-    "artist": "Desert Wind Ensemble",
-    "type": "album",
-    "genre": "Ambient/World",
-    "relevance_score": 85,
-    "description": "Contemplative instrumental music inspired by the Dead Sea landscape",
-    "why_relevant": "Captures the serene and otherworldly atmosphere of the Dead Sea region"
-  }
-}
-```"""
-
-    def test_spotify_agent_initialization(self, spotify_agent):
-        """Test that Spotify agent initializes correctly."""
-        assert spotify_agent.agent_name == "spotify"
-
-    def test_run_with_valid_poi(self, spotify_agent, sample_poi, mock_spotify_response):
-        """Test finding music for POI."""
-        with patch("tour_guide.agents.spotify.call_claude") as mock_claude:
-            mock_claude.return_value = mock_spotify_response
-
-            result = spotify_agent.run(sample_poi)
-
-            assert isinstance(result, ContentResult)
-            assert result.content_type == "spotify"
-            assert result.title == "Dead Sea Meditation"
-            assert result.relevance_score == 85
-            assert result.metadata["artist"] == "Desert Wind Ensemble"
-            assert result.metadata["genre"] == "Ambient/World"
-            assert result.poi_name == "Dead Sea"
+        mock_claude.side_effect = ClaudeError("CLI failed")
 
-    def test_run_with_invalid_input(self, spotify_agent):
-        """Test that invalid input raises AgentError."""
-        with pytest.raises(AgentError) as exc_info:
-            spotify_agent.run("not a poi")
-
-        assert "Expected POI object" in str(exc_info.value)
-
-    def test_parse_response_success(self, spotify_agent, mock_spotify_response):
-        """Test parsing valid Claude response."""
-        result = spotify_agent._parse_response(mock_spotify_response, "Dead Sea")
-
-        assert result.title == "Dead Sea Meditation"
-        assert result.content_type == "spotify"
-        assert result.relevance_score == 85
-
-    def test_run_handles_claude_error(self, spotify_agent, sample_poi):
-        """Test that Claude errors are handled properly."""
-        from tour_guide.utils.claude_cli import ClaudeError
-
-        with patch("tour_guide.agents.spotify.call_claude") as mock_claude:
-            mock_claude.side_effect = ClaudeError("CLI failed")
-
-            with pytest.raises(AgentError) as exc_info:
-                spotify_agent.run(sample_poi)
-
-            assert "Claude CLI failed" in str(exc_info.value)
-
-
-class TestHistoryAgent:
-    """Tests for History Agent."""
-
-    @pytest.fixture
-    def history_agent(self):
-        """Create History agent."""
-        return HistoryAgent()
-
-    @pytest.fixture
-    def sample_poi(self):
-        """Create sample POI for testing."""
-        return POI(
-            name="Masada",
-            lat=31.3157,
-            lon=35.3540,
-            description="Ancient fortress on a rock plateau",
-            category=POICategory.HISTORICAL,
-            distance_from_start_km=100.0,
-        )
-
-    @pytest.fixture
-    def mock_history_response(self):
-        """Mock Claude response with historical narrative."""
-        return """```json
-{
-  "story": {
-    "title": "The Last Stand at Masada",
-    "narrative": "In 73 CE, atop an isolated rock plateau overlooking the Dead Sea, 960 Jewish rebels made their last stand against the might of Rome. Led by Eleazar ben Ya'ir, these Zealots had fled Jerusalem after the destruction of the Second Temple in 70 CE. For nearly three years, they held out in King Herod's former palace-fortress, built a century earlier. The Roman Tenth Legion, under Flavius Silva, laid siege with 15,000 soldiers. When defeat became inevitable, rather than face slavery or execution, the defenders chose mass suicide. According to Josephus, they drew lots to select ten men who would kill the others, then one final man to kill the remaining nine before taking his own life. When the Romans finally breached the walls, they found only silence and bodies. Two women and five children, who had hidden in a cistern, survived to tell the tale.",
-    "key_facts": [
-      "Masada was built by Herod the Great between 37-31 BCE",
-      "The siege lasted from 73-74 CE during the First Jewish-Roman War",
-      "960 Zealots chose mass suicide over Roman enslavement",
-      "Archaeological excavations in the 1960s confirmed historical accounts"
-    ],
-    "relevance_score": 98,
-    "time_period": "73-74 CE",
-    "historical_figures": ["Eleazar ben Ya'ir", "Flavius Silva", "Josephus"]
-  }
-}
-```"""
-
-    def test_history_agent_initialization(self, history_agent):
-        """Test that History agent initializes correctly."""
-        assert history_agent.agent_name == "history"
-
-    def test_run_with_valid_poi(self, history_agent, sample_poi, mock_history_response):
-        """Test generating narrative for POI."""
-        with patch("tour_guide.agents.history.call_claude") as mock_claude:
-            mock_claude.return_value = mock_history_response
-
-            result = history_agent.run(sample_poi)
-
-            assert isinstance(result, ContentResult)
-            assert result.content_type == "history"
-            assert result.title == "The Last Stand at Masada"
-            assert len(result.description) > 300  # Check narrative length
-            assert result.relevance_score == 98
-            assert len(result.metadata["key_facts"]) == 4
-            assert result.metadata["time_period"] == "73-74 CE"
-            assert result.poi_name == "Masada"
-
-    def test_run_with_invalid_input(self, history_agent):
-        """Test that invalid input raises AgentError."""
         with pytest.raises(AgentError) as exc_info:
-            history_agent.run("not a poi")
-
-        assert "Expected POI object" in str(exc_info.value)
-
-    def test_parse_response_success(self, history_agent, mock_history_response):
-        """Test parsing valid Claude response."""
-        result = history_agent._parse_response(mock_history_response, "Masada")
-
-        assert result.title == "The Last Stand at Masada"
-        assert result.content_type == "history"
-        assert result.relevance_score == 98
-        assert "Eleazar ben Ya'ir" in result.metadata["historical_figures"]
-
-    def test_run_handles_claude_error(self, history_agent, sample_poi):
-        """Test that Claude errors are handled properly."""
-        from tour_guide.utils.claude_cli import ClaudeError
-
-        with patch("tour_guide.agents.history.call_claude") as mock_claude:
-            mock_claude.side_effect = ClaudeError("CLI failed")
-
-            with pytest.raises(AgentError) as exc_info:
-                history_agent.run(sample_poi)
-
-            assert "Claude CLI failed" in str(exc_info.value)
+            agent.run(case.poi)
 
+        assert "Claude CLI failed" in str(exc_info.value)
 
 
 class TestJudgmentResult:
@@ -787,6 +976,19 @@ class TestJudgmentResult:
         assert result.selected_type == "history"
         assert result.scores["history"] == 95
 
+    def test_judgment_result_uses_slots_and_pickles(self, sample_content_history):
+        """Test that JudgmentResult has no per-instance __dict__ and survives pickling."""
+        result = JudgmentResult(
+            poi_name="Test POI",
+            selected_content=sample_content_history,
+            selected_type="history",
+            reasoning="Most educational.",
+            all_content=[sample_content_history],
+        )
+
+        assert not hasattr(result, "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
+
     def test_judgment_result_invalid_type(self, sample_content_history):
         """Test that invalid selected_type raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -817,14 +1019,14 @@ class TestJudgmentResult:
 class TestJudgeAgent:
     """Tests for JudgeAgent class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def judge_agent(self):
-        """Create a JudgeAgent instance."""
+        """Create a JudgeAgent instance (stateless, shared by the module)."""
         return JudgeAgent()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_content_list(self):
-        """Create sample content list with all three types."""
+        """Create sample content list with all three types (the judge never mutates it)."""
         return [
             ContentResult(
                 content_type="youtube",
@@ -898,22 +1100,9 @@ class TestJudgeAgent:
         assert result.selected_content == single_content[0]
         assert "by default" in result.reasoning
 
-    @patch("tour_guide.agents.judge.call_claude")
-    def test_judge_agent_evaluates_content(self, mock_claude, judge_agent, sample_content_list):
+    def test_judge_agent_evaluates_content(self, judge_agent, sample_content_list, stub_claude):
         """Test that JudgeAgent successfully evaluates multiple content options."""
-        # Mock Claude response
-        mock_response = """```json
-{
-  "selected": "history",
-  "reasoning": "The historical narrative provides the most educational value and is specifically relevant to the Eiffel Tower's significance.",
-  "scores": {
-    "youtube": 82,
-    "spotify": 68,
-    "history": 94
-  }
-}
-```"""
-        mock_claude.return_value = mock_response
+        stub_claude("tour_guide.agents.judge", return_value=MOCK_JUDGE_RESPONSE)
 
         result = judge_agent.run(sample_content_list)
 
@@ -925,10 +1114,21 @@ class TestJudgeAgent:
         assert result.scores["history"] == 94
         assert len(result.all_content) == 3
 
-    @patch("tour_guide.agents.judge.call_claude")
-    def test_judge_agent_fallback_on_claude_failure(self, mock_claude, judge_agent, sample_content_list):
-        """Test that JudgeAgent uses fallback selection when Claude fails."""
-        mock_claude.side_effect = Exception("Claude call failed")
+    @pytest.mark.parametrize(
+        "claude_stub",
+        [
+            {"side_effect": Exception("Claude call failed")},
+            {"return_value": "This is not valid JSON"},
+            {"return_value": MOCK_JUDGE_MISSING_FIELDS_RESPONSE},
+            {"return_value": MOCK_JUDGE_INVALID_SELECTION_RESPONSE},
+        ],
+        ids=["claude_error", "invalid_json", "missing_fields", "invalid_selection"],
+    )
+    def test_judge_agent_fallback(
+        self, judge_agent, sample_content_list, stub_claude, claude_stub
+    ):
+        """Test that JudgeAgent falls back to the highest score when Claude can't decide."""
+        stub_claude("tour_guide.agents.judge", **claude_stub)
 
         result = judge_agent.run(sample_content_list)
 
@@ -937,50 +1137,6 @@ class TestJudgeAgent:
         assert result.selected_type == "history"
         assert "highest relevance score" in result.reasoning
 
-    @patch("tour_guide.agents.judge.call_claude")
-    def test_judge_agent_fallback_on_invalid_json(self, mock_claude, judge_agent, sample_content_list):
-        """Test that JudgeAgent uses fallback when JSON parsing fails."""
-        mock_claude.return_value = "This is not valid JSON"
-
-        result = judge_agent.run(sample_content_list)
-
-        assert isinstance(result, JudgmentResult)
-        assert result.selected_type == "history"
-        assert "highest relevance score" in result.reasoning
-
-    @patch("tour_guide.agents.judge.call_claude")
-    def test_judge_agent_fallback_on_missing_fields(self, mock_claude, judge_agent, sample_content_list):
-        """Test that JudgeAgent uses fallback when response is missing fields."""
-        mock_response = """```json
-{
-  "scores": {"youtube": 80, "spotify": 70, "history": 90}
-}
-```"""
-        mock_claude.return_value = mock_response
-
-        result = judge_agent.run(sample_content_list)
-
-        assert isinstance(result, JudgmentResult)
-        assert "highest relevance score" in result.reasoning
-
-    @patch("tour_guide.agents.judge.call_claude")
-    def test_judge_agent_fallback_on_invalid_selection(self, mock_claude, judge_agent, sample_content_list):
-        """Test fallback when selected type doesn't match available content."""
-        mock_response = """```json
-{
-  "selected": "podcast",
-  "reasoning": "Podcasts are great",
-  "scores": {"youtube": 80, "spotify": 70, "history": 90}
-}
-```"""
-        mock_claude.return_value = mock_response
-
-        result = judge_agent.run(sample_content_list)
-
-        assert isinstance(result, JudgmentResult)
-        assert result.selected_type in ["youtube", "spotify", "history"]
-        assert "highest relevance score" in result.reasoning
-
     def test_judge_agent_tiebreaker_priority(self, judge_agent):
         """Test that tiebreaker uses correct priority: History > YouTube > Spotify."""
         # All have same score, should pick History
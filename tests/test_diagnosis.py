@@ -326,15 +326,15 @@ class TestDiagnosticAnalyzer:
         return DiagnosticAnalyzer()
 
     @pytest.fixture
-    def sample_entries_with_patterns(self):
+    def sample_entries_with_patterns(self, make_log_entry):
         """Create sample log entries with detectable patterns."""
         entries = []
 
         # Create frequent error pattern (same error 4 times)
         for i in range(4):
             entries.append(
-                LogEntry(
-                    timestamp=datetime.now() - timedelta(minutes=i),
+                make_log_entry(
+                    minutes_ago=i,
                     level="ERROR",
                     logger="tour_guide.agents.youtube",
                     message="Connection refused",
@@ -348,8 +348,8 @@ class TestDiagnosticAnalyzer:
         # Create timeout pattern (3 timeout errors)
         for i in range(3):
             entries.append(
-                LogEntry(
-                    timestamp=datetime.now() - timedelta(minutes=i + 5),
+                make_log_entry(
+                    minutes_ago=i + 5,
                     level="ERROR",
                     logger="tour_guide.agents.spotify",
                     message="Request timed out after 30s",
@@ -363,8 +363,8 @@ class TestDiagnosticAnalyzer:
         # Create slow operations (2 slow calls)
         for i in range(2):
             entries.append(
-                LogEntry(
-                    timestamp=datetime.now() - timedelta(minutes=i + 10),
+                make_log_entry(
+                    minutes_ago=i + 10,
                     level="INFO",
                     logger="tour_guide.agents.history",
                     message="Generated narrative",
@@ -379,8 +379,8 @@ class TestDiagnosticAnalyzer:
         # Add some successful operations
         for i in range(5):
             entries.append(
-                LogEntry(
-                    timestamp=datetime.now() - timedelta(minutes=i + 15),
+                make_log_entry(
+                    minutes_ago=i + 15,
                     level="INFO",
                     logger="tour_guide.agents.history",
                     message="Success",
@@ -501,15 +501,15 @@ class TestDiagnosticAnalyzer:
         assert report.warning_count == 0
         assert len(report.patterns) == 0
 
-    def test_high_error_rate_detection(self, analyzer):
+    def test_high_error_rate_detection(self, analyzer, make_log_entry):
         """Test detection of high error rate."""
         # Create entries with high error rate for one agent
         entries = []
         for i in range(10):
             level = "ERROR" if i < 4 else "INFO"  # 40% error rate
             entries.append(
-                LogEntry(
-                    timestamp=datetime.now() - timedelta(minutes=i),
+                make_log_entry(
+                    minutes_ago=i,
                     level=level,
                     logger="tour_guide.agents.youtube",
                     message=f"Message {i}",
@@ -1,6 +1,7 @@
 """Integration tests for queue-based pipeline."""
 
 import pytest
+import threading
 import time
 from unittest.mock import patch, MagicMock
 from tour_guide.parallel.pipeline import ContentPipeline
@@ -52,6 +53,7 @@ class TestQueuePipeline:
         assert pipeline.queue_manager is not None
         assert pipeline.parallel_executor is not None
         assert pipeline.judge_agent is not None
+        assert pipeline.queue_manager.backend == "thread"
 
     def test_pipeline_with_custom_components(self):
         """Test pipeline with custom queue manager."""
@@ -188,6 +190,132 @@ class TestQueuePipeline:
         assert len(judgments) == 1
         assert isinstance(judgments[0], JudgmentResult)
 
+    def test_pipeline_judges_pois_as_they_complete(self, sample_pois):
+        """Test that POIs finishing out of order still yield judgments in POI order."""
+        executor = MagicMock()
+        executor.iter_poi_results.return_value = iter(
+            [
+                (
+                    poi,
+                    [
+                        ContentResult(
+                            content_type="history",
+                            title="Result",
+                            description="Description",
+                            relevance_score=70,
+                            agent_name="history",
+                            poi_name=poi.name,
+                        )
+                    ],
+                )
+                for poi in reversed(sample_pois)
+            ]
+        )
+        pipeline = ContentPipeline(parallel_executor=executor)
+
+        judgments = pipeline.run(sample_pois)
+
+        assert [j.poi_name for j in judgments] == [poi.name for poi in sample_pois]
+        assert all(j.selected_type == "history" for j in judgments)
+        # POIs are handed to the executor directly, never through poi_queue
+        assert pipeline.queue_manager.get_stats()["poi_queue"] == 0
+
+    def test_pipeline_judges_concurrently(self):
+        """Test that slow judge calls for different POIs overlap."""
+        pois = [
+            POI(
+                name=f"Judge POI {i}",
+                lat=31.5,
+                lon=35.5,
+                description="Test",
+                category=POICategory.HISTORICAL,
+                distance_from_start_km=float(i),
+            )
+            for i in range(4)
+        ]
+        executor = MagicMock()
+        executor.iter_poi_results.return_value = iter(
+            [
+                (
+                    poi,
+                    [
+                        ContentResult(
+                            content_type="youtube",
+                            title="Result",
+                            description="Description",
+                            relevance_score=60,
+                            agent_name="youtube",
+                            poi_name=poi.name,
+                        )
+                    ],
+                )
+                for poi in pois
+            ]
+        )
+
+        # Every judge call waits for the others; sequential judging breaks the barrier
+        all_judging = threading.Barrier(len(pois), timeout=5)
+
+        def gated_judge(results):
+            all_judging.wait()
+            return JudgmentResult(
+                poi_name=results[0].poi_name,
+                selected_content=results[0],
+                selected_type="youtube",
+                reasoning="Only option",
+                scores={"youtube": 60},
+                all_content=results,
+            )
+
+        judge = MagicMock()
+        judge.run.side_effect = gated_judge
+        pipeline = ContentPipeline(parallel_executor=executor, judge_agent=judge)
+
+        judgments = pipeline.run(pois)
+
+        assert [j.poi_name for j in judgments] == [poi.name for poi in pois]
+        assert all(j.reasoning == "Only option" for j in judgments)
+
+    def test_pipeline_does_not_block_on_unread_queues(self, sample_pois):
+        """Test that output queues nobody drains drop batches instead of blocking runs."""
+        executor = MagicMock()
+        executor.iter_poi_results.side_effect = lambda pois: iter(
+            [
+                (
+                    poi,
+                    [
+                        ContentResult(
+                            content_type="youtube",
+                            title="Result",
+                            description="Description",
+                            relevance_score=60,
+                            agent_name="youtube",
+                            poi_name=poi.name,
+                        )
+                    ],
+                )
+                for poi in pois
+            ]
+        )
+        judge = MagicMock()
+        judge.run.side_effect = Exception("no judge")
+        queue_manager = QueueManager(results_queue_size=1, judgment_queue_size=1, backend="thread")
+        pipeline = ContentPipeline(
+            queue_manager=queue_manager, parallel_executor=executor, judge_agent=judge
+        )
+
+        # A reused pipeline with more POIs than results_queue_size
+        for _ in range(2):
+            judgments = pipeline.run(sample_pois)
+            assert len(judgments) == len(sample_pois)
+
+        # Stats count batches: the one result batch and one judgment batch that fit
+        assert pipeline.get_stats()["queue_stats"] == {
+            "poi_queue": 0,
+            "results_queue": 1,
+            "judgment_queue": 1,
+        }
+
     def test_pipeline_stats(self, sample_pois):
         """Test getting pipeline statistics."""
         pipeline = ContentPipeline()
@@ -206,6 +334,7 @@ class TestQueuePipeline:
 class TestPipelinePerformance:
     """Performance tests for pipeline."""
 
+    @pytest.mark.serial
     def test_parallel_vs_sequential_speedup(self):
         """Test that parallel execution provides speedup."""
         # Skip in CI
@@ -374,6 +503,29 @@ class TestOrchestrator:
                 assert result.stats["total_pois"] == 0
                 assert result.stats["success_rate"] == 0.0
 
+    def test_process_pois_empty_skips_pipeline(self, orchestrator):
+        """Test that an empty POI list never reaches the content pipeline."""
+        with patch.object(orchestrator.content_pipeline, "run") as mock_pipeline:
+            assert orchestrator._process_pois([]) == []
+            assert mock_pipeline.call_count == 0
+
+    def test_journey_result_compact(self, mock_route):
+        """Test that compact() drops waypoints but keeps route totals."""
+        result = JourneyResult(
+            route=mock_route,
+            pois=[],
+            judgments=[],
+            execution_time=1.0,
+            stats={},
+        )
+
+        result.compact()
+
+        assert result.route.waypoints == []
+        assert result.route.total_distance_km == 65.0
+        assert len(mock_route.waypoints) == 3  # Original route untouched
+        assert "0 waypoints" in repr(result)
+
     def test_error_handling_route_failure(self, orchestrator):
         """Test error handling when route planning fails."""
         with patch.object(orchestrator.osrm_client, "get_route", side_effect=Exception("Route error")):
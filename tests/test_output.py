@@ -233,6 +233,17 @@ class TestJSONExporter:
         assert journey_data["summary"]["total_pois"] == 2
         assert "content_distribution" in journey_data["summary"]
 
+    def test_to_dict_reuses_stats_distribution(
+        self, exporter, sample_route, sample_pois, sample_judgments
+    ):
+        """Test that a precomputed content_distribution is reused as-is."""
+        stats = {"content_distribution": {"history": 2}}
+        journey_data = exporter.to_dict(
+            sample_route, sample_pois, sample_judgments, stats=stats
+        )
+
+        assert journey_data["summary"]["content_distribution"] is stats["content_distribution"]
+
     def test_export_to_file(self, exporter, sample_route, sample_pois, sample_judgments):
         """Test exporting to JSON file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,15 +1,53 @@
 """Tests for parallel execution of content agents."""
 
+import multiprocessing as mp
+import os
+import pickle
 import pytest
+import threading
 import time
+from functools import partial
+from multiprocessing import shared_memory
 from unittest.mock import patch, Mock
-from tour_guide.parallel.worker import content_worker, batch_content_worker
-from tour_guide.parallel.executor import ParallelExecutor
+from tour_guide.parallel.worker import (
+    _AGENT_CLASSES,
+    batch_content_worker,
+    content_worker,
+    shared_content_worker,
+)
+from tour_guide.parallel.executor import (
+    AGENT_TYPES,
+    ParallelExecutor,
+    _mp_context,
+    _timeout_result,
+)
 from tour_guide.models.poi import POI, POICategory
 from tour_guide.models.content import ContentResult
 from tour_guide.agents.base import AgentError
 
 
+class _FakeAgent:
+    """Picklable stand-in for a content agent that answers without calling Claude."""
+
+    def __init__(self, agent_type):
+        self.agent_type = agent_type
+
+    def run(self, poi):
+        return ContentResult(
+            content_type=self.agent_type,
+            title=f"{self.agent_type} for {poi.name}",
+            description="Description",
+            relevance_score=80,
+            agent_name=self.agent_type,
+            poi_name=poi.name,
+        )
+
+
+def _crashing_worker(agent_type, poi):
+    """Stand-in content worker that kills its worker process."""
+    os._exit(1)
+
+
 class TestContentWorker:
     """Tests for content_worker function."""
 
@@ -27,7 +65,8 @@ class TestContentWorker:
 
     def test_content_worker_youtube(self, sample_poi):
         """Test content_worker with YouTube agent."""
-        with patch("tour_guide.parallel.worker.YouTubeAgent") as MockYouTube:
+        with patch.dict(_AGENT_CLASSES, youtube=Mock()):
+            MockYouTube = _AGENT_CLASSES["youtube"]
             mock_agent = Mock()
             mock_result = ContentResult(
                 content_type="youtube",
@@ -44,12 +83,13 @@ class TestContentWorker:
 
             assert result.content_type == "youtube"
             assert result.relevance_score == 85
-            MockYouTube.assert_called_once()
+            assert MockYouTube.call_count == 1
             mock_agent.run.assert_called_once_with(sample_poi)
 
     def test_content_worker_spotify(self, sample_poi):
         """Test content_worker with Spotify agent."""
-        with patch("tour_guide.parallel.worker.SpotifyAgent") as MockSpotify:
+        with patch.dict(_AGENT_CLASSES, spotify=Mock()):
+            MockSpotify = _AGENT_CLASSES["spotify"]
             mock_agent = Mock()
             mock_result = ContentResult(
                 content_type="spotify",
@@ -69,7 +109,8 @@ class TestContentWorker:
 
     def test_content_worker_history(self, sample_poi):
         """Test content_worker with History agent."""
-        with patch("tour_guide.parallel.worker.HistoryAgent") as MockHistory:
+        with patch.dict(_AGENT_CLASSES, history=Mock()):
+            MockHistory = _AGENT_CLASSES["history"]
             mock_agent = Mock()
             mock_result = ContentResult(
                 content_type="history",
@@ -96,7 +137,8 @@ class TestContentWorker:
 
     def test_content_worker_handles_agent_failure(self, sample_poi):
         """Test that content_worker returns error result when agent fails."""
-        with patch("tour_guide.parallel.worker.YouTubeAgent") as MockYouTube:
+        with patch.dict(_AGENT_CLASSES, youtube=Mock()):
+            MockYouTube = _AGENT_CLASSES["youtube"]
             mock_agent = Mock()
             mock_agent.run.side_effect = AgentError("Test error")
             MockYouTube.return_value = mock_agent
@@ -110,10 +152,29 @@ class TestContentWorker:
             assert "Test error" in result.description
             assert "error" in result.metadata
 
+    def test_shared_content_worker(self, sample_poi):
+        """Test shared_content_worker reads the POI from a shared memory block."""
+        data = pickle.dumps(sample_poi.to_worker_dict())
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        block.buf[: len(data)] = data
+
+        try:
+            with patch("tour_guide.parallel.worker.content_worker") as mock_worker:
+                shared_content_worker("history", block.name)
+
+            agent_type, poi = mock_worker.call_args.args
+            assert agent_type == "history"
+            assert poi.name == sample_poi.name
+            assert poi.category == sample_poi.category
+        finally:
+            block.close()
+            block.unlink()
+
     def test_batch_content_worker(self, sample_poi):
         """Test batch_content_worker processes multiple tasks."""
-        with patch("tour_guide.parallel.worker.YouTubeAgent") as MockYouTube, \
-             patch("tour_guide.parallel.worker.SpotifyAgent") as MockSpotify:
+        with patch.dict(_AGENT_CLASSES, youtube=Mock(), spotify=Mock()):
+            MockYouTube = _AGENT_CLASSES["youtube"]
+            MockSpotify = _AGENT_CLASSES["spotify"]
 
             # Setup YouTube mock
             youtube_agent = Mock()
@@ -188,10 +249,265 @@ class TestParallelExecutor:
             for i in range(3)
         ]
 
+    @pytest.fixture
+    def fake_agents(self, monkeypatch):
+        """Swap the worker's agent classes for fakes; forked pool workers inherit the swap."""
+        monkeypatch.setattr(
+            "tour_guide.parallel.worker._AGENT_CLASSES",
+            {agent_type: partial(_FakeAgent, agent_type) for agent_type in _AGENT_CLASSES},
+        )
+        # Threads left over from earlier tests would otherwise select forkserver,
+        # whose workers re-import the real agent classes
+        monkeypatch.setattr(
+            "tour_guide.parallel.executor._mp_context", lambda: mp.get_context("fork")
+        )
+
     def test_executor_initialization(self, executor):
         """Test ParallelExecutor initializes with correct timeout."""
         assert executor.timeout == 30
 
+    def test_pool_reused_across_pois(self, sample_pois, fake_agents):
+        """Test that one worker pool serves every POI until close()."""
+        with ParallelExecutor(timeout=30) as executor:
+            executor.process_poi(sample_pois[0])
+            pool = executor._pool
+            assert pool is not None
+
+            executor.process_poi(sample_pois[1])
+            assert executor._pool is pool
+
+        assert executor._pool is None
+
+    def test_timeout_keeps_pool_and_fast_results(self, sample_poi):
+        """Test that a slow agent times out without tearing down the pool."""
+        def fake_worker(agent_type, poi):
+            if agent_type == "history":
+                time.sleep(2)
+            return ContentResult(
+                content_type=agent_type,
+                title="Result",
+                description="Description",
+                relevance_score=80,
+                agent_name=agent_type,
+                poi_name=poi.name,
+            )
+
+        with patch("tour_guide.parallel.executor.content_worker", side_effect=fake_worker):
+            with ParallelExecutor(timeout=1) as executor:
+                results = executor.process_poi(sample_poi)
+                pool = executor._pool
+
+                assert [r.relevance_score for r in results] == [80, 80, 0]
+                assert results[2].metadata["error"] == "timeout"
+                assert executor._pool is pool
+
+    def test_iter_poi_results_yields_in_completion_order(self, sample_pois):
+        """Test that a POI is yielded as soon as its own agents finish."""
+        def fake_worker(agent_type, poi):
+            if poi.name == "POI 0":
+                time.sleep(0.5)
+            return ContentResult(
+                content_type=agent_type,
+                title="Result",
+                description="Description",
+                relevance_score=80,
+                agent_name=agent_type,
+                poi_name=poi.name,
+            )
+
+        with patch("tour_guide.parallel.executor.content_worker", side_effect=fake_worker):
+            with ParallelExecutor(timeout=30, max_workers=9) as executor:
+                completed = list(executor.iter_poi_results(sample_pois))
+
+        assert completed[-1][0].name == "POI 0"
+        for poi, results in completed:
+            assert [r.content_type for r in results] == ["youtube", "spotify", "history"]
+            assert all(r.poi_name == poi.name for r in results)
+
+    def test_timeout_results_from_template(self):
+        """Test that templated timeout results are per-POI and never share metadata."""
+        first = _timeout_result("spotify", "POI A", 30)
+        second = _timeout_result("spotify", "POI B", 30)
+
+        assert (first.poi_name, second.poi_name) == ("POI A", "POI B")
+        assert first.title == "Error: spotify agent timeout"
+        assert first.description == "Agent exceeded timeout of 30s"
+        assert first.url.startswith("https://open.spotify.com/search/")
+        first.metadata["seen"] = True
+        assert second.metadata == {"error": "timeout"}
+
+    def test_process_all_pois_summary_counts(self, sample_pois, caplog):
+        """Test the summary log counts every result and only the successful ones."""
+        def fake_worker(agent_type, poi):
+            return ContentResult(
+                content_type=agent_type,
+                title="Result",
+                description="Description",
+                relevance_score=80 if agent_type == "history" else 0,
+                agent_name=agent_type,
+                poi_name=poi.name,
+            )
+
+        with patch("tour_guide.parallel.executor.content_worker", side_effect=fake_worker):
+            with ParallelExecutor(timeout=30) as executor:
+                with caplog.at_level("INFO", logger="tour_guide.parallel.executor"):
+                    executor.process_all_pois(sample_pois)
+
+        assert "9 total results, 3 successful" in caplog.text
+
+    def test_process_poi_pool_failure(self, executor, sample_poi):
+        """Test that a pool failure yields one error result per agent."""
+        with patch.object(executor, "_get_pool", side_effect=RuntimeError("pool down")):
+            results = executor.process_poi(sample_poi)
+
+        assert [r.content_type for r in results] == ["youtube", "spotify", "history"]
+        assert all(r.relevance_score == 0 for r in results)
+        assert all(
+            r.metadata == {"error": "pool down", "error_type": "RuntimeError"} for r in results
+        )
+
+    def test_batched_runs_batch_pois_together(self, sample_pois):
+        """Test that the POIs of one batch share the pool concurrently."""
+        # All 9 agent tasks must be running at once for any of them to get past this
+        all_running = threading.Barrier(9, timeout=5)
+
+        def gated_worker(agent_type, poi):
+            all_running.wait()
+            return ContentResult(
+                content_type=agent_type,
+                title="Result",
+                description="Description",
+                relevance_score=80,
+                agent_name=agent_type,
+                poi_name=poi.name,
+            )
+
+        with patch("tour_guide.parallel.executor.content_worker", side_effect=gated_worker):
+            with ParallelExecutor(timeout=30, max_workers=9) as executor:
+                results_by_poi = executor.process_all_pois_batched(sample_pois, batch_size=3)
+
+        assert list(results_by_poi) == [poi.name for poi in sample_pois]
+        assert all(len(results) == 3 for results in results_by_poi.values())
+        assert all(r.relevance_score == 80 for results in results_by_poi.values() for r in results)
+
+    def test_iter_poi_results_timeout_fills_every_slot(self, sample_pois):
+        """Test that a batch timeout reports slow agents and keeps finished ones."""
+        def fake_worker(agent_type, poi):
+            if poi.name == "POI 2" and agent_type == "history":
+                time.sleep(4)
+            return ContentResult(
+                content_type=agent_type,
+                title="Result",
+                description="Description",
+                relevance_score=80,
+                agent_name=agent_type,
+                poi_name=poi.name,
+            )
+
+        with patch("tour_guide.parallel.executor.content_worker", side_effect=fake_worker):
+            with ParallelExecutor(timeout=1, max_workers=9) as executor:
+                completed = dict(
+                    (poi.name, results) for poi, results in executor.iter_poi_results(sample_pois)
+                )
+
+        assert set(completed) == {"POI 0", "POI 1", "POI 2"}
+        assert all(r is not None for results in completed.values() for r in results)
+        assert [r.relevance_score for r in completed["POI 2"]] == [80, 80, 0]
+        assert completed["POI 2"][2].metadata["error"] == "timeout"
+
+    def test_invalid_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            ParallelExecutor(backend="gpu")
+
+        assert "Invalid backend" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "platform,threads,method",
+        [
+            ("linux", 1, "fork"),
+            ("linux", 2, "forkserver"),
+            ("darwin", 1, "spawn"),
+            ("win32", 1, "spawn"),
+        ],
+    )
+    def test_mp_context_per_platform(self, platform, threads, method):
+        """Test that fork is used only on Linux, and only while no other thread runs."""
+        with patch("tour_guide.parallel.executor.sys.platform", platform), patch(
+            "tour_guide.parallel.executor.threading.active_count", return_value=threads
+        ):
+            assert _mp_context().get_start_method() == method
+
+    def test_process_backend(self, sample_poi, fake_agents):
+        """Test processing a POI in worker processes instead of threads."""
+        with ParallelExecutor(timeout=30, backend="process") as executor:
+            results = executor.process_poi(sample_poi)
+
+        assert [r.title for r in results] == [
+            f"{agent_type} for {sample_poi.name}" for agent_type in AGENT_TYPES
+        ]
+
+    def test_process_backend_all_pois(self, sample_pois, fake_agents):
+        """Test processing several POIs shared with worker processes."""
+        with ParallelExecutor(timeout=30, backend="process") as executor:
+            results_by_poi = executor.process_all_pois(sample_pois)
+
+        assert list(results_by_poi) == [poi.name for poi in sample_pois]
+        for poi_name, results in results_by_poi.items():
+            assert [r.title for r in results] == [
+                f"{agent_type} for {poi_name}" for agent_type in AGENT_TYPES
+            ]
+
+    def test_process_backend_recovers_from_crashed_worker(
+        self, sample_poi, sample_pois, fake_agents
+    ):
+        """Test that a worker crash fails only its own POIs and the pool is rebuilt."""
+        with ParallelExecutor(timeout=30, backend="process") as executor:
+            with patch("tour_guide.parallel.executor.content_worker", _crashing_worker):
+                results = executor.process_poi(sample_poi)
+
+            assert all(r.metadata["error_type"] == "BrokenProcessPool" for r in results)
+            assert executor._pool is None
+
+            with patch("tour_guide.parallel.executor.shared_content_worker", _crashing_worker):
+                results_by_poi = executor.process_all_pois(sample_pois)
+
+            assert all(
+                r.metadata["error_type"] == "BrokenProcessPool"
+                for results in results_by_poi.values()
+                for r in results
+            )
+            assert executor._pool is None
+
+            results = executor.process_poi(sample_poi)
+
+        assert [r.title for r in results] == [
+            f"{agent_type} for {sample_poi.name}" for agent_type in AGENT_TYPES
+        ]
+
+    def test_process_backend_chunks_tasks(self, sample_pois, fake_agents):
+        """Test that more tasks than workers are sent to process workers in chunks."""
+        with ParallelExecutor(timeout=30, max_workers=3, backend="process") as executor:
+            pool = executor._get_pool()
+            with patch.object(pool, "submit", wraps=pool.submit) as mock_submit:
+                results_by_poi = executor.process_all_pois_batched(sample_pois, batch_size=3)
+
+        # 9 tasks on 3 workers: one batch_content_worker call per worker
+        assert mock_submit.call_count == 3
+        assert all(c.args[0] is batch_content_worker for c in mock_submit.call_args_list)
+
+        # Each chunk is one contiguous run of (POI, agent) tasks, in task order
+        assert [
+            [(agent_type, poi["name"]) for agent_type, poi in c.args[1]]
+            for c in mock_submit.call_args_list
+        ] == [[(agent_type, poi.name) for agent_type in AGENT_TYPES] for poi in sample_pois]
+
+        assert list(results_by_poi) == [poi.name for poi in sample_pois]
+        for poi_name, results in results_by_poi.items():
+            assert [r.title for r in results] == [
+                f"{agent_type} for {poi_name}" for agent_type in AGENT_TYPES
+            ]
+
     def test_process_poi_success(self, executor, sample_poi):
         """Test processing a single POI with all agents succeeding."""
         # Use real agents - this is an integration test
@@ -242,6 +558,7 @@ class TestParallelExecutor:
             # All results should have correct POI name
             assert all(r.poi_name == poi_name for r in results)
 
+    @pytest.mark.serial
     def test_parallel_speedup(self, sample_poi):
         """Test that parallel execution is faster than sequential."""
         # This is a real test without mocks to verify actual parallel execution
@@ -14,10 +14,12 @@ from tour_guide.models.judgment import JudgmentResult
 class TestQueueManager:
     """Tests for QueueManager class."""
 
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance."""
-        return QueueManager(poi_queue_size=5, results_queue_size=10, judgment_queue_size=5)
+    @pytest.fixture(params=["mp", "thread"])
+    def queue_manager(self, request):
+        """Create a QueueManager instance for each backend."""
+        return QueueManager(
+            poi_queue_size=5, results_queue_size=10, judgment_queue_size=5, backend=request.param
+        )
 
     @pytest.fixture
     def sample_poi(self):
@@ -61,6 +63,13 @@ class TestQueueManager:
         assert queue_manager.results_queue_size == 10
         assert queue_manager.judgment_queue_size == 5
 
+    def test_invalid_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            QueueManager(backend="redis")
+
+        assert "Invalid backend" in str(exc_info.value)
+
     def test_put_and_get_poi(self, queue_manager, sample_poi):
         """Test putting and getting POI from queue."""
         queue_manager.put_poi(sample_poi)
@@ -88,6 +97,23 @@ class TestQueueManager:
         assert retrieved_judgment.selected_type == sample_judgment.selected_type
         assert retrieved_judgment.reasoning == sample_judgment.reasoning
 
+    def test_put_and_get_results_batch(self, queue_manager, sample_result):
+        """Test that a result batch is enqueued as a single item."""
+        queue_manager.put_results_batch([sample_result, sample_result, sample_result])
+        retrieved = queue_manager.get_results_batch(timeout=1)
+
+        assert len(retrieved) == 3
+        assert all(r.title == sample_result.title for r in retrieved)
+        with pytest.raises(Empty):
+            queue_manager.get_results_batch(block=False)
+
+    def test_put_and_get_judgments_batch(self, queue_manager, sample_judgment):
+        """Test that a judgment batch round-trips as one list."""
+        queue_manager.put_judgments_batch([sample_judgment, sample_judgment])
+        retrieved = queue_manager.get_judgments_batch(timeout=1)
+
+        assert [j.poi_name for j in retrieved] == ["Test POI", "Test POI"]
+
     def test_bounded_poi_queue_blocks(self, queue_manager, sample_poi):
         """Test that poi_queue blocks when full."""
         # Fill the queue to capacity (size=5)
@@ -161,6 +187,16 @@ class TestQueueManager:
         with pytest.raises(Empty):
             queue_manager.get_judgment(block=False)
 
+    def test_clear_all_frees_bounded_queue(self, queue_manager, sample_poi):
+        """Test that a full queue accepts new items after clearing."""
+        for _ in range(5):
+            queue_manager.put_poi(sample_poi)
+
+        queue_manager.clear_all()
+
+        queue_manager.put_poi(sample_poi, timeout=1)
+        assert queue_manager.get_poi(timeout=1).name == sample_poi.name
+
     def test_get_stats(self, queue_manager):
         """Test getting queue statistics."""
         stats = queue_manager.get_stats()
@@ -9,6 +9,30 @@ from tour_guide.routing.models import Route
 from tour_guide.utils.claude_cli import call_claude, ClaudeError
 
 
+MOCK_CLAUDE_ROUTE = """```json
+{
+  "distance_km": 65.0,
+  "duration_minutes": 75.0,
+  "waypoints": [
+    {"lat": 32.0853, "lon": 34.7818, "distance_from_start_km": 0.0},
+    {"lat": 32.0, "lon": 35.0, "distance_from_start_km": 30.0},
+    {"lat": 31.7683, "lon": 35.2137, "distance_from_start_km": 65.0}
+  ],
+  "steps": [
+    {"instruction": "Head east on Highway 1", "distance_km": 30.0, "duration_min": 25.0},
+    {"instruction": "Continue on Road 443", "distance_km": 35.0, "duration_min": 50.0}
+  ]
+}
+```"""
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json():
+    """Decode OSRM responses via response.json(), which these tests mock."""
+    with patch("tour_guide.routing.osrm.orjson", None):
+        yield
+
+
 class TestOSRMClient:
     """Tests for OSRM client."""
 
@@ -56,7 +80,7 @@ class TestOSRMClient:
 
     def test_get_route_success(self, osrm_client, mock_osrm_response):
         """Test successful route retrieval."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_osrm_response
             mock_get.return_value.raise_for_status = Mock()
 
@@ -71,12 +95,16 @@ class TestOSRMClient:
             assert route.total_distance_km == 65.0
             assert route.total_duration_min == 75.0
             assert len(route.waypoints) == 3
+            assert (route.waypoints[0].lat, route.waypoints[0].lon) == origin
+            assert (route.waypoints[-1].lat, route.waypoints[-1].lon) == destination
             assert len(route.steps) == 2
+            assert [s.instruction for s in route.steps] == ["turn Highway 1", "Road 443"]
+            assert route.steps[1].distance_km == 35.0
             assert route.source == "osrm"
 
     def test_get_route_timeout(self, osrm_client):
         """Test timeout handling."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             import requests
 
             mock_get.side_effect = requests.Timeout()
@@ -91,7 +119,7 @@ class TestOSRMClient:
 
     def test_get_route_invalid_response(self, osrm_client):
         """Test handling of invalid OSRM response."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             # Missing required fields
             mock_get.return_value.json.return_value = {"code": "Ok", "routes": [{}]}
             mock_get.return_value.raise_for_status = Mock()
@@ -106,7 +134,7 @@ class TestOSRMClient:
 
     def test_get_route_osrm_error(self, osrm_client):
         """Test handling of OSRM error response."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = {
                 "code": "InvalidInput",
                 "message": "Invalid coordinates",
@@ -121,6 +149,72 @@ class TestOSRMClient:
 
             assert "OSRM returned error" in str(exc_info.value)
 
+    def test_get_route_decodes_with_orjson(self, osrm_client, mock_osrm_response):
+        """Test that raw response bytes are decoded with orjson when installed."""
+        orjson = pytest.importorskip("orjson")
+        from tour_guide.routing import osrm
+
+        with patch.object(osrm, "orjson", orjson), patch("requests.Session.get") as mock_get:
+            mock_get.return_value.content = orjson.dumps(mock_osrm_response)
+            mock_get.return_value.raise_for_status = Mock()
+
+            route = osrm_client.get_route((32.0853, 34.7818), (31.7683, 35.2137))
+
+            assert route.total_distance_km == 65.0
+            assert mock_get.return_value.json.call_count == 0
+
+    def test_session_retries_gateway_errors(self, osrm_client):
+        """Test that the shared session retries transient gateway errors."""
+        adapter = osrm_client._session.get_adapter("http://router.project-osrm.org")
+
+        assert adapter.max_retries.total == 2
+        assert set(adapter.max_retries.status_forcelist) == {502, 503, 504}
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context closes pooled connections."""
+        client = OSRMClient()
+        with patch.object(client._session, "close") as mock_close:
+            with client:
+                pass
+
+            assert mock_close.call_count == 1
+
+    def test_get_route_cache_hit_skips_request(self, osrm_client, mock_osrm_response):
+        """Test that a repeated origin/destination is served from cache."""
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = mock_osrm_response
+            mock_get.return_value.raise_for_status = Mock()
+
+            first = osrm_client.get_route((32.0853, 34.7818), (31.7683, 35.2137))
+            second = osrm_client.get_route((32.085301, 34.781801), (31.7683, 35.2137))
+
+            assert mock_get.call_count == 1
+            assert second is first
+
+    def test_get_route_cache_persists_across_clients(self, tmp_path, mock_osrm_response):
+        """Test that routes cached on disk are reused by a new client."""
+        origin, destination = (32.0853, 34.7818), (31.7683, 35.2137)
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = mock_osrm_response
+            mock_get.return_value.raise_for_status = Mock()
+            OSRMClient(cache_dir=tmp_path).get_route(origin, destination)
+
+        with patch("requests.Session.get") as mock_get:
+            route = OSRMClient(cache_dir=tmp_path).get_route(origin, destination)
+
+            assert mock_get.call_count == 0
+            assert route.total_distance_km == 65.0
+            assert len(route.waypoints) == 3
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = mock_osrm_response
+            mock_get.return_value.raise_for_status = Mock()
+            OSRMClient(base_url="http://other-osrm", cache_dir=tmp_path).get_route(
+                origin, destination
+            )
+
+            assert mock_get.call_count == 1
+
     def test_haversine_distance(self):
         """Test haversine distance calculation."""
         from tour_guide.routing.osrm import OSRMClient
@@ -129,6 +223,155 @@ class TestOSRMClient:
         distance = OSRMClient._haversine(32.0853, 34.7818, 31.7683, 35.2137)
         assert 50 < distance < 60  # Rough check
 
+    def test_cumulative_distances_match_pairwise_haversine(self):
+        """Test polyline distances against summed pairwise Haversine segments."""
+        from tour_guide.routing.osrm import OSRMClient, _cumulative_distances
+
+        coordinates = [[34.7818, 32.0853], [34.9, 32.0], [35.0, 31.9], [35.2137, 31.7683]]
+        expected = [0.0]
+        for (lon1, lat1), (lon2, lat2) in zip(coordinates, coordinates[1:]):
+            expected.append(expected[-1] + OSRMClient._haversine(lat1, lon1, lat2, lon2))
+
+        assert _cumulative_distances(coordinates) == pytest.approx(expected)
+        assert _cumulative_distances([]) == []
+        assert _cumulative_distances([[34.78, 32.08]]) == [0.0]
+
+    def test_cumulative_distances_short_segments_match_haversine(self):
+        """Test that the equirectangular short-segment path agrees with Haversine."""
+        from tour_guide.routing import osrm
+
+        # ~100 m steps, as in a dense OSRM polyline
+        coordinates = [[34.7818 + i * 0.001, 32.0853 - i * 0.0005] for i in range(500)]
+        expected = [0.0]
+        for (lon1, lat1), (lon2, lat2) in zip(coordinates, coordinates[1:]):
+            expected.append(expected[-1] + OSRMClient._haversine(lat1, lon1, lat2, lon2))
+
+        with patch.object(osrm, "np", None):
+            assert osrm._cumulative_distances(coordinates) == pytest.approx(expected, rel=1e-6)
+
+    def test_cumulative_distances_pure_python_matches_numpy(self):
+        """Test that the NumPy and pure-Python paths agree."""
+        pytest.importorskip("numpy")
+        from tour_guide.routing import osrm
+
+        coordinates = [[34.7818 + i * 0.01, 32.0853 - i * 0.005] for i in range(50)]
+        with patch.object(osrm, "_jit_polyline_kernel", return_value=None):
+            vectorized = osrm._cumulative_distances(coordinates)
+        with patch.object(osrm, "np", None):
+            fallback = osrm._cumulative_distances(coordinates)
+
+        assert vectorized == pytest.approx(fallback)
+
+    def test_cumulative_distances_numba_matches_pure_python(self):
+        """Test that the Numba kernel agrees with the pure-Python path."""
+        pytest.importorskip("numba")
+        from tour_guide.routing import osrm
+
+        coordinates = [[34.7818 + i * 0.01, 32.0853 - i * 0.005] for i in range(50)]
+        assert osrm._jit_polyline_kernel() is not None
+        compiled = osrm._cumulative_distances(coordinates)
+        with patch.object(osrm, "np", None):
+            fallback = osrm._cumulative_distances(coordinates)
+
+        assert compiled == pytest.approx(fallback)
+
+    def test_parse_response_uses_distance_annotations(self, osrm_client, mock_osrm_response):
+        """Test that waypoint distances come from OSRM annotations when present."""
+        mock_osrm_response["routes"][0]["legs"][0]["annotation"] = {"distance": [30000, 35000]}
+
+        route = osrm_client._parse_response(
+            mock_osrm_response, (32.0853, 34.7818), (31.7683, 35.2137)
+        )
+
+        assert [w.distance_from_start_km for w in route.waypoints] == [0.0, 30.0, 65.0]
+
+    def test_parse_response_mismatched_annotations_fall_back(
+        self, osrm_client, mock_osrm_response
+    ):
+        """Test that annotations not matching the geometry fall back to Haversine."""
+        mock_osrm_response["routes"][0]["legs"][0]["annotation"] = {"distance": [65000]}
+
+        route = osrm_client._parse_response(
+            mock_osrm_response, (32.0853, 34.7818), (31.7683, 35.2137)
+        )
+
+        distances = [w.distance_from_start_km for w in route.waypoints]
+        assert distances[0] == 0.0
+        assert distances[-1] == pytest.approx(
+            OSRMClient._haversine(32.0853, 34.7818, 32.0, 35.0)
+            + OSRMClient._haversine(32.0, 35.0, 31.7683, 35.2137)
+        )
+
+
+class TestRouteSimplify:
+    """Tests for Route.simplify()."""
+
+    @staticmethod
+    def make_route(points):
+        from tour_guide.routing.models import Waypoint
+
+        waypoints = [
+            Waypoint(lat=lat, lon=lon, distance_from_start_km=float(i))
+            for i, (lat, lon) in enumerate(points)
+        ]
+        return Route(
+            origin=points[0],
+            destination=points[-1],
+            total_distance_km=float(len(points) - 1),
+            total_duration_min=0.0,
+            waypoints=waypoints,
+            steps=[],
+            source="osrm",
+        )
+
+    def test_short_route_unchanged(self):
+        """Test that routes within the budget are returned as-is."""
+        route = self.make_route([(32.0, 34.8), (32.1, 34.9), (32.2, 35.0)])
+        assert route.simplify(max_points=30) is route.waypoints
+
+    def test_keeps_corner_and_endpoints(self):
+        """Test that a sharp turn survives simplification of an L-shaped route."""
+        # 50 points north, then 50 points east
+        north = [(32.0 + i * 0.01, 34.8) for i in range(50)]
+        east = [(32.49, 34.8 + i * 0.01) for i in range(1, 51)]
+        route = self.make_route(north + east)
+
+        simplified = route.simplify(max_points=3)
+
+        assert [(w.lat, w.lon) for w in simplified] == [(32.0, 34.8), (32.49, 34.8), east[-1]]
+
+    def test_returns_exactly_max_points_in_route_order(self):
+        """Test that output fills the budget and keeps original order and distances."""
+        route = self.make_route([(32.0 + i * 0.01, 34.8 + (i % 7) * 0.002) for i in range(200)])
+
+        simplified = route.simplify(max_points=30)
+
+        assert len(simplified) == 30
+        assert simplified[0] is route.waypoints[0]
+        assert simplified[-1] is route.waypoints[-1]
+        distances = [w.distance_from_start_km for w in simplified]
+        assert distances == sorted(distances)
+
+
+class TestRouteModels:
+    """Tests for route data models."""
+
+    def test_waypoint_and_step_are_slotted_and_frozen(self):
+        """Test that route points have no __dict__, are immutable and pickle cleanly."""
+        import dataclasses
+        import pickle
+        from tour_guide.routing.models import Waypoint, RouteStep
+
+        waypoint = Waypoint(lat=32.0853, lon=34.7818, distance_from_start_km=1.5)
+        step = RouteStep(instruction="turn Highway 1", distance_km=30.0, duration_min=20.0)
+
+        for obj in (waypoint, step):
+            assert not hasattr(obj, "__dict__")
+            assert pickle.loads(pickle.dumps(obj)) == obj
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            waypoint.lat = 0.0
+
 
 class TestClaudeCLI:
     """Tests for Claude CLI wrapper."""
@@ -142,7 +385,9 @@ class TestClaudeCLI:
             response = call_claude("Test prompt")
 
             assert response == "Test response"
-            mock_run.assert_called_once()
+            assert mock_run.call_count == 1
+            assert mock_run.call_args.kwargs["stdin"] is subprocess.DEVNULL
+            assert mock_run.call_args.args[0][-2:] == ["-p", "Test prompt"]
 
     def test_call_claude_timeout(self):
         """Test Claude CLI timeout."""
@@ -164,35 +409,38 @@ class TestClaudeCLI:
 
             assert "not found" in str(exc_info.value)
 
+    def test_call_claude_caches_successful_responses(self, monkeypatch):
+        """Test that a repeated prompt reuses the response and errors are not cached."""
+        from tour_guide.utils import claude_cli
+
+        monkeypatch.setattr(claude_cli, "CLAUDE_CACHE_ENABLED", True)
+        claude_cli._cached_call.cache_clear()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                subprocess.TimeoutExpired("claude", 30),
+                Mock(stdout="Cached response"),
+            ]
+
+            with pytest.raises(ClaudeError):
+                call_claude("Cache prompt")
+            assert call_claude("Cache prompt") == "Cached response"
+            assert call_claude("Cache prompt") == "Cached response"
+
+            assert mock_run.call_count == 2
+
+        claude_cli._cached_call.cache_clear()
+
 
 class TestClaudeFallbackRouter:
     """Tests for Claude fallback router."""
 
-    @pytest.fixture
-    def mock_claude_response(self):
-        """Mock Claude response with route data."""
-        return """```json
-{
-  "distance_km": 65.0,
-  "duration_minutes": 75.0,
-  "waypoints": [
-    {"lat": 32.0853, "lon": 34.7818, "distance_from_start_km": 0.0},
-    {"lat": 32.0, "lon": 35.0, "distance_from_start_km": 30.0},
-    {"lat": 31.7683, "lon": 35.2137, "distance_from_start_km": 65.0}
-  ],
-  "steps": [
-    {"instruction": "Head east on Highway 1", "distance_km": 30.0, "duration_min": 25.0},
-    {"instruction": "Continue on Road 443", "distance_km": 35.0, "duration_min": 50.0}
-  ]
-}
-```"""
-
-    def test_get_route_from_claude_success(self, mock_claude_response):
+    def test_get_route_from_claude_success(self):
         """Test successful Claude fallback routing."""
         with patch(
             "tour_guide.routing.fallback.call_claude"
         ) as mock_call:
-            mock_call.return_value = mock_claude_response
+            mock_call.return_value = MOCK_CLAUDE_ROUTE
 
             origin = (32.0853, 34.7818)
             destination = (31.7683, 35.2137)
@@ -210,6 +458,28 @@ class TestClaudeFallbackRouter:
             assert len(route.steps) == 2
             assert route.source == "claude"
 
+    @pytest.mark.parametrize(
+        "wrap",
+        [
+            "```\n{}\n```",
+            "{}",
+            "Here you go:\n```json {}```",
+            "Example:\n```\nnot the route\n```\nRoute:\n```json\n{}\n```",
+        ],
+    )
+    def test_get_route_from_claude_fence_variants(self, wrap):
+        """Test plain fences, bare JSON, leading prose, and a json fence after a plain one."""
+        body = (
+            '{"distance_km": 10.0, "duration_minutes": 12.0, '
+            '"waypoints": [{"lat": 32.0, "lon": 34.8}]}'
+        )
+        with patch("tour_guide.routing.fallback.call_claude", return_value=wrap.format(body)):
+            route = get_route_from_claude((32.0, 34.8), (32.1, 34.9))
+
+        assert route.total_distance_km == 10.0
+        assert route.waypoints[0].distance_from_start_km == 0.0
+        assert route.steps == []
+
     def test_get_route_from_claude_invalid_json(self):
         """Test handling of invalid JSON from Claude."""
         with patch(
@@ -270,6 +540,61 @@ class TestGeocoder:
 
         assert "Unknown location" in str(exc_info.value)
 
+    def test_geocode_caches_lookups(self):
+        """Test that repeated lookups are served from the cache."""
+        from tour_guide.routing.geocoder import geocode
+
+        geocode.cache_clear()
+        geocode("  Haifa ")
+        geocode("  Haifa ")
+
+        info = geocode.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert geocode("  Haifa ") == (32.7940, 34.9896)
+
+    def test_known_locations_read_only(self):
+        """Test that the known-location table cannot drift from the cache."""
+        from tour_guide.routing.geocoder import KNOWN_LOCATIONS
+
+        with pytest.raises(TypeError):
+            KNOWN_LOCATIONS["new city"] = (0.0, 0.0)
+
+
+class TestClaudeGeocodingResponse:
+    """Tests for parsing Claude geocoding responses."""
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            '{"lat": 31.7683, "lon": 35.2137, "confidence": "high"}',
+            '```json\n{"lat": 31.7683, "lon": 35.2137}\n```',
+            'Sure:\n```\n{"lat": "31.7683", "lon": "35.2137"}\n```',
+            'Wrapped in ``` fences:\n```json\n{"lat": 31.7683, "lon": 35.2137}\n```',
+        ],
+    )
+    def test_parse_valid_response(self, response):
+        """Test plain and fenced JSON responses."""
+        from tour_guide.utils.geocoding import _parse_geocoding_response
+
+        assert _parse_geocoding_response(response) == (31.7683, 35.2137)
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            '{"lat": 91.0, "lon": 35.0}',
+            '{"lat": 31.0, "lon": -180.5}',
+            '{"lat": NaN, "lon": 35.0}',
+            '{"lat": 31.0}',
+            "[31.0, 35.0]",
+            "not json",
+        ],
+    )
+    def test_parse_invalid_response(self, response):
+        """Test out-of-range, missing and malformed coordinates are rejected."""
+        from tour_guide.utils.geocoding import _parse_geocoding_response
+
+        assert _parse_geocoding_response(response) is None
+
 
 class TestRoutePlanner:
     """Tests for route planner."""
@@ -320,7 +645,7 @@ class TestRoutePlanner:
 
     def test_plan_route_with_coordinates(self, planner, mock_osrm_response):
         """Test planning route with coordinate tuples."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_osrm_response
             mock_get.return_value.raise_for_status = Mock()
 
@@ -336,7 +661,7 @@ class TestRoutePlanner:
 
     def test_plan_route_with_place_names(self, planner, mock_osrm_response):
         """Test planning route with place names."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_osrm_response
             mock_get.return_value.raise_for_status = Mock()
 
@@ -349,21 +674,7 @@ class TestRoutePlanner:
 
     def test_plan_route_osrm_fails_fallback_to_claude(self, planner):
         """Test that planner falls back to Claude when OSRM fails."""
-        claude_response = """```json
-{
-  "distance_km": 65.0,
-  "duration_minutes": 75.0,
-  "waypoints": [
-    {"lat": 32.0853, "lon": 34.7818, "distance_from_start_km": 0.0},
-    {"lat": 31.7683, "lon": 35.2137, "distance_from_start_km": 65.0}
-  ],
-  "steps": [
-    {"instruction": "Head east on Highway 1", "distance_km": 65.0, "duration_min": 75.0}
-  ]
-}
-```"""
-
-        with patch("requests.get") as mock_get, patch(
+        with patch("requests.Session.get") as mock_get, patch(
             "tour_guide.routing.fallback.call_claude"
         ) as mock_claude:
             # OSRM fails
@@ -372,7 +683,7 @@ class TestRoutePlanner:
             mock_get.side_effect = requests.Timeout()
 
             # Claude succeeds
-            mock_claude.return_value = claude_response
+            mock_claude.return_value = MOCK_CLAUDE_ROUTE
 
             origin = (32.0853, 34.7818)
             destination = (31.7683, 35.2137)
@@ -387,7 +698,7 @@ class TestRoutePlanner:
         """Test that planner raises RoutingError when both OSRM and Claude fail."""
         from tour_guide.routing.planner import RoutingError
 
-        with patch("requests.get") as mock_get, patch(
+        with patch("requests.Session.get") as mock_get, patch(
             "tour_guide.routing.fallback.call_claude"
         ) as mock_claude:
             # OSRM fails
@@ -413,7 +724,7 @@ class TestRoutePlanner:
         # Disable fallback
         planner.config.fallback_to_claude = False
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             # OSRM fails
             import requests
 
@@ -426,3 +737,48 @@ class TestRoutePlanner:
                 planner.plan_route(origin, destination)
 
             assert "Claude fallback disabled" in str(exc_info.value)
+
+    def test_plan_routes_preserves_order(self, planner, mock_osrm_response):
+        """Test batch planning returns one route per pair, in input order."""
+        from tour_guide.routing.geocoder import geocode
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = mock_osrm_response
+            mock_get.return_value.raise_for_status = Mock()
+
+            pairs = [("Tel Aviv", "Jerusalem"), ("Haifa", "Akko"), ((32.0, 34.8), "Eilat")]
+            routes = planner.plan_routes(pairs)
+
+            assert [r.destination for r in routes] == [
+                geocode("Jerusalem"),
+                geocode("Akko"),
+                geocode("Eilat"),
+            ]
+            assert routes[2].origin == (32.0, 34.8)
+            assert mock_get.call_count == 3
+
+    def test_plan_route_from_waypoint(self, planner, mock_osrm_response):
+        """Test that a Waypoint from another route is accepted as a location."""
+        from tour_guide.routing.models import Waypoint
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = mock_osrm_response
+            mock_get.return_value.raise_for_status = Mock()
+
+            start = Waypoint(lat=32.0853, lon=34.7818, distance_from_start_km=12.0)
+            route = planner.plan_route(start, "Jerusalem")
+
+            assert route.origin == (32.0853, 34.7818)
+            assert route.destination == (31.7683, 35.2137)
+
+    def test_plan_routes_unknown_location_fails_before_requests(self, planner):
+        """Test that geocoding errors surface before any OSRM request is sent."""
+        with patch("requests.Session.get") as mock_get:
+            with pytest.raises(ValueError):
+                planner.plan_routes([("Tel Aviv", "Jerusalem"), ("Tel Aviv", "Atlantis")])
+
+            assert mock_get.call_count == 0
+
+    def test_plan_routes_empty(self, planner):
+        """Test that an empty batch returns no routes."""
+        assert planner.plan_routes([]) == []